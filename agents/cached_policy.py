@@ -0,0 +1,188 @@
+"""
+Memoized and compiled policies.
+
+Deterministic agents (Heuristic, Minimax, greedy Q-Learning) are pure
+functions of the board and the side they play, yet recompute their move
+on every turn of every game. CachedPolicy wraps any agent and remembers
+its answers; compile_policy fills the cache for every reachable 3x3
+position up front, after which each move is a single dict lookup.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from game.board import TicTacToe
+from game.encoding import (NUM_STATES, decode_state, encode_board, encode_boards,
+                           reachable_positions)
+
+
+class CachedPolicy:
+    """
+    Wraps an agent and memoizes get_move by (board, player).
+
+    With maxsize set the cache is a bounded LRU; otherwise it grows
+    without limit (3x3 has only 4,520 positions per side). Agents that
+    break ties randomly, like greedy Q-Learning, become deterministic:
+    the first answer for a position is reused.
+    """
+
+    def __init__(self, agent, maxsize=None):
+        self.agent = agent
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.compiled = False  # Cache covers every position (compile_policy)
+        self._fingerprint = None  # (cache size, digest)
+        self._table = None  # (cache size, to_array() table) for get_moves
+        self._player = agent.player if agent is not None else 1
+
+    @property
+    def player(self):
+        return self._player
+
+    @player.setter
+    def player(self, value):
+        # Matchup sets .player before every game; keep the wrapped agent in sync
+        self._player = value
+        if self.agent is not None:
+            self.agent.player = value
+
+    @property
+    def deterministic(self):
+        """A complete table, or a deterministic agent, always answers alike."""
+        return self.compiled or getattr(self.agent, 'deterministic', False)
+
+    @property
+    def random_choices(self):
+        # Only misses can be random, and the wrapped agent counts those
+        return getattr(self.agent, 'random_choices', 0 if self.agent is None else None)
+
+    def fingerprint(self):
+        """Identity of the policy: the wrapped agent's, or the table's digest."""
+        if not self.compiled and self.agent is not None:
+            inner = getattr(self.agent, 'fingerprint', None)
+            return inner() if inner else None
+        if self._fingerprint is None or self._fingerprint[0] != len(self.cache):
+            digest = hashlib.sha1(self.to_array().tobytes()).hexdigest()
+            self._fingerprint = (len(self.cache), f"CachedPolicy:{digest}")
+        return self._fingerprint[1]
+
+    def get_move(self, game):
+        key = (tuple(game.board), self._player)
+        move = self.cache.get(key)
+
+        if move is not None:
+            self.hits += 1
+            if self.maxsize is not None:
+                self.cache.move_to_end(key)
+            return move
+
+        self.misses += 1
+        if self.agent is None:
+            raise KeyError(f"Position {key[0]} is not in the compiled table")
+        move = self.agent.get_move(game)
+        self.cache[key] = move
+        if self.maxsize is not None and len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)  # Evict least recently used
+        return move
+
+    def get_moves(self, boards):
+        """
+        Batched get_move for 3x3 boards: one array lookup per board, and
+        a get_move call for each position the cache is missing.
+
+        Args:
+            boards (np.ndarray): (n, 9) boards where this agent moves
+        Returns:
+            np.ndarray: (n,) chosen positions
+        """
+        if self._table is None or self._table[0] != len(self.cache):
+            self._table = (len(self.cache), self.to_array())
+        row = self._table[1][0 if self._player == 1 else 1]
+        state_ids = encode_boards(boards)
+        moves = row[state_ids].astype(np.int64)
+
+        missing = np.flatnonzero(moves < 0)
+        self.hits += len(moves) - len(missing)
+        for index in missing:
+            game = TicTacToe()
+            game.board = boards[index].tolist()
+            game.current_player = self._player
+            moves[index] = self.get_move(game)  # Counts its own hit or miss
+            row[state_ids[index]] = moves[index]
+        if len(missing):
+            self._table = (len(self.cache), self._table[1])
+        return moves
+
+    def stats(self):
+        """Cache hit-rate statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.cache),
+        }
+
+    def counters(self):
+        """Cumulative counters (see tournament/metrics.py), the agent's included."""
+        inner = getattr(self.agent, 'counters', None)
+        counters = dict(inner()) if inner else {}
+        counters['cache_hits'] = self.hits
+        counters['cache_misses'] = self.misses
+        return counters
+
+    def to_array(self):
+        """
+        Export cached 3x3 moves as a compact table.
+
+        Returns:
+            np.ndarray: (2, NUM_STATES) int8, row 0 for X and row 1 for O,
+                        indexed by state ID; -1 where no move is cached
+        """
+        table = np.full((2, NUM_STATES), -1, dtype=np.int8)
+        for (board, player), move in self.cache.items():
+            table[0 if player == 1 else 1, encode_board(board)] = move
+        return table
+
+    @classmethod
+    def from_array(cls, table, agent=None):
+        """
+        Rebuild a policy from to_array() output.
+
+        Without an agent, positions missing from the table raise KeyError.
+        """
+        policy = cls(agent)
+        for row, player in ((0, 1), (1, -1)):
+            for state_id in np.flatnonzero(table[row] >= 0):
+                board = decode_state(int(state_id))
+                policy.cache[(board, player)] = int(table[row, state_id])
+        policy.compiled = agent is None
+        return policy
+
+
+def compile_policy(agent, players=(1, -1)):
+    """
+    Precompute an agent's move for every reachable 3x3 position.
+
+    Args:
+        agent: Any agent with player and get_move(game)
+        players (tuple): Sides to compile (positions where that side moves)
+
+    Returns:
+        CachedPolicy: Wrapper whose cache already covers every position
+    """
+    policy = CachedPolicy(agent)
+    original_player = agent.player
+
+    for game in reachable_positions():
+        if game.current_player in players:
+            agent.player = game.current_player
+            policy.cache[(tuple(game.board), game.current_player)] = agent.get_move(game)
+
+    agent.player = original_player
+    policy.compiled = True
+    return policy
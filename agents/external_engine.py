@@ -0,0 +1,363 @@
+"""
+Agents that run in another process and talk a line-based protocol.
+
+An engine is any program that reads commands on stdin and answers on
+stdout, one line each, so it can be written in any language, sandboxed,
+or kept out of this process's imports. Every command gets exactly one
+reply line; `go` may be preceded by `info` lines.
+
+    hello                     -> hello <version> <name> [deterministic]
+    isready                   -> readyok
+    newgame [size [k]]        -> ok      (forget the last game)
+    seed <int>                -> ok      (reseed a stochastic engine)
+    position startpos [moves <cell> ...]
+                              -> ok      (the game so far, from the start)
+    go movetime <ms>          -> [info <counter>=<int> ...]
+                                 bestmove <cell>
+    quit                      (exit, no reply)
+
+<name> is a single token identifying the engine's behavior (used as the
+agent's fingerprint); `deterministic` says its move depends only on the
+position. Failures reply `error <message>`. info counters use the names
+in tournament/metrics.py and count that move's effort only.
+
+Starting an interpreter per move would cost far more than a 3x3 search,
+so engine processes are long-lived and shared through an EnginePool:
+agents lease a process per game, the pool health-checks processes before
+handing them out and replaces any that died or hung. agents/
+reference_engine.py serves the built-in agents over this protocol.
+"""
+
+import asyncio
+import atexit
+import os
+import select
+import subprocess
+import threading
+import time
+
+import numpy as np
+
+PROTOCOL_VERSION = 1
+
+
+class EngineError(RuntimeError):
+    """The engine exited, broke the protocol or replied with an error."""
+
+
+class EngineProcess:
+    """One running engine and the pipes to it."""
+
+    def __init__(self, command, timeout=10.0):
+        """
+        Start the engine and wait for its hello.
+
+        Args:
+            command (list): Program and arguments
+            timeout (float): Seconds allowed for startup
+        """
+        self.command = list(command)
+        self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE)
+        self._buffer = b""
+        try:
+            reply = self.request("hello", timeout)
+        except (EngineError, TimeoutError):
+            self.kill()
+            raise
+        tokens = reply.split()
+        if len(tokens) < 3 or tokens[0] != "hello" or tokens[1] != str(PROTOCOL_VERSION):
+            self.kill()
+            raise EngineError(f"Unexpected handshake from {self.command}: {reply!r}")
+        self.name = tokens[2]
+        self.deterministic = "deterministic" in tokens[3:]
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def send(self, line):
+        try:
+            self.process.stdin.write(line.encode() + b"\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as error:
+            raise EngineError(f"Engine {self.command} is gone") from error
+
+    def readline(self, timeout=None):
+        """Next line from the engine (TimeoutError if none arrives in time)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        stdout = self.process.stdout
+        while b"\n" not in self._buffer:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            ready, _, _ = select.select([stdout], [], [], remaining)
+            if not ready:
+                raise TimeoutError(f"Engine {self.command} did not answer in {timeout}s")
+            data = os.read(stdout.fileno(), 65536)
+            if not data:
+                raise EngineError(f"Engine {self.command} exited")
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line.decode().strip()
+
+    def request(self, line, timeout=None, info=None):
+        """
+        Send a command and return its reply.
+
+        Args:
+            info (list): Collects the info lines before the reply
+        """
+        self.send(line)
+        while True:
+            reply = self.readline(timeout)
+            if reply.startswith("info"):
+                if info is not None:
+                    info.append(reply)
+            elif reply.startswith("error"):
+                raise EngineError(f"Engine {self.command}: {reply[6:]}")
+            else:
+                return reply
+
+    def ping(self, timeout=1.0):
+        """Health check: the engine is running and answers isready."""
+        if not self.alive():
+            return False
+        try:
+            return self.request("isready", timeout) == "readyok"
+        except (EngineError, TimeoutError):
+            return False
+
+    def kill(self):
+        if self.alive():
+            self.process.kill()
+        self.process.wait()
+        for pipe in (self.process.stdin, self.process.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    def close(self, timeout=1.0):
+        """Ask the engine to quit, killing it if it doesn't."""
+        try:
+            self.send("quit")
+            self.process.wait(timeout)
+        except (EngineError, subprocess.TimeoutExpired):
+            pass
+        self.kill()
+
+
+class EnginePool:
+    """
+    Reusable processes of one engine command (thread-safe).
+
+    Idle processes are pinged before being handed out; dead or hung ones
+    are killed and replaced.
+    """
+
+    def __init__(self, command, max_idle=16, startup_timeout=10.0, health_timeout=1.0):
+        self.command = list(command)
+        self.max_idle = max_idle
+        self.startup_timeout = startup_timeout
+        self.health_timeout = health_timeout
+        self.idle = []
+        self.lock = threading.Lock()
+        self.started = 0
+        self.restarts = 0
+        self.name = None
+        self.deterministic = False
+
+    def _start(self):
+        process = EngineProcess(self.command, self.startup_timeout)
+        with self.lock:
+            self.started += 1
+            self.name = process.name
+            self.deterministic = process.deterministic
+        return process
+
+    def acquire(self):
+        """A healthy process, idle or newly started."""
+        while True:
+            with self.lock:
+                process = self.idle.pop() if self.idle else None
+            if process is None:
+                return self._start()
+            if process.ping(self.health_timeout):
+                return process
+            process.kill()
+            with self.lock:
+                self.restarts += 1
+
+    def release(self, process):
+        """Return a process for reuse (closed if the pool is full)."""
+        with self.lock:
+            if process.alive() and len(self.idle) < self.max_idle:
+                self.idle.append(process)
+                return
+        process.close()
+
+    def restart(self, process):
+        """Replace a crashed or hung process."""
+        process.kill()
+        with self.lock:
+            self.restarts += 1
+        return self._start()
+
+    def describe(self):
+        """(name, deterministic) from the engine's handshake."""
+        if self.name is None:
+            self.release(self.acquire())
+        return self.name, self.deterministic
+
+    def close(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for process in idle:
+            process.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_POOLS = {}  # Process-wide pools by (process ID, command)
+
+
+def engine_pool(command):
+    """
+    The shared pool for a command in this process, created on first use
+    (forked workers start their own instead of sharing the parent's pipes).
+    """
+    key = (os.getpid(), tuple(command))
+    if key not in _POOLS:
+        _POOLS[key] = EnginePool(command)
+    return _POOLS[key]
+
+
+@atexit.register
+def _close_pools():
+    for (pid, _), pool in _POOLS.items():
+        if pid == os.getpid():
+            pool.close()
+
+
+class ExternalEngineAgent:
+    """
+    Agent whose moves come from an engine process.
+
+    Each game leases a process from the pool (sending newgame and the
+    seed, if any); every move sends the whole game so far, so an engine
+    that crashes mid-game is restarted and asked again.
+    """
+
+    def __init__(self, command, player=1, movetime=1000, pool=None, grace=1.0,
+                 retries=1, asynchronous=False):
+        """
+        Args:
+            command (list): Engine program and arguments
+            movetime (int): Milliseconds the engine may think per move
+            pool (EnginePool): Defaults to the process-wide pool for command
+            grace (float): Extra seconds to wait for a reply beyond movetime
+            retries (int): Restarts per move before giving up
+            asynchronous (bool): get_move returns a coroutine that waits
+                for the engine on a thread (for tournament/async_runner.py)
+        """
+        self.player = player
+        self.movetime = movetime
+        self.pool = pool or engine_pool(command)
+        self.grace = grace
+        self.retries = retries
+        self.asynchronous = asynchronous
+        self.seed = None
+        self.restarts = 0
+        self._counters = {}
+        self._process = None  # Leased for the current game
+        self._game = None
+        self._busy = False  # A move is in flight on a thread
+
+    @property
+    def deterministic(self):
+        return self.pool.describe()[1]
+
+    def fingerprint(self):
+        """Identity of the engine's behavior, from its handshake name."""
+        return f"ExternalEngine:{self.pool.describe()[0]}"
+
+    def reseed(self, rng):
+        """Seed sent to the engine at the start of the next game."""
+        if isinstance(rng, np.random.SeedSequence):
+            rng = int.from_bytes(rng.generate_state(4).tobytes(), 'little')
+        self.seed = rng if isinstance(rng, int) else None
+        self._game = None
+
+    def counters(self):
+        """Engine effort summed from its info lines (see tournament/metrics.py)."""
+        return dict(self._counters)
+
+    def get_move(self, game):
+        if self.asynchronous:
+            return asyncio.to_thread(self._move, game)
+        return self._move(game)
+
+    def _start_game(self, game):
+        if self._process is not None:
+            self.pool.release(self._process)
+        self._process = self.pool.acquire()
+        self._game = game
+
+    def _setup(self, game):
+        """Tell a freshly leased process about the game."""
+        size, win_length = game.size, game.win_length
+        self._process.request(f"newgame {size} {win_length}", self.grace)
+        if self.seed is not None:
+            self._process.request(f"seed {self.seed}", self.grace)
+
+    def _move(self, game):
+        self._busy = True
+        try:
+            fresh = game is not self._game
+            if fresh:
+                self._start_game(game)
+            position = "position startpos"
+            if game.moves:
+                position += " moves " + " ".join(map(str, game.moves))
+
+            for attempt in range(self.retries + 1):
+                try:
+                    if fresh:
+                        self._setup(game)
+                    self._process.request(position, self.grace)
+                    info = []
+                    reply = self._process.request(f"go movetime {self.movetime}",
+                                                  self.movetime / 1000 + self.grace, info)
+                    break
+                except (EngineError, TimeoutError):
+                    if attempt == self.retries:
+                        self._process.kill()
+                        self._process = None
+                        self._game = None
+                        raise
+                    self._process = self.pool.restart(self._process)
+                    self.restarts += 1
+                    fresh = True
+
+            tokens = reply.split()
+            if len(tokens) != 2 or tokens[0] != "bestmove":
+                raise EngineError(f"Expected bestmove, got {reply!r}")
+            for line in info:
+                for item in line.split()[1:]:
+                    name, _, value = item.partition("=")
+                    self._counters[name] = self._counters.get(name, 0) + int(value)
+            return int(tokens[1])
+        finally:
+            self._busy = False
+
+    def close(self):
+        """Give the leased process back (killing it if a move is still running)."""
+        if self._process is not None:
+            if self._busy:
+                self._process.kill()
+            else:
+                self.pool.release(self._process)
+            self._process = None
+            self._game = None
@@ -1,18 +1,67 @@
+import numpy as np
+
+from game.batch import WINNING_LINES
+from game.board import winning_lines
+
+_GEOMETRY_CACHE = {}
+
+
+def board_geometry(size, win_length):
+    """
+    Precomputed lookups for a board shape.
+
+    Returns:
+        tuple: (cell_lines, line_sums, priority) where cell_lines[cell]
+               lists the indices of every line through that cell, line_sums
+               holds each line's sum of cell indices and priority is the
+               order free cells are taken in: center, corners, edges on
+               3x3; on other boards, closest to the center first, then
+               most winning lines through the cell
+    """
+    key = (size, win_length)
+    if key not in _GEOMETRY_CACHE:
+        lines = winning_lines(size, win_length)
+        cell_lines = [[] for _ in range(size * size)]
+        for index, line in enumerate(lines):
+            for cell in line:
+                cell_lines[cell].append(index)
+
+        if size == 3:
+            priority = [4, 0, 2, 6, 8, 1, 3, 5, 7]
+        else:
+            # Corners and edges only matter on 3x3; on larger boards they
+            # sit on the fewest lines and the furthest from any fight
+            middle = (size - 1) / 2
+            priority = sorted(range(size * size), key=lambda cell: (
+                (cell // size - middle) ** 2 + (cell % size - middle) ** 2,
+                -len(cell_lines[cell]), cell))
+
+        line_sums = [sum(line) for line in lines]
+        _GEOMETRY_CACHE[key] = (cell_lines, line_sums, priority)
+    return _GEOMETRY_CACHE[key]
+
+
 class HeuristicAgent:
     """
     An agent that uses strategic rules (heuristics) to play.
-    
+
     This encodes human knowledge about good tic-tac-toe strategy.
     It's much stronger than Random, but not perfect like Minimax.
+
+    Works on any board size: per-line mark counts are kept up to date from
+    game.moves, so winning and blocking moves come from a threat index
+    instead of a scan over every line (thousands on a 15x15 board).
     """
 
+    deterministic = True  # Same board, same move
+
     def __init__(self, player):
         """
         Initialize the agent.
-        
+
         Args:
             player (int): 1 for X, -1 for O
-            
+
         Why we need player:
         - To know which side the agent is playing
         - Helps in evaluating board states
@@ -25,59 +74,146 @@ class HeuristicAgent:
             [0, 4, 8], [2, 4, 6]              # diagonals
         ]
 
-    def find_winning_move(self, board, player):
-        for line in self.winning_lines:
-            values = [board[line[0]], board[line[1]], board[line[2]]]
+        # Incremental state for the game being tracked
+        self._board = None    # The tracked game's board list
+        self._synced = 0      # How many of game.moves are applied
+        self._counts = {}     # player -> marks per line
+        self._empty_sum = []  # Sum of empty cell indices per line
+        self._threats = {}    # player -> lines one mark from completion
+        self._next = 0        # First priority cell not yet known to be taken
+
+    def fingerprint(self):
+        """Identity of this agent's behavior (for result caching)."""
+        return "HeuristicAgent"
+
+    def find_winning_move(self, board, player, lines=None):
+        """
+        Full scan for a move that completes a line (reference version).
+
+        Args:
+            lines (list): Winning lines to check (default: 3x3)
+        """
+        for line in lines or self.winning_lines:
+            values = [board[pos] for pos in line]
             player_count = values.count(player)
             empty_count = values.count(0)
 
-            if player_count == 2 and empty_count == 1:
+            if player_count == len(line) - 1 and empty_count == 1:
                 for pos in line:
                     if board[pos] == 0:
                         return pos
-                    
+
         return None
-    
+
+    def _rebuild(self, game):
+        """Recount from the board (new game or unknown history)."""
+        self._cell_lines, line_sums, self._priority = board_geometry(game.size, game.win_length)
+        self._need = game.win_length - 1
+        self._board = game.board
+        self._synced = len(getattr(game, 'moves', ()))
+        self._next = 0
+
+        self._counts = {1: [0] * len(line_sums), -1: [0] * len(line_sums)}
+        self._empty_sum = list(line_sums)
+        self._threats = {1: set(), -1: set()}
+        for cell, mark in enumerate(game.board):
+            if mark != 0:
+                self._apply(cell, mark)
+
+    def _update_threats(self, index):
+        for player in (1, -1):
+            if (self._counts[player][index] == self._need
+                    and self._counts[-player][index] == 0):
+                self._threats[player].add(index)
+            else:
+                self._threats[player].discard(index)
+
+    def _apply(self, cell, player):
+        """Account for one new mark."""
+        counts = self._counts[player]
+        for index in self._cell_lines[cell]:
+            counts[index] += 1
+            self._empty_sum[index] -= cell
+            self._update_threats(index)
+
+    def _sync(self, game):
+        """Bring the line counts up to date with game."""
+        moves = getattr(game, 'moves', None)
+        if moves is None or game.board is not self._board or len(moves) < self._synced:
+            self._rebuild(game)
+            return
+
+        board = game.board
+        for cell in moves[self._synced:]:
+            self._apply(cell, board[cell])
+        self._synced = len(moves)
+
+    def _completing_move(self, player):
+        """Empty cell of the first line (in line order) player can complete."""
+        threats = self._threats[player]
+        if not threats:
+            return None
+        # Exactly one cell is empty in a threat line, so the sum is its index
+        return self._empty_sum[min(threats)]
+
     def get_move(self, game):
         """
         Decide on the next move using heuristics.
-        
+
         Args:
             game (TicTacToe): Current game state
-            
+
         Returns:
-            int: Chosen board position (0-8)
-            
+            int: Chosen board position (0-8 on the classic board)
+
          Strategy Priority (check in order):
             1. Win if possible
             2. Block opponent's winning move
             3. Take center if available
-            4. Take a corner if available
-            5. Take any remaining position
+            4. Take a corner if available (3x3)
+            5. Take an edge if available (3x3)
+            On larger boards, 3-5 become: take the free cell closest to
+            the center, preferring cells on more winning lines
         """
 
-        board = game.board
-        
-        winning_move = self.find_winning_move(board, self.player)
+        self._sync(game)
+
+        winning_move = self._completing_move(self.player)
         if winning_move is not None:
             return winning_move
-        
+
         opponent = -self.player
-        blocking_move = self.find_winning_move(board, opponent)
+        blocking_move = self._completing_move(opponent)
         if blocking_move is not None:
             return blocking_move
-        
-        if board[4] == 0:
-            return 4
-        
-        corners = [0, 2, 6, 8]
-        for corner in corners:
-            if board[corner] == 0:
-                return corner
-            
-        edges = [1, 3, 5, 7]
-        for edge in edges:
-            if board[edge] == 0:
-                return edge
-            
-        return game.get_legal_moves()[0]
\ No newline at end of file
+
+        # Cells never empty again within a game, so the scan position only
+        # moves forward
+        board = game.board
+        priority = self._priority
+        while board[priority[self._next]] != 0:
+            self._next += 1
+        return priority[self._next]
+
+    def get_moves(self, boards):
+        """
+        Batched get_move for 3x3 boards: the same rules, applied to every
+        board at once.
+
+        Args:
+            boards (np.ndarray): (n, 9) boards where this agent moves
+        Returns:
+            np.ndarray: (n,) chosen positions
+        """
+        priority = np.array(board_geometry(3, 3)[2])
+        moves = priority[(boards[:, priority] == 0).argmax(axis=1)]
+
+        # Blocking overrides the priority cells, and winning overrides both
+        line_sums = boards[:, WINNING_LINES].sum(axis=2)
+        for player in (-self.player, self.player):
+            threats = line_sums == 2 * player  # Two marks and an empty cell
+            rows = np.flatnonzero(threats.any(axis=1))
+            lines = WINNING_LINES[threats[rows].argmax(axis=1)]
+            empty = boards[rows[:, None], lines] == 0
+            moves[rows] = lines[np.arange(len(rows)), empty.argmax(axis=1)]
+        return moves
@@ -0,0 +1,161 @@
+import numpy as np
+
+from game.rng import make_rng
+
+
+class LinearQAgent:
+    """
+    Q-Learning with a linear value function instead of a table.
+
+    QLearningAgent needs one entry per board state, which is fine for 3x3
+    but impossible for 4x4 or larger k-in-a-row boards. This agent scores
+    the position *after* each candidate move (the "afterstate") with a
+    linear model over line-count features:
+
+    - For k = 1..win_length: how many lines hold k of our marks and none
+      of the opponent's (open lines we could still complete)
+    - For k = 1..win_length-1: the same for the opponent
+    - A bias term
+
+    The feature vector has 2 * win_length entries whatever the board
+    size, so memory stays constant as the board grows. All legal moves are
+    scored together with one matrix product.
+
+    Has the same get_move / learn / save / load interface as
+    QLearningAgent.
+    """
+
+    def __init__(self, player, learning_rate=0.05, discount_factor=0.9, epsilon=0.1,
+                 win_length=3, rng=None):
+        """
+        Args:
+            win_length (int): Marks in a row needed to win; fixes the
+                feature size, so a saved model matches one game type
+            rng: Seed, random.Random or None for the global random module
+        """
+        self.player = player
+        self.learning_rate = learning_rate
+        self.discount_factor = discount_factor
+        self.epsilon = epsilon
+        self.win_length = win_length
+
+        self.weights = np.zeros(2 * win_length)
+        self.history = []  # Feature vectors of our afterstates this game
+        self._lines = {}   # (size, win_length) -> line index array
+        self.reseed(rng)
+
+    def reseed(self, rng):
+        """Switch to a new random stream for exploration and tie-breaks."""
+        self.rng = make_rng(rng)
+
+    def _line_array(self, game):
+        key = (game.size, game.win_length)
+        if key not in self._lines:
+            if game.win_length != self.win_length:
+                raise ValueError(f"Model built for {self.win_length} in a row, "
+                                 f"game needs {game.win_length}")
+            self._lines[key] = np.array(game.winning_lines)
+        return self._lines[key]
+
+    def features(self, boards, lines):
+        """
+        Line-count features for a batch of boards in our perspective.
+
+        Args:
+            boards (np.ndarray): (n, cells) with our marks as +1
+            lines (np.ndarray): (num_lines, win_length) cell indices
+
+        Returns:
+            np.ndarray: (n, 2 * win_length) feature matrix
+        """
+        cells = boards[:, lines]                       # (n, lines, k)
+        ours = (cells == 1).sum(axis=2)
+        theirs = (cells == -1).sum(axis=2)
+
+        open_ours = np.where(theirs == 0, ours, 0)
+        open_theirs = np.where(ours == 0, theirs, 0)
+
+        counts = np.arange(1, self.win_length + 1)
+        our_features = (open_ours[:, :, None] == counts).sum(axis=1)
+        their_features = (open_theirs[:, :, None] == counts[:-1]).sum(axis=1)
+        bias = np.ones((len(boards), 1))
+        return np.hstack([our_features, their_features, bias]).astype(np.float64)
+
+    def score_moves(self, game, legal_moves):
+        """
+        Evaluate every legal move in one batch.
+
+        Returns:
+            tuple: (values, features) for the afterstate of each move
+        """
+        board = np.array(game.board, dtype=np.int8) * self.player
+        afterstates = np.repeat(board[None, :], len(legal_moves), axis=0)
+        afterstates[np.arange(len(legal_moves)), legal_moves] = 1
+
+        features = self.features(afterstates, self._line_array(game))
+        return features @ self.weights, features
+
+    def get_move(self, game, training=False):
+        """
+        Choose a move using epsilon-greedy strategy over afterstate values.
+        """
+        legal_moves = game.get_legal_moves()
+        values, features = self.score_moves(game, legal_moves)
+
+        if training and self.rng.random() < self.epsilon:
+            index = self.rng.randrange(len(legal_moves))
+        else:
+            best = np.flatnonzero(values == values.max())
+            index = self.rng.choice(best.tolist())
+
+        if training:
+            self.history.append(features[index])
+
+        return legal_moves[index]
+
+    def learn(self, reward):
+        """
+        TD update of the weights from this game's afterstates.
+
+        Targets follow QLearningAgent.learn: the last afterstate gets the
+        final reward, each earlier one the discounted value of the next.
+        The whole game is one SGD step, normalized by feature magnitude so
+        the step size does not depend on board size.
+        """
+        if not self.history:
+            return
+
+        features = np.array(self.history)
+        values = features @ self.weights
+
+        targets = np.empty(len(features))
+        targets[-1] = reward
+        targets[:-1] = self.discount_factor * values[1:]
+
+        errors = targets - values
+        norms = (features ** 2).sum(axis=1)
+        self.weights += self.learning_rate * (errors / norms) @ features
+
+        self.history = []
+
+    def reset_history(self):
+        """Clear the afterstates recorded for learning."""
+        self.history = []
+
+    def save(self, filename):
+        """Save the model weights (NumPy .npz, no pickle)."""
+        with open(filename, 'wb') as f:
+            np.savez(f, weights=self.weights, win_length=self.win_length)
+        print(f"Model saved to {filename}")
+
+    def load(self, filename):
+        """Load model weights saved with save()."""
+        with np.load(filename, allow_pickle=False) as data:
+            self.weights = data['weights']
+            self.win_length = int(data['win_length'])
+        self._lines = {}
+        print(f"Model loaded from {filename}")
+
+    # Same names as QLearningAgent, so trainers and tournaments can swap agents
+    save_q_table = save
+    load_q_table = load
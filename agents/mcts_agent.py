@@ -1,6 +1,7 @@
-import random
 import math
 
+from game.rng import make_rng
+
 class MCTSNode:
     """A node in the MCTS search tree."""
     
@@ -46,17 +47,20 @@ class MCTSNode:
         self.children.append(child_node)
         return child_node
     
-    def simulate(self):
+    def simulate(self, rng):
         """
         Simulate random game.
         Returns 1 if CURRENT player wins, 0 for draw, -1 if current player loses.
+
+        Args:
+            rng: Source of the random playout moves (random.Random API)
         """
         simulation_game = self.game.copy()
         current_player = simulation_game.current_player
         
         while not simulation_game.is_game_over():
             legal_moves = simulation_game.get_legal_moves()
-            move = random.choice(legal_moves)
+            move = rng.choice(legal_moves)
             simulation_game.make_move(move)
         
         winner = simulation_game.check_winner()
@@ -90,9 +94,29 @@ class MCTSNode:
 class MCTSAgent:
     """Agent that uses Monte Carlo Tree Search."""
     
-    def __init__(self, player, num_simulations=1000):
+    def __init__(self, player, num_simulations=1000, rng=None):
+        """
+        Args:
+            rng: Seed, random.Random or None for the global random module
+        """
         self.player = player
         self.num_simulations = num_simulations
+        self.reseed(rng)
+
+        self.rollouts = 0        # Random playouts simulated
+        self.nodes_expanded = 0  # Tree nodes created
+
+    def reseed(self, rng):
+        """Switch to a new random stream for playouts."""
+        self.rng = make_rng(rng)
+
+    def fingerprint(self):
+        """Identity of this agent's behavior; games also depend on the seed."""
+        return f"MCTSAgent:simulations={self.num_simulations}"
+
+    def counters(self):
+        """Cumulative search effort (see tournament/metrics.py)."""
+        return {'nodes': self.nodes_expanded, 'rollouts': self.rollouts}
     
     def get_move(self, game):
         legal_moves = game.get_legal_moves()
@@ -115,15 +139,18 @@ class MCTSAgent:
             # Expansion
             if not node.is_terminal() and not node.is_fully_expanded():
                 node = node.expand()
+                self.nodes_expanded += 1
             
             # Simulation
-            result = node.simulate()
+            result = node.simulate(self.rng)
             
             # Backpropagation
             node.backpropagate(result)
+
+        self.rollouts += self.num_simulations
         
         if not root.children:
-            return random.choice(legal_moves)
+            return self.rng.choice(legal_moves)
         
         # Pick most visited child
         best_child = max(root.children, key=lambda c: c.visits)
@@ -1,4 +1,17 @@
+import numpy as np
+
+from game.board import TicTacToe
+from game.encoding import NUM_STATES, encode_boards
+
+# Process-wide move tables for get_moves: player -> best move per 3x3
+# state ID (-1 until that position is searched). Minimax is deterministic,
+# so a position is searched once per process however many games reach it.
+_MOVE_TABLES = {}
+
+
 class MinimaxAgent:
+
+    deterministic = True  # Same board, same move (first best move wins ties)
     
     def __init__(self, player):
         """
@@ -14,6 +27,36 @@ class MinimaxAgent:
         self.player = player    
         self.nodes_explored = 0
 
+    def fingerprint(self):
+        """Identity of this agent's behavior (for result caching)."""
+        return "MinimaxAgent"
+
+    def counters(self):
+        """Cumulative search effort (see tournament/metrics.py)."""
+        return {'nodes': self.nodes_explored}
+
+    def get_moves(self, boards):
+        """
+        Batched get_move for 3x3 boards: one table lookup per board,
+        searching only positions no game in this process has reached yet.
+
+        Args:
+            boards (np.ndarray): (n, 9) boards where this agent moves
+        Returns:
+            np.ndarray: (n,) chosen positions (the same as get_move's)
+        """
+        table = _MOVE_TABLES.setdefault(self.player, np.full(NUM_STATES, -1, dtype=np.int8))
+        state_ids = encode_boards(boards)
+        moves = table[state_ids].astype(np.int64)
+        for index in np.flatnonzero(moves < 0):
+            state_id = state_ids[index]
+            if table[state_id] < 0:  # Not a repeat of a position searched above
+                game = TicTacToe()
+                game.board = boards[index].tolist()
+                game.current_player = self.player
+                table[state_id] = self.get_move(game)
+            moves[index] = table[state_id]
+        return moves
 
     def get_move(self, game):
         """
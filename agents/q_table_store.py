@@ -0,0 +1,200 @@
+"""
+Compact binary Q-table files with memory-mapped loading.
+
+File layout (little-endian):
+
+    offset  size         field
+    0       4            magic b"QTBL"
+    4       2            format version (1)
+    6       2            header size in bytes (32)
+    8       4            number of states n
+    12      20           reserved (zero)
+    32      4 * n        state IDs, uint32, sorted (see game/encoding.py)
+    ...     2 * n        action masks, uint16, bit a set if action a has a value
+    ...     0-2          padding to a 4-byte boundary
+    ...     4 * 9 * n    Q-values, float32, one row of 9 per state
+
+Loading maps the file read-only and wraps the three arrays without
+parsing anything, so startup is constant time and processes that load
+the same file share its pages through the OS cache. Unlike pickle,
+loading a file can never execute code.
+"""
+
+import mmap
+import pickle
+import struct
+import sys
+
+import numpy as np
+
+from collections.abc import Mapping
+
+from game.encoding import decode_state, encode_board
+
+MAGIC = b"QTBL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI20x")
+
+
+class MappedQTable(Mapping):
+    """
+    Read-only view of a binary Q-table that behaves like q_table dicts.
+
+    Supports everything QLearningAgent needs for playing:
+    `state in table`, `table[state].get(move, 0)` and `len(table)`.
+    Use to_dict() to get a mutable copy for further training.
+
+    Lookups are cached per state, rows decoded into dicts (the table is
+    read-only, so they never go stale); don't modify the dicts returned.
+    """
+
+    def __init__(self, state_ids, masks, values, buffer=None):
+        self.state_ids = state_ids
+        self.masks = masks
+        self.values = values
+        self._buffer = buffer  # Keeps the mmap alive
+        self._rows = {}  # State -> decoded row
+
+    def _row(self, state):
+        state_id = encode_board(state)
+        row = int(np.searchsorted(self.state_ids, state_id))
+        if row < len(self.state_ids) and self.state_ids[row] == state_id:
+            return row
+        return None
+
+    def __contains__(self, state):
+        return self.get(state) is not None
+
+    def __getitem__(self, state):
+        actions = self.get(state)
+        if actions is None:
+            raise KeyError(state)
+        return actions
+
+    def get(self, state, default=None):
+        try:
+            actions = self._rows[state]
+        except KeyError:
+            row = self._row(state)
+            actions = None
+            if row is not None:
+                mask = int(self.masks[row])
+                values = self.values[row]
+                actions = {action: float(values[action])
+                           for action in range(9) if mask >> action & 1}
+            self._rows[state] = actions
+        return default if actions is None else actions
+
+    def __iter__(self):
+        for state_id in self.state_ids:
+            yield decode_state(int(state_id))
+
+    def __len__(self):
+        return len(self.state_ids)
+
+    def to_dict(self):
+        """Copy into a regular (mutable) q_table dict."""
+        return {state: dict(self[state]) for state in self}
+
+    def close(self):
+        """Release the memory map (the table is unusable afterwards)."""
+        self.state_ids = self.masks = self.values = None
+        self._rows = {}
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+
+def _layout(num_states):
+    """Byte offsets of the three arrays for a table of num_states rows."""
+    ids_offset = HEADER.size
+    masks_offset = ids_offset + 4 * num_states
+    values_offset = masks_offset + 2 * num_states
+    values_offset += -values_offset % 4
+    return ids_offset, masks_offset, values_offset
+
+
+def save_binary(q_table, filename):
+    """
+    Write a q_table dict (or MappedQTable) in the binary format.
+
+    Values are stored as float32.
+    """
+    rows = sorted((encode_board(state), actions) for state, actions in q_table.items())
+    num_states = len(rows)
+
+    state_ids = np.array([state_id for state_id, _ in rows], dtype="<u4")
+    masks = np.zeros(num_states, dtype="<u2")
+    values = np.zeros((num_states, 9), dtype="<f4")
+    for row, (_, actions) in enumerate(rows):
+        for action, value in actions.items():
+            masks[row] |= 1 << action
+            values[row, action] = value
+
+    _, _, values_offset = _layout(num_states)
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, HEADER.size, num_states))
+        f.write(state_ids.tobytes())
+        f.write(masks.tobytes())
+        f.write(b"\0" * (values_offset - f.tell()))
+        f.write(values.tobytes())
+
+
+def load_binary(filename):
+    """
+    Memory-map a binary Q-table file.
+
+    Returns:
+        MappedQTable: Read-only table backed by the file
+
+    Raises:
+        ValueError: If the file is not a supported binary Q-table
+    """
+    with open(filename, 'rb') as f:
+        if f.seek(0, 2) < HEADER.size:
+            raise ValueError(f"{filename} is too small to be a Q-table file")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, header_size, num_states = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        buffer.close()
+        raise ValueError(f"{filename} is not a binary Q-table file")
+    if version != VERSION or header_size != HEADER.size:
+        buffer.close()
+        raise ValueError(f"Unsupported Q-table format version {version} in {filename}")
+
+    ids_offset, masks_offset, values_offset = _layout(num_states)
+    if len(buffer) < values_offset + 36 * num_states:
+        buffer.close()
+        raise ValueError(f"{filename} is truncated")
+
+    state_ids = np.frombuffer(buffer, dtype="<u4", count=num_states, offset=ids_offset)
+    masks = np.frombuffer(buffer, dtype="<u2", count=num_states, offset=masks_offset)
+    values = np.frombuffer(buffer, dtype="<f4", count=num_states * 9,
+                           offset=values_offset).reshape(num_states, 9)
+    return MappedQTable(state_ids, masks, values, buffer)
+
+
+def is_binary_file(filename):
+    """Check whether a file starts with the binary Q-table magic bytes."""
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def convert_pickle(pickle_filename, binary_filename):
+    """
+    Convert a legacy pickled q_table to the binary format.
+
+    Only run this on pickle files you trust; unpickling can execute code.
+    """
+    with open(pickle_filename, 'rb') as f:
+        q_table = pickle.load(f)
+    save_binary(q_table, binary_filename)
+    print(f"Converted {len(q_table):,} states: {pickle_filename} -> {binary_filename}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python -m agents.q_table_store <q_table.pkl> <q_table.qtb>")
+        sys.exit(1)
+    convert_pickle(sys.argv[1], sys.argv[2])
@@ -1,6 +1,13 @@
-import random
+import hashlib
 import pickle
 
+import numpy as np
+
+from agents.replay_buffer import TERMINAL
+from agents.q_table_store import MappedQTable, is_binary_file, load_binary, save_binary
+from game.encoding import NUM_STATES, all_boards, encode_board, encode_boards
+from game.rng import make_rng, numpy_generator
+
 class QLearningAgent:
     """
     An agent that learns through self-play using Q-Learning.
@@ -11,7 +18,18 @@ class QLearningAgent:
     3. Improves through experience (trial and error)
     """
 
-    def __init__(self, player, learning_rate=0.1, discount_factor=0.9, epsilon=0.1):
+    def __init__(self, player, learning_rate=0.1, discount_factor=0.9, epsilon=0.1,
+                 replay_buffer=None, replay_ratio=0, replay_batch_size=32,
+                 td_lambda=None, rng=None):
+        """
+        Args:
+            td_lambda (float): Use Watkins Q(λ) with this trace decay
+                (None keeps the one-step backward update)
+            replay_buffer (ReplayBuffer): Optional store of past transitions
+            replay_ratio (float): Replayed transitions per new transition
+            replay_batch_size (int): Transitions per batched TD update
+            rng: Seed, random.Random or None for the global random module
+        """
         self.player = player
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
@@ -20,6 +38,23 @@ class QLearningAgent:
         self.q_table = {}  # Key: (state, action), Value: Q-value
         self.history = []  # To store state-action pairs for learning
 
+        self.replay_buffer = replay_buffer
+        self.replay_ratio = replay_ratio
+        self.replay_batch_size = replay_batch_size
+        self.td_lambda = td_lambda
+        self.reseed(rng)
+
+        # Moves picked at random (exploration, unknown states, ties), so a
+        # tournament can tell when a greedy game would replay identically
+        self.random_choices = 0
+        self.table_lookups = 0
+        self._fingerprint = None  # (q_table identity, size, digest)
+        self._dense = None  # (fingerprint, (NUM_STATES, 9) values) for get_moves
+
+    def reseed(self, rng):
+        """Switch to a new random stream for exploration and tie-breaks."""
+        self.rng = make_rng(rng)
+        self._stream = None  # NumPy generator for batched tie-breaks
 
 
     def get_move(self, game, training=False):
@@ -43,8 +78,9 @@ class QLearningAgent:
 
 
         # Exploration vs Exploitation
-        if training and random.random() < self.epsilon:
-            move = random.choice(legal_moves)
+        if training and self.rng.random() < self.epsilon:
+            move = self.rng.choice(legal_moves)
+            self.random_choices += 1
         else:
             move = self.get_best_move(state, legal_moves)
 
@@ -64,14 +100,18 @@ class QLearningAgent:
             int: Best move based on Q-values
         """
 
-        if state not in self.q_table:
-            return random.choice(legal_moves)
+        self.table_lookups += 1
+        actions = self.q_table.get(state)  # One lookup per decision
+        if actions is None:
+            if len(legal_moves) > 1:
+                self.random_choices += 1
+            return self.rng.choice(legal_moves)
         
         best_value = float('-inf')
         best_moves = []
 
         for move in legal_moves:
-            q_value = self.q_table[state].get(move, 0)
+            q_value = actions.get(move, 0)
 
             if q_value > best_value:
                 best_value = q_value
@@ -79,7 +119,77 @@ class QLearningAgent:
             elif q_value == best_value:
                 best_moves.append(move)
 
-        return random.choice(best_moves)
+        if len(best_moves) > 1:
+            self.random_choices += 1
+        return self.rng.choice(best_moves)
+
+    def get_moves(self, boards):
+        """
+        Batched greedy get_move (no exploration) for 3x3 boards.
+
+        Same policy as get_best_move, read from a dense copy of the
+        Q-table; ties and unknown states draw from a NumPy stream seeded
+        by self.rng, so the random picks differ from get_move's.
+
+        Args:
+            boards (np.ndarray): (n, 9) boards where this agent moves
+        Returns:
+            np.ndarray: (n,) chosen positions
+        """
+        q_rows = self.dense_q_values()[encode_boards(boards * np.int8(self.player))]
+        masked = np.where(boards == 0, q_rows, -np.inf)
+        is_best = masked == masked.max(axis=1, keepdims=True)
+
+        self.table_lookups += len(boards)
+        self.random_choices += int(np.count_nonzero(is_best.sum(axis=1) > 1))
+        if self._stream is None:
+            self._stream = numpy_generator(self.rng)
+        return np.where(is_best, self._stream.random(boards.shape), -1.0).argmax(axis=1)
+
+    def dense_q_values(self):
+        """
+        Q-table as a (NUM_STATES, 9) array indexed by state ID (0 where
+        there is no value), rebuilt when the fingerprint changes.
+        """
+        key = self.fingerprint()
+        if self._dense is None or self._dense[0] != key:
+            values = np.zeros((NUM_STATES, 9))
+            table = self.q_table
+            if isinstance(table, MappedQTable):
+                bits = (table.masks[:, None].astype(np.int64) >> np.arange(9)) & 1
+                values[table.state_ids] = np.where(bits == 1, table.values, 0.0)
+            else:
+                for state, actions in table.items():
+                    row = values[encode_board(state)]
+                    for action, value in actions.items():
+                        row[action] = value
+            self._dense = (key, values)
+        return self._dense[1]
+
+    def counters(self):
+        """Cumulative effort (see tournament/metrics.py)."""
+        return {'table_lookups': self.table_lookups}
+
+    def fingerprint(self):
+        """
+        Identity of this agent's greedy behavior (for result caching).
+
+        A digest of the Q-table, cached until the table is replaced,
+        reloaded or learned from.
+        """
+        table = self.q_table
+        if self._fingerprint and self._fingerprint[:2] == (id(table), len(table)):
+            return self._fingerprint[2]
+
+        digest = hashlib.sha1()
+        if isinstance(table, MappedQTable):
+            for array in (table.state_ids, table.masks, table.values):
+                digest.update(array.tobytes())
+        else:
+            for state in sorted(table):
+                digest.update(repr((state, sorted(table[state].items()))).encode())
+        self._fingerprint = (id(table), len(table), f"QLearningAgent:{digest.hexdigest()}")
+        return self._fingerprint[2]
     
     def learn(self, reward):
         """
@@ -93,8 +203,24 @@ class QLearningAgent:
         2. Update its Q-value based on immediate reward
         3. Work backwards, each move gets credit for future value
         4. This is called "temporal difference learning"
+
+        With td_lambda set, learn_with_traces is used instead.
         """
 
+        if self.td_lambda is not None:
+            self.learn_with_traces(reward)
+        else:
+            self.learn_one_step(reward)
+
+        if self.replay_buffer is not None:
+            self.replay_buffer.add_episode(self.history, reward)
+            self.replay(int(len(self.history) * self.replay_ratio))
+
+        self._fingerprint = None  # Q-values changed
+        self.history = []  # Clear history after learning
+
+    def learn_one_step(self, reward):
+        """Backward one-step TD pass over the game (the original update)."""
         for i in range(len(self.history)-1, -1, -1):
             state, action = self.history[i]
 
@@ -120,23 +246,136 @@ class QLearningAgent:
             self.q_table[state][action] = current_q + self.learning_rate * (target - current_q)
 
             reward = 0  # Only the final move gets the actual reward
-        self.history = []  # Clear history after learning
+
+    def learn_with_traces(self, reward):
+        """
+        Watkins Q(λ) pass over the game.
+
+        Walks the game forwards. Each step's TD error
+            delta = target - Q(s_t, a_t),  target = r or discount * max_a Q(s_t+1, a)
+        is applied to every earlier move in proportion to its eligibility
+        trace, so the final reward reaches the opening move in a single
+        game instead of creeping back one step per game. Traces decay by
+        discount * λ per move and are cut to zero after an exploratory
+        (non-greedy) move, since later rewards say nothing about the
+        greedy policy before it.
+        """
+        steps = len(self.history)
+        rows = [self.q_table.setdefault(state, {}) for state, _ in self.history]
+        actions = [action for _, action in self.history]
+
+        values = np.array([row.get(action, 0) for row, action in zip(rows, actions)],
+                          dtype=np.float64)
+        traces = np.zeros(steps)
+
+        for t in range(steps):
+            if t == steps - 1:
+                target = reward
+                next_is_greedy = False
+            else:
+                next_state = self.history[t + 1][0]
+                next_values = [rows[t + 1].get(move, 0) for move in range(9)
+                               if next_state[move] == 0]
+                best_next = max(next_values)
+                target = self.discount_factor * best_next
+                next_is_greedy = values[t + 1] == best_next
+
+            delta = target - values[t]
+            traces[t] += 1
+            values[:t + 1] += self.learning_rate * delta * traces[:t + 1]
+
+            if next_is_greedy:
+                traces *= self.discount_factor * self.td_lambda
+            else:
+                traces[:] = 0
+
+        for row, action, value in zip(rows, actions, values):
+            row[action] = float(value)
+
+    def replay(self, num_transitions):
+        """
+        Learn from transitions sampled out of the replay buffer.
+
+        Each mini-batch gets one vectorized Q-learning update:
+            target = reward + discount * max_a' Q(next_state, a')
+        Replayed moves may come from an older policy, so the target uses
+        the best next action rather than the one that was actually played.
+        When a batch holds the same (state, action) k times, the k updates
+        are merged into one step towards their mean target with rate
+        1 - (1 - learning_rate)^k.
+        """
+        boards = all_boards()
+        while num_transitions > 0 and len(self.replay_buffer) > 0:
+            batch_size = min(self.replay_batch_size, num_transitions)
+            num_transitions -= batch_size
+
+            states, actions, rewards, next_states = self.replay_buffer.sample(batch_size)
+
+            # Gather every row the batch touches into one array (0 where
+            # there is no value), decoding each distinct state once
+            ids, index = np.unique(np.concatenate([states, next_states]), return_inverse=True)
+            keys = [tuple(board) for board in boards[ids].tolist()]
+            cells, known = [], []
+            for i, row in enumerate(map(self.q_table.get, keys)):
+                if row:
+                    for action, value in row.items():
+                        cells.append(i * 9 + action)
+                        known.append(value)
+            values = np.zeros((len(ids), 9))
+            values.reshape(-1)[cells] = known
+
+            next_index = index[batch_size:]
+            legal = boards[ids[next_index]] == 0
+            next_values = np.where(legal, values[next_index], -np.inf).max(axis=1)
+            next_values[next_states == TERMINAL] = 0.0
+            targets = rewards + self.discount_factor * next_values
+
+            pairs = index[:batch_size].astype(np.int64) * 9 + actions
+            unique_pairs, inverse, counts = np.unique(pairs, return_inverse=True,
+                                                      return_counts=True)
+            mean_targets = np.bincount(inverse, weights=targets) / counts
+            rates = 1.0 - (1.0 - self.learning_rate) ** counts
+            rows, columns = np.divmod(unique_pairs, 9)
+            current = values[rows, columns]
+            updated = current + rates * (mean_targets - current)
+
+            for row, action, value in zip(rows.tolist(), columns.tolist(), updated.tolist()):
+                self.q_table.setdefault(keys[row], {})[action] = value
 
     def reset_history(self):
         """Clear the history of state-action pairs."""
         self.history = []
 
     def save_q_table(self, filename):
-        """Save the Q-table to a file."""
-        with open(filename, 'wb') as f:
-            pickle.dump(self.q_table, f)
+        """
+        Save the Q-table to a file.
+
+        Uses the compact binary format (see agents/q_table_store.py)
+        unless the filename ends in .pkl, which keeps the legacy pickle.
+        """
+        if filename.endswith('.pkl'):
+            with open(filename, 'wb') as f:
+                pickle.dump(dict(self.q_table), f)
+        else:
+            save_binary(self.q_table, filename)
         print(f"Q-table saved to {filename}")
 
 
-    def load_q_table(self, filename):
-        """Load the Q-table from a file."""
-        with open(filename, 'rb') as f:
-            self.q_table = pickle.load(f)
+    def load_q_table(self, filename, writable=False):
+        """
+        Load the Q-table from a file.
+
+        Binary files are memory-mapped, giving a read-only table; pass
+        writable=True to copy it into a dict for further training.
+        Legacy pickle files are still accepted (only load trusted ones).
+        """
+        if is_binary_file(filename):
+            self.q_table = load_binary(filename)
+            if writable:
+                self.q_table = self.q_table.to_dict()
+        else:
+            with open(filename, 'rb') as f:
+                self.q_table = pickle.load(f)
         print(f"Q-table loaded from {filename}")
         print(f"Q-table has {len(self.q_table)} states.")
 
@@ -1,23 +1,64 @@
-import random
+from game.batch import random_legal_moves
+from game.rng import make_rng, numpy_generator
 
 class RandomAgent:
 
-    def __init__(self, player):
+    def __init__(self, player, rng=None, prefetch=0):
         """
         Initialize the RandomAgent
 
-        
+        Args:
+            player (int): 1 for X, -1 for O
+            rng: Seed, random.Random or None for the global random module
+            prefetch (int): Draw this many uniforms at once from NumPy and
+                pick moves from them (0 draws one Python random per move)
         """
         self.player = player
+        self.prefetch = prefetch
+        self.reseed(rng)
+
+    def reseed(self, rng):
+        """Switch to a new random stream (drops any pre-drawn values)."""
+        self.rng = make_rng(rng)
+        self._stream = None  # NumPy generator behind the prefetch buffer
+        self._draws = []
+        self._next = 0
+
+    def fingerprint(self):
+        """Identity of this agent's behavior; games also depend on the seed."""
+        return f"RandomAgent:prefetch={self.prefetch}"
 
     def get_move(self, game):
         """
         Select a random legal move from the available options.
-        
+
         Args:
             game: The current game state
         Returns:
             int: The chosen move position
         """
         legal_moves = game.get_legal_moves()
-        return random.choice(legal_moves)
\ No newline at end of file
+        if not self.prefetch:
+            return self.rng.choice(legal_moves)
+
+        if self._next == len(self._draws):
+            if self._stream is None:
+                self._stream = numpy_generator(self.rng)
+            self._draws = self._stream.random(self.prefetch).tolist()
+            self._next = 0
+        draw = self._draws[self._next]
+        self._next += 1
+        return legal_moves[int(draw * len(legal_moves))]
+
+    def get_moves(self, boards):
+        """
+        Batched get_move: a random legal move on each board.
+
+        Args:
+            boards (np.ndarray): (n, 9) boards where this agent moves
+        Returns:
+            np.ndarray: (n,) chosen positions
+        """
+        if self._stream is None:
+            self._stream = numpy_generator(self.rng)
+        return random_legal_moves(boards, self._stream)
@@ -0,0 +1,140 @@
+"""
+Reference engine: serves a built-in agent over the engine protocol
+(see agents/external_engine.py), for testing ExternalEngineAgent offline
+and as a template for engines written elsewhere.
+
+    python -m agents.reference_engine --agent heuristic
+    python -m agents.reference_engine --agent mcts --simulations 200
+
+The wrapped agents play with their own fixed budgets; movetime is
+enforced by the client, not here.
+"""
+
+import argparse
+import contextlib
+import sys
+
+from agents.external_engine import PROTOCOL_VERSION
+from game.board import TicTacToe
+from game.rng import reseed
+from tournament.metrics import agent_counters, counter_delta
+
+AGENTS = ('random', 'heuristic', 'minimax', 'qlearning', 'mcts')
+
+
+def build_agent(name, simulations=1000, q_table="results/q_table.qtb"):
+    if name == 'random':
+        from agents.random_agent import RandomAgent
+        return RandomAgent(player=1)
+    if name == 'heuristic':
+        from agents.heuristic_agent import HeuristicAgent
+        return HeuristicAgent(player=1)
+    if name == 'minimax':
+        from agents.minimax_agent import MinimaxAgent
+        return MinimaxAgent(player=1)
+    if name == 'qlearning':
+        from agents.qlearning_agent import QLearningAgent
+        agent = QLearningAgent(player=1, epsilon=0)
+        with contextlib.redirect_stdout(sys.stderr):  # stdout carries the protocol
+            agent.load_q_table(q_table)
+        return agent
+    if name == 'mcts':
+        from agents.mcts_agent import MCTSAgent
+        return MCTSAgent(player=1, num_simulations=simulations)
+    raise ValueError(f"Unknown agent {name!r}")
+
+
+class EngineSession:
+    """Protocol state for one engine process: the agent and the current game."""
+
+    def __init__(self, agent):
+        self.agent = agent
+        self.game = TicTacToe()
+        fingerprint = getattr(agent, 'fingerprint', None)
+        self.name = (fingerprint() if fingerprint else type(agent).__name__).replace(" ", "_")
+
+    def set_position(self, moves):
+        """Play moves from the start, continuing the current game if it's a prefix."""
+        game = self.game
+        if game.moves != moves[:len(game.moves)]:
+            game = TicTacToe(game.size, game.win_length)
+        for move in moves[len(game.moves):]:
+            if not game.make_move(move):
+                raise ValueError(f"illegal move {move}")
+        self.game = game
+
+    def handle(self, line):
+        """
+        Reply to one command.
+
+        Returns:
+            list: Reply lines (None for quit)
+        """
+        tokens = line.split()
+        if not tokens:
+            return []
+        command, args = tokens[0], tokens[1:]
+        if command == 'quit':
+            return None
+        if command == 'hello':
+            flags = " deterministic" if getattr(self.agent, 'deterministic', False) else ""
+            return [f"hello {PROTOCOL_VERSION} {self.name}{flags}"]
+        if command == 'isready':
+            return ["readyok"]
+        if command == 'newgame':
+            self.game = TicTacToe(*map(int, args[:2]))
+            return ["ok"]
+        if command == 'seed':
+            reseed(self.agent, int(args[0]))
+            return ["ok"]
+        if command == 'position':
+            if not args or args[0] != 'startpos':
+                raise ValueError("position must start with startpos")
+            self.set_position([int(move) for move in args[2:]] if args[1:2] == ['moves'] else [])
+            return ["ok"]
+        if command == 'go':
+            if self.game.is_game_over():
+                raise ValueError("game is over")
+            before = agent_counters(self.agent)
+            self.agent.player = self.game.current_player
+            move = self.agent.get_move(self.game)
+            counters = counter_delta(agent_counters(self.agent), before)
+            replies = []
+            if counters:
+                replies.append("info " + " ".join(f"{name}={value}"
+                                                  for name, value in counters.items()))
+            return replies + [f"bestmove {move}"]
+        raise ValueError(f"unknown command {command!r}")
+
+
+def serve(agent, stdin=sys.stdin, stdout=sys.stdout):
+    """Answer protocol commands until quit or end of input."""
+    session = EngineSession(agent)
+    for line in stdin:
+        try:
+            replies = session.handle(line)
+        except (ValueError, IndexError) as error:
+            replies = [f"error {error}"]
+        if replies is None:
+            break
+        for reply in replies:
+            stdout.write(reply + "\n")
+        stdout.flush()
+
+
+def command(agent, *args):
+    """Command line for ExternalEngineAgent running this engine (from the repo root)."""
+    return [sys.executable, "-m", "agents.reference_engine", "--agent", agent, *args]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a built-in agent over the engine protocol")
+    parser.add_argument("--agent", choices=AGENTS, default='heuristic')
+    parser.add_argument("--simulations", type=int, default=1000, help="MCTS simulations per move")
+    parser.add_argument("--q-table", default="results/q_table.qtb", help="Q-table for qlearning")
+    args = parser.parse_args()
+    serve(build_agent(args.agent, args.simulations, args.q_table))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Experience replay for QLearningAgent.
+
+Transitions are stored in fixed-size NumPy arrays (a ring buffer), using
+the integer state IDs from game/encoding.py instead of board tuples, so
+the memory cost is a few bytes per transition regardless of how many
+games are stored.
+"""
+
+import numpy as np
+
+from game.encoding import encode_board
+
+TERMINAL = -1  # next_states value for the last move of a game
+
+
+class ReplayBuffer:
+    """
+    Fixed-capacity store of (state, action, reward, next_state) transitions.
+
+    Eviction once full:
+    - 'fifo': overwrite the oldest transition (ring buffer)
+    - 'random': overwrite a uniformly random transition, which keeps
+      some very old experience around for longer
+    """
+
+    def __init__(self, capacity=50000, eviction='fifo', seed=None):
+        if eviction not in ('fifo', 'random'):
+            raise ValueError(f"Unknown eviction policy '{eviction}'")
+
+        self.capacity = capacity
+        self.eviction = eviction
+        self.rng = np.random.default_rng(seed)
+
+        self.states = np.zeros(capacity, dtype=np.int32)
+        self.actions = np.zeros(capacity, dtype=np.int8)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros(capacity, dtype=np.int32)
+
+        self.size = 0
+        self.position = 0  # Next slot to write in FIFO mode
+
+    def __len__(self):
+        return self.size
+
+    def add(self, state_id, action, reward, next_state_id):
+        """Store one transition, evicting another if the buffer is full."""
+        if self.size < self.capacity:
+            slot = self.size
+            self.size += 1
+        elif self.eviction == 'fifo':
+            slot = self.position
+        else:
+            slot = self.rng.integers(self.capacity)
+
+        self.states[slot] = state_id
+        self.actions[slot] = action
+        self.rewards[slot] = reward
+        self.next_states[slot] = next_state_id
+        self.position = (slot + 1) % self.capacity
+
+    def add_episode(self, history, reward):
+        """
+        Store a finished game.
+
+        Args:
+            history (list): QLearningAgent.history, (state, action) pairs
+            reward (float): Final reward, given to the last move only
+        """
+        state_ids = [encode_board(state) for state, _ in history]
+        for i, (_, action) in enumerate(history):
+            if i == len(history) - 1:
+                self.add(state_ids[i], action, reward, TERMINAL)
+            else:
+                self.add(state_ids[i], action, 0.0, state_ids[i + 1])
+
+    def sample(self, batch_size):
+        """
+        Draw a uniform mini-batch (with replacement).
+
+        Returns:
+            tuple: (states, actions, rewards, next_states) arrays
+        """
+        indices = self.rng.integers(self.size, size=batch_size)
+        return (self.states[indices], self.actions[indices],
+                self.rewards[indices], self.next_states[indices])
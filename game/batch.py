@@ -0,0 +1,67 @@
+"""
+Vectorized tic-tac-toe rules for many boards at once.
+
+Boards are an (n, 9) int8 NumPy array using the same convention as
+TicTacToe.board: 0 empty, 1 for X, -1 for O.
+"""
+
+import numpy as np
+
+WINNING_LINES = np.array([
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
+    [0, 4, 8], [2, 4, 6]              # Diagonals
+])
+
+
+def new_boards(n):
+    """Create n empty boards."""
+    return np.zeros((n, 9), dtype=np.int8)
+
+
+def check_winners(boards):
+    """
+    Vectorized TicTacToe.check_winner.
+
+    Returns:
+        np.ndarray: (n,) int8 array, 1 if X wins, -1 if O wins, 0 otherwise
+    """
+    line_sums = boards[:, WINNING_LINES].sum(axis=2, dtype=np.int8)
+    winners = np.zeros(len(boards), dtype=np.int8)
+    winners[(line_sums == 3).any(axis=1)] = 1
+    winners[(line_sums == -3).any(axis=1)] = -1
+    return winners
+
+
+def legal_mask(boards):
+    """(n, 9) boolean array of empty cells."""
+    return boards == 0
+
+
+def random_legal_moves(boards, rng):
+    """
+    Pick a uniformly random legal move on every board.
+
+    Boards without a legal move get move 0; callers only ask for
+    moves on games that are still running.
+    """
+    scores = rng.random(boards.shape)
+    scores[boards != 0] = -1.0
+    return scores.argmax(axis=1)
+
+
+def greedy_moves(q_rows, legal, rng):
+    """
+    Pick the highest-valued legal move per row, breaking ties randomly.
+
+    Args:
+        q_rows (np.ndarray): (n, 9) action values
+        legal (np.ndarray): (n, 9) boolean legal-move mask
+        rng (np.random.Generator): Tie-break randomness
+
+    Returns:
+        np.ndarray: (n,) chosen moves
+    """
+    masked = np.where(legal, q_rows, -np.inf)
+    is_best = masked == masked.max(axis=1, keepdims=True)
+    return np.where(is_best, rng.random(q_rows.shape), -1.0).argmax(axis=1)
@@ -1,3 +1,29 @@
+_LINES_CACHE = {}
+
+
+def winning_lines(size=3, win_length=3):
+    """
+    All lines of win_length consecutive cells on a size x size board.
+
+    Returns:
+        list: Lists of board indices (rows, columns, then both diagonals)
+    """
+    key = (size, win_length)
+    if key not in _LINES_CACHE:
+        lines = []
+        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]  # Row, column, diagonals
+        for d_row, d_col in directions:
+            for row in range(size):
+                for col in range(size):
+                    end_row = row + d_row * (win_length - 1)
+                    end_col = col + d_col * (win_length - 1)
+                    if 0 <= end_row < size and 0 <= end_col < size:
+                        lines.append([(row + d_row * i) * size + col + d_col * i
+                                      for i in range(win_length)])
+        _LINES_CACHE[key] = lines
+    return _LINES_CACHE[key]
+
+
 class TicTacToe:
     """
     Tic-tac-toe game engine using 1D board representation.
@@ -8,18 +34,30 @@ class TicTacToe:
     3 | 4 | 5
     ---------
     6 | 7 | 8
+
+    Larger boards (size x size, k in a row) use the same row-major layout.
     """
 
-    def __init__(self):
+    def __init__(self, size=3, win_length=None):
         """
         Initialize a new game.
         
+        Args:
+            size (int): Board width and height (3 for classic tic-tac-toe)
+            win_length (int): Marks in a row needed to win (default: size)
+
         Why we need each attribute:
-        - board: The actual game state (9 positions)
+        - board: The actual game state (size * size positions)
         - current_player: Whose turn is it? (1 for X, -1 for O)
+        - winning_lines: Every line that wins when filled by one player
+        - moves: Positions played so far, so agents can update incrementally
         """
-        self.board = [0] * 9  # 0 for empty, 1 for X, -1 for O
+        self.size = size
+        self.win_length = win_length or size
+        self.board = [0] * (size * size)  # 0 for empty, 1 for X, -1 for O
         self.current_player = 1  # X starts first
+        self.winning_lines = winning_lines(size, self.win_length)
+        self.moves = []
 
 
     def make_move(self, position):
@@ -27,7 +65,7 @@ class TicTacToe:
         Place the current player's mark at the given position.
         
         Args:
-            position (int): Board index (0-8)
+            position (int): Board index (0-8 on the classic board)
             
         Returns:
             bool: True if move was legal and made, False otherwise
@@ -38,7 +76,7 @@ class TicTacToe:
         """
 
         #Check if move is legal
-        if position < 0 or position > 8:
+        if position < 0 or position >= len(self.board):
             return False
         
         #Check if position is already taken
@@ -47,6 +85,7 @@ class TicTacToe:
         
         #Make the move
         self.board[position] = self.current_player
+        self.moves.append(position)
         self.current_player *= -1  # Switch player
 
         return True
@@ -59,17 +98,24 @@ class TicTacToe:
             int: 1 if X wins, -1 if O wins, 0 if no winner yet
         """
 
-        winning_lines = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
-            [0, 4, 8], [2, 4, 6]              # Diagonals
-        ]
+        board = self.board
+        target = self.win_length
+
+        if target == 3:
+            # Fast path for classic tic-tac-toe (the hot loop of every search)
+            for a, b, c in self.winning_lines:
+                line_sum = board[a] + board[b] + board[c]
+                if line_sum == 3:
+                    return 1  # X wins
+                elif line_sum == -3:
+                    return -1  # O wins
+            return 0
 
-        for line in winning_lines:
-            line_sum = self.board[line[0]] + self.board[line[1]] + self.board[line[2]]
-            if line_sum == 3:
+        for line in self.winning_lines:
+            line_sum = sum(board[i] for i in line)
+            if line_sum == target:
                 return 1  # X wins
-            elif line_sum == -3:
+            elif line_sum == -target:
                 return -1  # O wins
             
         return 0  # No winner yet
@@ -95,10 +141,10 @@ class TicTacToe:
         Get a list of legal moves.
         
         Returns:
-            list: List of indices (0-8) that are empty
+            list: List of indices that are empty
         """
 
-        return [i for i in range(9) if self.board[i] == 0]
+        return [i for i in range(len(self.board)) if self.board[i] == 0]
     
     def copy(self):
         """
@@ -108,9 +154,10 @@ class TicTacToe:
             TicTacToe: A new instance with the same state
         """
 
-        new_game = TicTacToe()
+        new_game = TicTacToe(self.size, self.win_length)
         new_game.board = self.board.copy()
         new_game.current_player = self.current_player
+        new_game.moves = self.moves.copy()
         return new_game
     
     def display(self):
@@ -120,14 +167,14 @@ class TicTacToe:
 
         symbols = {1: 'X', -1: 'O', 0: ' '}
         print("\n")
-        for row in range(3):
-            start = row * 3
+        for row in range(self.size):
+            start = row * self.size
             cells = []
-            for i in range(3):
+            for i in range(self.size):
                 position = start + i
                 value = self.board[position]
                 cells.append(symbols[value])
-            print(f"{cells[0]} | {cells[1]} | {cells[2]}")
-            if row < 2:
-                print("---------")
+            print(" | ".join(cells))
+            if row < self.size - 1:
+                print("-" * (4 * self.size - 3))
         print("\n")
@@ -0,0 +1,98 @@
+"""
+Compact integer IDs for tic-tac-toe boards.
+
+Every 3x3 board is a 9-digit base-3 number:
+    digit 0 = empty, digit 1 = +1 (X / "us"), digit 2 = -1 (O / "them")
+
+Cell 0 is the least significant digit, so there are exactly 3^9 = 19,683
+IDs. Array-backed Q-tables, binary table files and compiled policies all
+index rows with these IDs.
+"""
+
+import numpy as np
+
+NUM_CELLS = 9
+NUM_STATES = 3 ** NUM_CELLS
+
+POWERS = np.array([3 ** i for i in range(NUM_CELLS)], dtype=np.int64)
+
+_DIGIT_TO_CELL = np.array([0, 1, -1], dtype=np.int8)
+_ALL_BOARDS = None
+
+
+def encode_board(board):
+    """
+    Convert a board (list/tuple of 0, 1, -1) to its state ID.
+
+    Args:
+        board (sequence): 9 cell values
+
+    Returns:
+        int: State ID in [0, NUM_STATES)
+    """
+    state_id = 0
+    for cell in reversed(board):
+        state_id = state_id * 3 + (cell % 3)  # -1 % 3 == 2
+    return state_id
+
+
+def decode_state(state_id):
+    """
+    Convert a state ID back to a board tuple.
+
+    Returns:
+        tuple: 9 cell values (0, 1, -1)
+    """
+    return tuple(int(cell) for cell in all_boards()[state_id])
+
+
+def encode_boards(boards):
+    """
+    Vectorized encode_board for an (n, 9) array of boards.
+
+    Returns:
+        np.ndarray: (n,) int64 array of state IDs
+    """
+    return (np.asarray(boards) % 3).astype(np.int64) @ POWERS
+
+
+def all_boards():
+    """
+    Table of every board indexed by state ID.
+
+    Returns:
+        np.ndarray: (NUM_STATES, 9) int8 array (shared, do not modify)
+    """
+    global _ALL_BOARDS
+    if _ALL_BOARDS is None:
+        digits = (np.arange(NUM_STATES)[:, None] // POWERS) % 3
+        _ALL_BOARDS = _DIGIT_TO_CELL[digits]
+        _ALL_BOARDS.setflags(write=False)
+    return _ALL_BOARDS
+
+
+def reachable_positions():
+    """
+    Every non-terminal 3x3 position reachable by legal play from the start.
+
+    Returns:
+        list: TicTacToe games (board and side to move), 4,520 in total
+    """
+    from game.board import TicTacToe
+
+    positions = []
+    frontier = [TicTacToe()]
+    seen = {encode_board(frontier[0].board)}
+    while frontier:
+        game = frontier.pop()
+        if game.is_game_over():
+            continue
+        positions.append(game)
+        for move in game.get_legal_moves():
+            child = game.copy()
+            child.make_move(move)
+            state_id = encode_board(child.board)
+            if state_id not in seen:
+                seen.add(state_id)
+                frontier.append(child)
+    return positions
@@ -0,0 +1,94 @@
+"""
+Random number streams for agents, trainers and tournaments.
+
+Every stochastic agent takes an rng argument, normalized by make_rng:
+
+- None: the global random module (the historical behavior, so
+  random.seed() still controls unseeded runs)
+- random.Random: used as is, so several agents can share one stream
+- int or numpy SeedSequence: a private random.Random seeded from it
+
+Independent streams for workers, matchups and games come from
+spawn_seeds, which uses SeedSequence.spawn: children never overlap and a
+child's stream depends only on the root seed and its position, so runs
+are bit-identical however the work is split across processes.
+"""
+
+import random
+
+import numpy as np
+
+
+def make_rng(rng=None):
+    """
+    Normalize an rng argument to something with the random.Random API.
+
+    Returns:
+        random.Random or module: Source for random(), choice(), ...
+    """
+    if rng is None:
+        return random
+    if rng is random or isinstance(rng, random.Random):
+        return rng
+    if isinstance(rng, np.random.SeedSequence):
+        # 128 bits of the sequence's entropy seed the Mersenne Twister
+        return random.Random(int.from_bytes(rng.generate_state(4).tobytes(), 'little'))
+    return random.Random(rng)
+
+
+def spawn_seeds(seed, n):
+    """
+    Split a seed into n independent child SeedSequences.
+
+    Args:
+        seed (int or SeedSequence): Root seed (None draws fresh entropy)
+        n (int): Number of children
+
+    Returns:
+        list: SeedSequence per child
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [child_seed(seed, i) for i in range(n)]
+
+
+def child_seed(seed, index):
+    """
+    Child index of a seed, as in spawn_seeds, without building the others.
+
+    The same child as seed.spawn(index + 1)[index] on a fresh sequence,
+    but the parent's spawn counter is not advanced, so repeated calls
+    agree.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (index,),
+                                  pool_size=seed.pool_size)
+
+
+def split_seed(seed, n=2):
+    """
+    Derive n independent integer seeds from one SeedSequence.
+
+    A single generate_state call, so much cheaper than spawn when a stream
+    is needed per game and per side.
+
+    Returns:
+        list: n 128-bit integers
+    """
+    words = seed.generate_state(4 * n)
+    return [int.from_bytes(words[4 * i:4 * i + 4].tobytes(), 'little') for i in range(n)]
+
+
+def numpy_generator(rng):
+    """
+    NumPy Generator seeded from an rng (make_rng result), for agents that
+    draw many values at once.
+    """
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+def reseed(agent, seed):
+    """Give an agent a new stream if it is stochastic (has reseed)."""
+    if hasattr(agent, 'reseed'):
+        agent.reseed(seed)
@@ -1,4 +1,9 @@
+from agents.external_engine import ExternalEngineAgent
 from tournament.runner import Tournament
+from tournament.stats import SPRT
+from functools import partial
+import argparse
+import shlex
 
 def main():
     """Run the complete tournament."""
@@ -12,18 +17,64 @@ def main():
     ╚═══════════════════════════════════════════════════════════╝
     """)
     
+    parser = argparse.ArgumentParser(description="Run the round-robin tournament")
+    parser.add_argument("--q-table", default="results/q_table.qtb",
+                        help="Trained Q-table file (binary or legacy .pkl)")
+    parser.add_argument("--compile", action="store_true",
+                        help="Precompute deterministic agents' moves for every position")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Root seed for reproducible tournaments")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Play matchups on this many processes")
+    parser.add_argument("--record-dir", default=None,
+                        help="Append every game to binary record files in this directory")
+    parser.add_argument("--metrics-dir", default=None,
+                        help="Write per-matchup latency and counter JSON to this directory")
+    parser.add_argument("--sprt", action="store_true",
+                        help="Stop each matchup once its result is significant "
+                             "(100 games per side become the cap)")
+    parser.add_argument("--alpha", type=float, default=0.05,
+                        help="Error rate for --sprt")
+    parser.add_argument("--margin", type=float, default=0.1,
+                        help="Smallest score difference --sprt should detect")
+    parser.add_argument("--swiss", action="store_true",
+                        help="Swiss rounds with Bradley-Terry ratings instead of round-robin")
+    parser.add_argument("--mcts-sims", type=int, nargs="*", default=[],
+                        help="Also enter MCTS with each of these simulation counts")
+    parser.add_argument("--results-db", default=None,
+                        help="SQLite file of finished matchups; rerunning skips them")
+    parser.add_argument("--batch", action="store_true",
+                        help="Play games between batch-capable agents in lockstep")
+    parser.add_argument("--engine", action="append", default=[], metavar="NAME=COMMAND",
+                        help="Also enter an external engine (see agents/external_engine.py), "
+                             "e.g. 'Ref=python -m agents.reference_engine --agent minimax'")
+    args = parser.parse_args()
+
     # Create tournament
-    tournament = Tournament(games_per_side=100)
+    tournament = Tournament(games_per_side=100, q_table_path=args.q_table,
+                            compile_policies=args.compile, seed=args.seed,
+                            record_dir=args.record_dir, metrics_dir=args.metrics_dir,
+                            early_stop=SPRT(args.alpha, args.alpha, args.margin) if args.sprt else None,
+                            results_db=args.results_db, batch=args.batch)
     
     # Setup
-    tournament.setup_agents()
+    tournament.setup_agents(mcts_simulations=args.mcts_sims)
+    for engine in args.engine:
+        name, _, command = engine.partition("=")
+        tournament.add_agent(name, partial(ExternalEngineAgent, shlex.split(command)))
     
     # Run
-    tournament.run()
+    if args.swiss:
+        tournament.run_swiss(workers=args.workers)
+    else:
+        tournament.run(workers=args.workers)
     
     # Display results
     tournament.print_standings()
-    tournament.print_head_to_head_matrix()
+    tournament.print_ratings()
+    if len(tournament.agents) <= 10:
+        tournament.print_head_to_head_matrix()
+    tournament.print_latency()
     
     # Save details
     tournament.save_detailed_results()
@@ -0,0 +1,31 @@
+from server.move_server import MoveServer, MoveService
+import argparse
+import asyncio
+
+
+def main():
+    """Serve moves over HTTP/JSON until interrupted."""
+    parser = argparse.ArgumentParser(description="Local move server (see server/move_server.py)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2,
+                        help="Processes for Minimax and MCTS searches")
+    parser.add_argument("--q-table", default="results/q_table.qtb",
+                        help="Q-table for the qlearning agent")
+    parser.add_argument("--compile", action="store_true",
+                        help="Precompute Heuristic and Minimax moves for every position")
+    args = parser.parse_args()
+
+    service = MoveService(args.q_table, workers=args.workers, compile_policies=args.compile)
+    server = MoveServer(service, args.host, args.port)
+    print(f"Serving moves on http://{args.host}:{args.port} (POST /move, GET /stats)")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Client for the move server (server/move_server.py).
+
+One MoveClient holds one keep-alive HTTP connection, so a session pays
+the connection setup once. Not thread-safe: use a client per thread.
+"""
+
+import http.client
+import json
+
+
+class MoveServerError(RuntimeError):
+    """The server rejected a request."""
+
+
+class MoveClient:
+
+    def __init__(self, host="127.0.0.1", port=8765, timeout=30.0):
+        self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _request(self, method, path, data=None):
+        body = json.dumps(data) if data is not None else None
+        headers = {'Content-Type': 'application/json'} if body else {}
+        self.connection.request(method, path, body, headers)
+        response = self.connection.getresponse()
+        reply = json.loads(response.read())
+        if response.status != 200:
+            raise MoveServerError(f"{response.status}: {reply.get('error')}")
+        return reply
+
+    def move(self, board, agent='minimax', player=None, budget=None):
+        """
+        Ask for a move.
+
+        Returns:
+            dict: move, agent, source, elapsed_us and counters
+        """
+        request = {'board': list(board), 'agent': agent}
+        if player is not None:
+            request['player'] = player
+        if budget is not None:
+            request['budget'] = budget
+        return self._request('POST', '/move', request)
+
+    def stats(self):
+        return self._request('GET', '/stats')
+
+    def health(self):
+        return self._request('GET', '/health')
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
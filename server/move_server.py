@@ -0,0 +1,332 @@
+"""
+Local move server: HTTP/JSON moves for many concurrent sessions.
+
+    POST /move   {"board": [9 cells], "player": 1, "agent": "minimax", "budget": 500}
+              -> {"move": 4, "agent": "minimax", "source": "cache", "elapsed_us": 12.5,
+                  "counters": {...}}
+    GET /stats   request counts, throughput, per-agent latency percentiles,
+                 counters and cache sizes
+    GET /health  {"ok": true}
+
+Bad requests get a 400 reply and unexpected failures (e.g. a crashed
+worker pool) a 500, both with {"error": ...}; the connection is only
+closed when the request's body can't be delimited.
+
+Cells use TicTacToe.board's convention (0 empty, 1 X, -1 O); player
+defaults to the side to move by piece count and budget is MCTS
+simulations (ignored by the other agents).
+
+Every session shares one set of process-wide caches instead of building
+its own agents: the loaded Q-table, and a move table per deterministic
+agent (Heuristic, Minimax), optionally compiled for every position at
+startup. Cheap moves (cache hits, Heuristic, Q-table and Random lookups)
+are answered on the event loop. Searches (Minimax misses, MCTS) run on a
+pool of worker processes so they don't block other sessions, and
+concurrent requests for the same uncached position share one search.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from agents.cached_policy import CachedPolicy, compile_policy
+from agents.heuristic_agent import HeuristicAgent
+from agents.mcts_agent import MCTSAgent
+from agents.minimax_agent import MinimaxAgent
+from agents.qlearning_agent import QLearningAgent
+from agents.random_agent import RandomAgent
+from game.board import TicTacToe
+from tournament.metrics import LatencyHistogram, agent_counters, counter_delta, merge_counters
+
+AGENTS = ('random', 'heuristic', 'minimax', 'qlearning', 'mcts')
+MAX_BUDGET = 100_000  # MCTS simulations per request
+MAX_BODY = 1 << 16
+
+
+class BadRequest(ValueError):
+    """The request can't be answered (reported to the client as 400)."""
+
+
+def parse_request(data):
+    """
+    Validate a /move request.
+
+    Returns:
+        tuple: (TicTacToe with the position, agent name, budget)
+    """
+    if not isinstance(data, dict):
+        raise BadRequest("expected a JSON object")
+    board = data.get('board')
+    if (not isinstance(board, list) or len(board) != 9
+            or any(cell not in (-1, 0, 1) or isinstance(cell, bool) for cell in board)):
+        raise BadRequest("board must be a list of 9 cells (0, 1 or -1)")
+    agent = data.get('agent', 'minimax')
+    if agent not in AGENTS:
+        raise BadRequest(f"agent must be one of {', '.join(AGENTS)}")
+    budget = data.get('budget', 1000)
+    if not isinstance(budget, int) or not 1 <= budget <= MAX_BUDGET:
+        raise BadRequest(f"budget must be an integer from 1 to {MAX_BUDGET}")
+    player = data.get('player', 1 if board.count(1) == board.count(-1) else -1)
+    if player not in (1, -1):
+        raise BadRequest("player must be 1 or -1")
+
+    game = TicTacToe()
+    game.board = list(board)
+    game.current_player = player
+    if game.is_game_over():
+        raise BadRequest("the game is over")
+    return game, agent, budget
+
+
+def search(agent_name, board, player, budget):
+    """
+    Worker-process search for one position.
+
+    Returns:
+        tuple: (move, counters)
+    """
+    if agent_name == 'mcts':
+        agent = MCTSAgent(player, num_simulations=budget)
+    else:
+        agent = MinimaxAgent(player)
+    game = TicTacToe()
+    game.board = list(board)
+    game.current_player = player
+    move = agent.get_move(game)
+    return move, agent_counters(agent)
+
+
+class MoveService:
+    """The caches, worker pool and counters behind the server."""
+
+    def __init__(self, q_table_path="results/q_table.qtb", workers=2, compile_policies=False):
+        """
+        Args:
+            q_table_path (str): Q-table for the qlearning agent (None: not served)
+            workers (int): Processes for searches
+            compile_policies (bool): Fill the Heuristic and Minimax tables
+                for every position at startup instead of as they're asked
+        """
+        self.qlearning = None
+        if q_table_path:
+            self.qlearning = QLearningAgent(player=1, epsilon=0)
+            self.qlearning.load_q_table(q_table_path)
+        if compile_policies:
+            self.policies = {'heuristic': compile_policy(HeuristicAgent(1)),
+                             'minimax': compile_policy(MinimaxAgent(1))}
+        else:
+            self.policies = {'heuristic': CachedPolicy(HeuristicAgent(1)),
+                             'minimax': CachedPolicy(None)}
+        self.random = RandomAgent(player=1)
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.pending = {}  # Search key -> future of the search in progress
+
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.latency = {name: LatencyHistogram() for name in AGENTS}
+        self.counters = {name: {} for name in AGENTS}
+        self.sources = {name: {} for name in AGENTS}  # Requests by source
+
+    async def move(self, game, agent, budget):
+        """Answer one position; returns the JSON-ready reply."""
+        start = time.perf_counter_ns()
+        self.in_flight += 1
+        try:
+            move, source, counters = await self._move(game, agent, budget)
+        finally:
+            self.in_flight -= 1
+        elapsed = time.perf_counter_ns() - start
+
+        self.requests += 1
+        self.latency[agent].record(elapsed)
+        merge_counters(self.counters[agent], counters)
+        self.sources[agent][source] = self.sources[agent].get(source, 0) + 1
+        return {'move': int(move), 'agent': agent, 'source': source,
+                'elapsed_us': elapsed / 1000, 'counters': counters}
+
+    async def _move(self, game, agent, budget):
+        player = game.current_player
+        if agent == 'random':
+            return self.random.get_move(game), 'inline', {}
+        if agent == 'qlearning':
+            if self.qlearning is None:
+                raise BadRequest("no Q-table loaded")
+            return self._inline(self.qlearning, game)
+        if agent == 'mcts':
+            return await self._search(agent, game, budget)
+
+        policy = self.policies[agent]
+        key = (tuple(game.board), player)
+        move = policy.cache.get(key)
+        if move is not None:
+            policy.hits += 1
+            return move, 'cache', {'cache_hits': 1}
+        if agent == 'heuristic':  # Cheaper than a trip to a worker
+            move, _, counters = self._inline(policy, game)
+            return move, 'inline', counters
+        policy.misses += 1
+        move, source, counters = await self._search(agent, game, budget)
+        policy.cache[key] = move
+        counters['cache_misses'] = 1
+        return move, source, counters
+
+    def _inline(self, agent, game):
+        before = agent_counters(agent)
+        agent.player = game.current_player
+        move = agent.get_move(game)
+        return move, 'inline', counter_delta(agent_counters(agent), before)
+
+    async def _search(self, agent, game, budget):
+        """Run a search on the pool, sharing it with identical requests in flight."""
+        key = (agent, tuple(game.board), game.current_player, budget if agent == 'mcts' else None)
+        if key in self.pending:
+            move, _ = await asyncio.shield(self.pending[key])
+            return move, 'shared', {}
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.pool, search, agent, game.board,
+                                      game.current_player, budget)
+        self.pending[key] = future
+        try:
+            move, counters = await future
+        finally:
+            del self.pending[key]
+        return move, 'worker', counters
+
+    def stats(self):
+        uptime = time.monotonic() - self.started
+        return {
+            'uptime_s': uptime,
+            'requests': self.requests,
+            'errors': self.errors,
+            'in_flight': self.in_flight,
+            'requests_per_s': self.requests / uptime if uptime else 0.0,
+            'agents': {
+                name: {'requests': self.latency[name].count,
+                       'sources': self.sources[name],
+                       'latency': self.latency[name].to_dict(),
+                       'counters': self.counters[name]}
+                for name in AGENTS if self.latency[name].count
+            },
+            'cache_sizes': {name: len(policy.cache) for name, policy in self.policies.items()},
+        }
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+class MoveServer:
+    """Minimal HTTP/1.1 front end (keep-alive, JSON bodies) for a MoveService."""
+
+    def __init__(self, service, host="127.0.0.1", port=8765):
+        self.service = service
+        self.host = host
+        self.port = port
+        self.server = None
+        self.loop = None
+
+    async def start(self):
+        """Start listening (port 0 picks a free port, stored in self.port)."""
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(self._connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            try:
+                await self.server.serve_forever()
+            except asyncio.CancelledError:
+                pass  # stop()
+
+    async def _connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = (request_line.decode('latin-1').split() + ['', '', ''])[:3]
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # The body can't be skipped without its length, so close after replying
+                    self.service.errors += 1
+                    status, reply = 400, {'error': "bad Content-Length"}
+                    keep_alive = False
+                elif length > MAX_BODY:
+                    status, reply = 413, {'error': "request too large"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, reply = await self._handle(method, path, body)
+                    keep_alive = (headers.get('connection', '').lower() != 'close'
+                                  and version != 'HTTP/1.0')
+
+                payload = json.dumps(reply).encode()
+                writer.write(f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                             f"Content-Type: application/json\r\n"
+                             f"Content-Length: {len(payload)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                             .encode() + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, method, path, body):
+        """Returns: (status, JSON-ready reply)"""
+        service = self.service
+        if method == 'GET' and path == '/health':
+            return 200, {'ok': True}
+        if method == 'GET' and path == '/stats':
+            return 200, service.stats()
+        if method != 'POST' or path != '/move':
+            return 404, {'error': f"no route for {method} {path}"}
+        try:
+            game, agent, budget = parse_request(json.loads(body or b"null"))
+            return 200, await service.move(game, agent, budget)
+        except (BadRequest, json.JSONDecodeError, UnicodeDecodeError) as error:
+            service.errors += 1
+            return 400, {'error': str(error)}
+        except Exception as error:  # e.g. BrokenProcessPool: answer instead of dropping the client
+            service.errors += 1
+            return 500, {'error': f"{type(error).__name__}: {error}"}
+
+    def run_in_thread(self):
+        """
+        Serve from a background thread (for tests and embedding); returns
+        once the server is listening.
+        """
+        ready = threading.Event()
+
+        async def main():
+            await self.start()
+            ready.set()
+            await self.serve_forever()
+
+        thread = threading.Thread(target=asyncio.run, args=(main(),), daemon=True)
+        thread.start()
+        ready.wait()
+        return thread
+
+    def stop(self):
+        """Stop serving (from any thread)."""
+        if self.server is not None:
+            self.loop.call_soon_threadsafe(self.server.close)
@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+from agents.heuristic_agent import HeuristicAgent
+from agents.random_agent import RandomAgent
+from tournament.async_runner import AsyncMatchup, run_matchup
+from tournament.matchup import Matchup
+
+
+class SlowAgent:
+    """Random agent whose move arrives after an awaited delay, like a remote engine."""
+
+    def __init__(self, delay, player=1):
+        self.player = player
+        self.delay = delay
+        self.random = RandomAgent(player)
+
+    def reseed(self, rng):
+        self.random.reseed(rng)
+
+    async def get_move(self, game):
+        await asyncio.sleep(self.delay)
+        return self.random.get_move(game)
+
+
+class IllegalAgent:
+    def __init__(self, player=1):
+        self.player = player
+
+    def get_move(self, game):
+        return 4  # Taken after the first two moves at the latest
+
+
+class FlakyAgent:
+    """Random agent whose third move (over all its games) raises, like a failing engine."""
+
+    def __init__(self, player=1):
+        self.player = player
+        self.random = RandomAgent(player, rng=0)
+        self.moves = 0
+
+    def reseed(self, rng):
+        self.random.reseed(rng)
+
+    def get_move(self, game):
+        self.moves += 1
+        if self.moves == 3:
+            raise RuntimeError("engine failed")
+        return self.random.get_move(game)
+
+
+class LateAgent(RandomAgent):
+    def get_move(self, game):
+        time.sleep(0.06)  # Can't be interrupted, so forfeits once it returns
+        return super().get_move(game)
+
+
+print("=== Same games as Matchup for plain agents ===")
+matchup = Matchup(RandomAgent(1), HeuristicAgent(-1), 'Random', 'Heuristic',
+                  games_per_side=40, seed=5)
+matchup.run()
+concurrent = run_matchup(lambda: RandomAgent(1), lambda: HeuristicAgent(1), 'Random', 'Heuristic',
+                         games_per_side=40, seed=5, concurrency=16)
+print(concurrent.get_summary())
+assert concurrent.results == matchup.results
+assert concurrent.games_played == 80 and concurrent.latency['Heuristic'].count > 0
+
+print("\n=== Many slow games in flight ===")
+start = time.perf_counter()
+slow = run_matchup(lambda: SlowAgent(0.02), lambda: RandomAgent(1), 'Slow', 'Random',
+                   games_per_side=150, seed=1, concurrency=200)
+seconds = time.perf_counter() - start
+moves = slow.latency['Slow'].count
+print(f"{slow.total_games()} games, {moves} slow moves in {seconds:.2f}s "
+      f"({moves * 0.02:.1f}s back to back), {slow.max_in_flight} in flight, "
+      f"{slow.pools['Slow'].created} instances")
+assert slow.total_games() == 300 and slow.max_in_flight == 200
+assert seconds < moves * 0.02 / 10
+
+bounded = run_matchup(lambda: SlowAgent(0.001), lambda: RandomAgent(1), 'Slow', 'Random',
+                      games_per_side=50, concurrency=8)
+assert bounded.max_in_flight == 8 and bounded.pools['Slow'].created <= 8
+
+print("\n=== Timeouts and illegal moves forfeit ===")
+late = AsyncMatchup(lambda: SlowAgent(1.0), lambda: RandomAgent(1), 'Late', 'Random',
+                    games_per_side=10, concurrency=20, move_timeout=0.05)
+asyncio.run(late.run())
+print(late.metrics()['agents']['Late']['forfeits'])
+assert late.results['agent2_wins'] == 20 and late.forfeits['Late']['timeout'] == 20
+# Cancelled instances aren't reused (checked before close() empties the pools)
+assert late.pools['Late'].idle == [] and late.pools['Late'].discarded == 20
+late.close()
+
+illegal = run_matchup(IllegalAgent, lambda: RandomAgent(1), 'Illegal', 'Random',
+                      games_per_side=10, seed=2)
+print(illegal.metrics()['agents']['Illegal']['forfeits'])
+assert illegal.results['agent2_wins'] == 20 and illegal.forfeits['Illegal']['illegal'] == 20
+
+print("\n=== Errors forfeit too, and late moves aren't timed ===")
+flaky = AsyncMatchup(FlakyAgent, lambda: RandomAgent(1), 'Flaky', 'Random',
+                     games_per_side=10, seed=3, concurrency=4)
+asyncio.run(flaky.run())
+pool = flaky.pools['Flaky']
+print(flaky.metrics()['agents']['Flaky']['forfeits'], f"{pool.created} instances, "
+      f"{pool.discarded} discarded, {len(pool.idle)} idle")
+assert flaky.total_games() == 20 and flaky.forfeits['Flaky']['error'] > 0
+assert pool.discarded == flaky.forfeits['Flaky']['error']  # Failed instances aren't reused
+assert pool.created == pool.discarded + len(pool.idle)
+flaky.close()
+
+slow_sync = run_matchup(lambda: LateAgent(1), lambda: RandomAgent(1), 'Late', 'Random',
+                        games_per_side=2, concurrency=4, move_timeout=0.05)
+assert slow_sync.forfeits['Late']['timeout'] == 4 and slow_sync.latency['Late'].count == 0
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from agents.cached_policy import compile_policy
+from agents.heuristic_agent import HeuristicAgent
+from agents.mcts_agent import MCTSAgent
+from agents.minimax_agent import MinimaxAgent
+from agents.qlearning_agent import QLearningAgent
+from agents.random_agent import RandomAgent
+from game.board import TicTacToe
+from game.encoding import reachable_positions
+from tournament.matchup import Matchup
+from tournament.records import GameRecordWriter, read_games
+
+print("=== get_moves agrees with get_move on every position ===")
+positions = reachable_positions()
+policy = compile_policy(MinimaxAgent(player=1))
+
+q_agent = QLearningAgent(player=1, rng=0)
+q_agent.q_table = {(0,) * 9: {4: 1.0, 0: 0.5}, (1, 0, 0, 0, -1, 0, 0, 0, 0): {8: 0.2, 2: 0.2}}
+
+for player in (1, -1):
+    games = [game for game in positions if game.current_player == player]
+    boards = np.array([game.board for game in games], dtype=np.int8)
+
+    heuristic = HeuristicAgent(player)
+    assert heuristic.get_moves(boards).tolist() == [heuristic.get_move(game) for game in games]
+
+    policy.player = player
+    assert policy.get_moves(boards).tolist() == [policy.get_move(game) for game in games]
+
+    minimax = MinimaxAgent(player)  # Searches each new position once, so check a sample
+    sample = slice(None, None, 8)
+    assert minimax.get_moves(boards[sample]).tolist() == policy.get_moves(boards[sample]).tolist()
+    nodes = minimax.nodes_explored
+    minimax.get_moves(boards[sample])
+    assert minimax.nodes_explored == nodes  # Looked up, not searched again
+
+    random_agent = RandomAgent(player, rng=1)
+    moves = random_agent.get_moves(boards)
+    assert (boards[np.arange(len(games)), moves] == 0).all()
+
+    q_agent.player = player
+    moves = q_agent.get_moves(boards)
+    for game, move in zip(games, moves):
+        row = q_agent.q_table.get(q_agent.transform_state(game.board), {})
+        best = max(row.get(cell, 0) for cell in game.get_legal_moves())
+        assert game.board[move] == 0 and row.get(move, 0) == best
+    print(f"Player {player}: {len(games)} positions OK")
+
+first = np.zeros((1, 9), dtype=np.int8)
+q_agent.player = 1
+assert q_agent.get_moves(first).tolist() == [4]
+tied = np.array([[1, 0, 0, 0, -1, 0, 0, 0, 0]] * 200, dtype=np.int8)
+assert set(q_agent.get_moves(tied).tolist()) == {2, 8}  # Ties broken randomly
+
+print("\n=== Lockstep matchups ===")
+path = os.path.join(tempfile.mkdtemp(), "games.ttr")
+with GameRecordWriter(path) as recorder:
+    matchup = Matchup(HeuristicAgent(1), RandomAgent(-1, rng=0), 'Heuristic', 'Random',
+                      games_per_side=200, seed=3, recorder=recorder, batch=True)
+    matchup.run()
+print(matchup.get_summary())
+assert matchup.total_games() == matchup.games_played == 400
+assert matchup.results['agent1_wins'] > matchup.results['agent2_wins']
+assert matchup.latency['Random'].count > 0 and matchup.latency['Heuristic'].count > 0
+
+records = list(read_games(path))
+assert len(records) == 400
+for moves, winner in records:  # Every recorded game replays legally to its result
+    game = TicTacToe()
+    for move in moves:
+        assert game.board[move] == 0
+        game.make_move(move)
+    assert game.is_game_over() and game.check_winner() == winner
+x_wins = sum(winner == 1 for _, winner in records[:200])
+assert x_wins == matchup.results['agent1_as_x_wins']
+
+rerun = Matchup(HeuristicAgent(1), RandomAgent(-1), 'Heuristic', 'Random',
+                games_per_side=200, seed=3, batch=True)
+assert rerun.run() == matchup.results  # Seeded lockstep runs repeat
+
+# Deterministic pairs and agents without get_moves use the per-game loop
+matchup = Matchup(HeuristicAgent(1), policy, 'Heuristic', 'Minimax', games_per_side=50, batch=True)
+matchup.run()
+assert matchup.games_played == 2 and matchup.total_games() == 100
+
+fallback = Matchup(MCTSAgent(1, num_simulations=50), RandomAgent(-1), 'MCTS', 'Random',
+                   games_per_side=5, seed=1, batch=True)
+fallback.run()
+assert fallback.games_played == 10
+
+lockstep = Matchup(MinimaxAgent(1), RandomAgent(-1), 'Minimax', 'Random',
+                   games_per_side=200, seed=1, batch=True)
+lockstep.run()
+print(f"Minimax vs Random in lockstep: {lockstep.results}")
+assert lockstep.results['agent2_wins'] == 0 and lockstep.total_games() == 400
+
+print("\n=== Throughput ===")
+timings = {}
+for batch in (False, True):
+    matchup = Matchup(RandomAgent(1), RandomAgent(-1), 'Random 1', 'Random 2',
+                      games_per_side=2000, batch=batch)
+    start = time.perf_counter()
+    matchup.run()
+    timings[batch] = time.perf_counter() - start
+    print(f"batch={batch}: {4000 / timings[batch]:,.0f} games/s")
+assert timings[False] > 5 * timings[True]
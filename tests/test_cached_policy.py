@@ -0,0 +1,37 @@
+from game.board import TicTacToe
+from game.encoding import reachable_positions
+from agents.cached_policy import CachedPolicy, compile_policy
+from agents.heuristic_agent import HeuristicAgent
+from agents.random_agent import RandomAgent
+import time
+
+print("=== Compile Heuristic ===")
+heuristic = HeuristicAgent(player=1)
+start = time.time()
+compiled = compile_policy(heuristic)
+print(f"Compiled {len(compiled.cache)} positions in {time.time() - start:.2f}s")
+assert len(compiled.cache) == len(reachable_positions())
+
+# Compiled moves match the agent everywhere
+for game in reachable_positions():
+    heuristic.player = game.current_player
+    compiled.player = game.current_player
+    assert compiled.get_move(game) == heuristic.get_move(game)
+print(f"All moves match, hit rate {compiled.stats()['hit_rate'] * 100:.1f}%")
+
+print("\n=== Array export round trip ===")
+table = compiled.to_array()
+restored = CachedPolicy.from_array(table)
+assert dict(restored.cache) == dict(compiled.cache)
+print(f"Table: {table.shape} {table.dtype}, {table.nbytes:,} bytes")
+
+print("\n=== Bounded LRU ===")
+lru = CachedPolicy(HeuristicAgent(player=1), maxsize=30)
+opponent = RandomAgent(player=-1)
+for i in range(200):
+    game = TicTacToe()
+    while not game.is_game_over():
+        agent = lru if game.current_player == 1 else opponent
+        game.make_move(agent.get_move(game))
+assert len(lru.cache) <= 30
+print(lru.stats())
@@ -0,0 +1,33 @@
+from training.convergence import ConvergenceTracker
+from training.solver import solve_q_table
+
+tracker = ConvergenceTracker()
+exact = solve_q_table('minimax')
+
+print("=== The exact table converged, an empty one didn't ===")
+perfect = tracker.update(exact)
+print(f"Exact: {perfect}")
+assert perfect['agreement'] == 1.0 and perfect['mae'] == 0.0
+assert perfect['positions'] == len(exact)
+
+tracker.mark_all_dirty()
+empty = tracker.update({})
+print(f"Empty: {empty}")
+assert empty['agreement'] < 1.0 and empty['mae'] > 0.0
+
+x_side = tracker.update({}, side=1)
+o_side = tracker.update({}, side=-1)
+assert x_side['positions'] + o_side['positions'] == len(exact)
+
+print("\n=== Only dirty positions are recomputed ===")
+tracker = ConvergenceTracker(reference=exact)
+tracker.update(exact)
+state = next(s for s, actions in exact.items() if len(set(actions.values())) > 1)
+worst = min(exact[state], key=exact[state].get)
+learned = dict(exact)
+learned[state] = {worst: 1.0}  # Greedy now picks a losing move
+assert tracker.update(learned) == perfect  # Not marked yet
+tracker.mark_dirty([state, (9,) * 9])  # Unknown states are ignored
+changed = tracker.update(learned)
+print(f"One position changed: {changed}")
+assert changed['agreement'] == 1.0 - 1 / len(exact) and changed['mae'] > 0.0
@@ -0,0 +1,84 @@
+import sys
+
+from agents.external_engine import EngineError, EnginePool, ExternalEngineAgent
+from agents.heuristic_agent import HeuristicAgent
+from agents.random_agent import RandomAgent
+from agents.reference_engine import command
+from game.board import TicTacToe
+from tournament.async_runner import run_matchup
+from tournament.matchup import Matchup
+
+print("=== Reference engine plays like the agent it wraps ===")
+with EnginePool(command('heuristic')) as pool:
+    engine = ExternalEngineAgent(command('heuristic'), pool=pool)
+    print(f"{engine.fingerprint()}, deterministic={engine.deterministic}")
+    assert engine.fingerprint() == "ExternalEngine:HeuristicAgent" and engine.deterministic
+
+    local = Matchup(HeuristicAgent(1), RandomAgent(-1), 'Heuristic', 'Random',
+                    games_per_side=20, seed=4)
+    remote = Matchup(engine, RandomAgent(-1), 'Heuristic', 'Random',
+                     games_per_side=20, seed=4)
+    assert remote.run() == local.run()
+    engine.close()
+    print(f"{remote.total_games()} games on {pool.started} engine process")
+    assert pool.started == 1 and len(pool.idle) == 1
+
+print("\n=== Crashed and dead engines are replaced ===")
+with EnginePool(command('minimax')) as pool:
+    engine = ExternalEngineAgent(command('minimax'), pool=pool)
+    game = TicTacToe()
+    game.make_move(0)
+    engine.player = -1
+    assert engine.get_move(game) == 4
+    assert engine.counters()['nodes'] > 0
+
+    engine._process.process.kill()  # Crash mid-game
+    game.make_move(8)
+    game.make_move(engine.get_move(game))
+    assert engine.restarts == 1 and pool.restarts == 1
+    engine.close()
+
+    pool.idle[0].process.kill()  # Dies while idle: the health check catches it
+    process = pool.acquire()
+    assert process.ping() and pool.restarts == 2 and pool.started == 3
+    pool.release(process)
+
+print("\n=== Hung engines time out ===")
+HUNG = [sys.executable, "-c",
+        "import sys\n"
+        "for line in sys.stdin:\n"
+        "    if line.startswith('go'): continue\n"
+        "    print('hello 1 Hung' if line.startswith('hello') else 'ok', flush=True)\n"]
+with EnginePool(HUNG) as pool:
+    engine = ExternalEngineAgent(HUNG, pool=pool, movetime=50, grace=0.2)
+    try:
+        engine.get_move(TicTacToe())
+        raise AssertionError("Expected a timeout")
+    except TimeoutError:
+        pass
+    assert engine.restarts == 1 and pool.started == 2
+
+try:
+    EnginePool([sys.executable, "-c", "print('nope')"]).acquire()
+    raise AssertionError("Expected a handshake error")
+except EngineError as error:
+    print(f"Bad handshake: {error}")
+
+print("\n=== Seeded stochastic engine, and moves in flight concurrently ===")
+mcts = command('mcts', '--simulations', '30')
+with EnginePool(mcts) as pool:
+    runs = []
+    for _ in range(2):
+        matchup = Matchup(ExternalEngineAgent(mcts, pool=pool), RandomAgent(-1), 'MCTS', 'Random',
+                          games_per_side=5, seed=9)
+        runs.append(matchup.run())
+        matchup.agent1.close()
+    assert runs[0] == runs[1]
+
+    concurrent = run_matchup(lambda: ExternalEngineAgent(mcts, pool=pool, asynchronous=True),
+                             lambda: RandomAgent(1), 'MCTS', 'Random',
+                             games_per_side=10, seed=9, concurrency=4)
+    print(concurrent.get_summary())
+    print(f"Engine processes started: {pool.started}, counters: {concurrent.counters['MCTS']}")
+    assert concurrent.total_games() == 20 and 1 < pool.started <= 5
+    assert concurrent.counters['MCTS']['rollouts'] > 0
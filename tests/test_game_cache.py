@@ -0,0 +1,41 @@
+from agents.heuristic_agent import HeuristicAgent
+from agents.minimax_agent import MinimaxAgent
+from agents.qlearning_agent import QLearningAgent
+from agents.random_agent import RandomAgent
+from tournament.matchup import GameCache, Matchup
+
+print("=== Deterministic pairing: one game per side ===")
+matchup = Matchup(MinimaxAgent(player=1), HeuristicAgent(player=-1), "Minimax", "Heuristic",
+                  games_per_side=100)
+results = matchup.run()
+print(f"Played {matchup.games_played} games for {results}")
+assert matchup.games_played == 2
+assert results['agent1_wins'] + results['agent2_wins'] + results['draws'] == 200
+
+print("\n=== Reversed pairing reuses the cached games ===")
+cache = GameCache()
+Matchup(MinimaxAgent(player=1), HeuristicAgent(player=-1), "Minimax", "Heuristic",
+        games_per_side=100, cache=cache).run()
+reverse = Matchup(HeuristicAgent(player=1), MinimaxAgent(player=-1), "Heuristic", "Minimax",
+                  games_per_side=100, cache=cache)
+reverse.run()
+print(f"Played {reverse.games_played} games, cache hits: {cache.hits}")
+assert reverse.games_played == 0
+
+print("\n=== Greedy Q-Learning is repeatable only without random tie-breaks ===")
+qlearning = QLearningAgent(player=1, epsilon=0)
+qlearning.load_q_table("results/q_table.qtb")
+matchup = Matchup(qlearning, MinimaxAgent(player=-1), "Q-Learning", "Minimax", games_per_side=100)
+matchup.run()
+print(f"Played {matchup.games_played} games, Q-Learning random choices: {qlearning.random_choices}")
+
+print("\n=== Seeded stochastic games are cached per seed ===")
+cache = GameCache()
+first = Matchup(RandomAgent(player=1), HeuristicAgent(player=-1), "Random", "Heuristic",
+                games_per_side=50, seed=3, cache=cache)
+first.run()
+again = Matchup(RandomAgent(player=1), HeuristicAgent(player=-1), "Random", "Heuristic",
+                games_per_side=50, seed=3, cache=cache)
+again.run()
+assert again.results == first.results and again.games_played == 0
+print(f"Replayed 100 seeded games from the cache: {again.results}")
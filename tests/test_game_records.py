@@ -0,0 +1,45 @@
+import os
+import random
+import tempfile
+
+from game.board import TicTacToe
+from tournament.records import GameRecordWriter, encode_game, read_games, summarize
+
+print("=== Round trip of 10,000 random games ===")
+games = []
+for _ in range(10000):
+    game = TicTacToe()
+    while not game.is_game_over():
+        game.make_move(random.choice(game.get_legal_moves()))
+    games.append((game.moves, game.check_winner()))
+
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, "games.ttr")
+with GameRecordWriter(path) as writer:
+    for moves, winner in games:
+        writer.write(moves, winner)
+
+assert list(read_games(path, chunk_size=1000)) == games
+print(f"{os.path.getsize(path) / len(games):.2f} bytes per game, {summarize(path)}")
+
+print("\n=== Appending and a torn last frame ===")
+with GameRecordWriter(path) as writer:
+    writer.write([4, 0, 8], 0)
+with open(path, 'ab') as f:
+    f.write(encode_game([0, 1, 2, 3, 4, 5, 6], 1)[:2])  # Interrupted write
+records = list(read_games(path))
+assert len(records) == len(games) + 1 and records[-1] == ([4, 0, 8], 0)
+print(f"Read {len(records)} games, torn frame skipped")
+
+with GameRecordWriter(path) as writer:  # Appending after the torn frame
+    writer.write([0, 3, 1, 4, 2], 1)
+records = list(read_games(path))
+assert len(records) == len(games) + 2 and records[-2:] == [([4, 0, 8], 0), ([0, 3, 1, 4, 2], 1)]
+print("Torn frame cut off before appending")
+
+print("\n=== Larger boards use a byte per move ===")
+big = os.path.join(directory, "big.ttr")
+with GameRecordWriter(big, size=15, win_length=5) as writer:
+    writer.write([112, 0, 224, 13], 0)
+assert list(read_games(big)) == [([112, 0, 224, 13], 0)]
+print("OK")
@@ -31,4 +31,58 @@ for i in range(100):
 
 print(f"Heuristic wins: {heuristic_wins}%")
 print(f"Random wins: {random_wins}%")
-print(f"Draws: {draws}%")
\ No newline at end of file
+print(f"Draws: {draws}%")
+
+print("\n=== Threat index matches a full scan of every line ===")
+import random
+
+from agents.heuristic_agent import board_geometry
+from game.board import winning_lines
+
+
+def scanned_move(agent, game):
+    """Reference move: win, block, then the first free priority cell, by full scans."""
+    lines = winning_lines(game.size, game.win_length)
+    for player in (agent.player, -agent.player):
+        move = agent.find_winning_move(game.board, player, lines)
+        if move is not None:
+            return move
+    return next(cell for cell in board_geometry(game.size, game.win_length)[2]
+                if game.board[cell] == 0)
+
+
+rng = random.Random(0)
+for size, win_length, games in ((3, 3, 300), (4, 3, 100), (15, 5, 10)):
+    checked = forced = 0
+    for _ in range(games):
+        game = TicTacToe(size, win_length)
+        agent = HeuristicAgent(player=rng.choice([1, -1]))  # Follows the whole game
+        while not game.is_game_over():
+            if game.current_player == agent.player:
+                move = agent.get_move(game)
+                assert move == scanned_move(agent, game), (size, game.moves)
+                fresh = HeuristicAgent(player=agent.player)  # Rebuilds mid-game
+                assert fresh.get_move(game) == move
+                checked += 1
+                forced += any(agent.find_winning_move(game.board, player,
+                                                      winning_lines(size, win_length)) is not None
+                              for player in (1, -1))
+                if rng.random() < 0.5:  # Otherwise play randomly to reach varied positions
+                    game.make_move(move)
+                    continue
+            game.make_move(rng.choice(game.get_legal_moves()))
+    print(f"{size}x{size}, k={win_length}: {checked} positions agree ({forced} win or block)")
+    assert forced > 0
+
+print("\n=== Larger boards play from the center outwards ===")
+priority = board_geometry(15, 5)[2]
+assert priority[0] == 112 and set(priority[1:9]) == {96, 97, 98, 111, 113, 126, 127, 128}
+assert {0, 14, 210, 224} <= set(priority[-4:])  # Corners come last
+game = TicTacToe(15, 5)
+agent = HeuristicAgent(player=1)
+for corner in (0, 14, 210):  # O wastes its moves in the corners
+    game.make_move(agent.get_move(game))
+    game.make_move(corner)
+print(f"Opening moves on 15x15: {game.moves}")
+assert game.moves[0] == 112
+assert all(max(abs(cell // 15 - 7), abs(cell % 15 - 7)) == 1 for cell in game.moves[2::2])
@@ -0,0 +1,24 @@
+from agents.qlearning_agent import QLearningAgent
+from training.league import LeagueTrainer
+from training.solver import losing_positions, solve_q_table
+
+print("=== A gauntlet without losses doesn't stop training ===")
+trainer = LeagueTrainer(seed=0)
+trainer.evaluate = lambda: {'Random': 0, 'Heuristic': 0, 'Minimax': 0}
+episodes = trainer.train(max_episodes=300, eval_every=100)
+mistakes = len(losing_positions(trainer.learner.q_table))
+print(f"{episodes} episodes, {mistakes} losing positions")
+assert mistakes > 0 and episodes == 300
+
+print("\n=== No losing positions stops it ===")
+learner = QLearningAgent(player=1, epsilon=0.3)
+learner.q_table = solve_q_table(opponent='minimax')
+trainer = LeagueTrainer(learner=learner, seed=0)
+episodes = trainer.train(max_episodes=300, eval_every=5, epsilon_start=0, epsilon_end=0)
+assert episodes == 5 and losing_positions(learner.q_table) == []
+
+print("\n=== Converges well within the 75k-episode baseline ===")
+trainer = LeagueTrainer(seed=0)
+episodes = trainer.train(max_episodes=20000)
+print(f"Non-losing after {episodes:,} episodes")
+assert episodes < 20000 and losing_positions(trainer.learner.q_table) == []
@@ -0,0 +1,40 @@
+from agents.mcts_agent import MCTSAgent
+from agents.minimax_agent import MinimaxAgent
+from agents.random_agent import RandomAgent
+from tournament.matchup import Matchup
+from tournament.metrics import LatencyHistogram
+
+print("=== Histogram percentiles ===")
+histogram = LatencyHistogram()
+for ns in range(1, 100001):
+    histogram.record(ns * 10)
+summary = histogram.to_dict()
+print(summary)
+assert summary['moves'] == 100000
+for p, key in ((50, 'p50_us'), (95, 'p95_us'), (99, 'p99_us')):
+    exact = p / 100 * 1000
+    assert abs(summary[key] - exact) / exact < 0.07, key
+
+print("\n=== Merged histograms match one histogram ===")
+a, b = LatencyHistogram(), LatencyHistogram()
+for ns in range(1, 50001):
+    a.record(ns * 10)
+for ns in range(50001, 100001):
+    b.record(ns * 10)
+a.merge(b)
+assert a.to_dict() == summary
+
+print("\n=== Matchup reports latency and search counters ===")
+matchup = Matchup(MCTSAgent(player=1, num_simulations=50), MinimaxAgent(player=-1),
+                  "MCTS", "Minimax", games_per_side=3, seed=1)
+matchup.run()
+metrics = matchup.metrics()
+print(metrics)
+mcts, minimax = metrics['agents']['MCTS'], metrics['agents']['Minimax']
+assert mcts['counters']['rollouts'] > 0 and minimax['counters']['nodes'] > 0
+assert 5 * matchup.games_played <= mcts['latency']['moves'] + minimax['latency']['moves'] <= 9 * matchup.games_played
+
+print("\n=== Agents without counters report none ===")
+matchup = Matchup(RandomAgent(player=1), RandomAgent(player=-1), "A", "B", games_per_side=5, seed=2)
+matchup.run()
+assert matchup.metrics()['agents']['A']['counters'] == {}
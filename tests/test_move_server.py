@@ -0,0 +1,122 @@
+import random
+import socket
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+from agents.minimax_agent import MinimaxAgent
+from game.board import TicTacToe
+from server.client import MoveClient, MoveServerError
+from server.move_server import MoveServer, MoveService
+
+service = MoveService(workers=2)
+server = MoveServer(service, port=0)
+server.run_in_thread()
+client = MoveClient(port=server.port)
+assert client.health() == {'ok': True}
+
+print("=== Moves, cached after the first search ===")
+empty = [0] * 9
+first = client.move(empty, 'minimax')
+again = client.move(empty, 'minimax')
+print(first, again, sep="\n")
+assert first['move'] == again['move'] == MinimaxAgent(1).get_move(TicTacToe())
+assert first['source'] == 'worker' and first['counters']['nodes'] > 0
+assert again['source'] == 'cache'
+
+board = [1, 0, 0, 0, -1, 0, 0, 0, 0]
+for agent in ('heuristic', 'qlearning', 'random', 'mcts'):
+    reply = client.move(board, agent, budget=200)
+    assert board[reply['move']] == 0, reply
+    print(f"{agent}: {reply['move']} ({reply['source']})")
+
+print("\n=== Identical concurrent requests share one search ===")
+position = [0, 0, 0, 0, 0, 0, 0, 0, 1]
+replies = []
+
+
+def ask():
+    with MoveClient(port=server.port) as session:
+        replies.append(session.move(position, 'minimax'))
+
+
+threads = [threading.Thread(target=ask) for _ in range(20)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+sources = [reply['source'] for reply in replies]
+print({source: sources.count(source) for source in set(sources)})
+assert len({reply['move'] for reply in replies}) == 1
+assert sources.count('worker') == 1 and len(replies) == 20
+
+print("\n=== Bad requests ===")
+for request in ({'board': [0] * 8}, {'board': empty, 'agent': 'alphazero'},
+                {'board': [1, 1, 1, -1, -1, 0, 0, 0, 0]}, {'board': empty, 'budget': 0}):
+    try:
+        client._request('POST', '/move', request)
+        raise AssertionError(f"Accepted {request}")
+    except MoveServerError as error:
+        print(error)
+assert client.health() == {'ok': True}  # The connection survives errors
+
+print("\n=== Many sessions playing full games ===")
+
+
+def session(seed, games=5):
+    rng = random.Random(seed)
+    with MoveClient(port=server.port) as session_client:
+        for _ in range(games):
+            game = TicTacToe()
+            while not game.is_game_over():
+                if game.current_player == 1:
+                    move = session_client.move(game.board, 'minimax')['move']
+                else:
+                    move = rng.choice(game.get_legal_moves())
+                assert game.make_move(move)
+            assert game.check_winner() != -1  # Minimax never loses
+
+
+start = time.perf_counter()
+threads = [threading.Thread(target=session, args=(seed,)) for seed in range(16)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+seconds = time.perf_counter() - start
+
+stats = client.stats()
+print(f"{stats['requests']} requests, {stats['requests_per_s']:.0f}/s overall, "
+      f"80 games in {seconds:.2f}s")
+minimax = stats['agents']['minimax']
+print(f"minimax: {minimax['sources']}, p50 {minimax['latency']['p50_us']:.0f}us, "
+      f"p99 {minimax['latency']['p99_us']:.0f}us, cache {stats['cache_sizes']['minimax']}")
+assert stats['errors'] == 4 and stats['in_flight'] == 0
+assert minimax['sources']['cache'] > minimax['sources']['worker']
+assert stats['agents']['mcts']['counters']['rollouts'] == 200
+
+print("\n=== Malformed headers and failing workers get a reply ===")
+for length in (b"abc", b"-5"):
+    with socket.create_connection(("127.0.0.1", server.port)) as raw:
+        raw.sendall(b"POST /move HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n")
+        reply = raw.recv(4096).decode()
+    print(reply.splitlines()[0], reply.rsplit("\n", 1)[-1])
+    assert reply.startswith("HTTP/1.1 400") and "Content-Length" in reply
+
+
+async def broken_search(agent, game, budget):
+    raise BrokenProcessPool("a worker died")
+
+
+service._search = broken_search
+try:
+    client.move([0, 0, 0, 0, 0, 0, 0, 1, -1], 'minimax')
+    raise AssertionError("Expected a 500")
+except MoveServerError as error:
+    print(error)
+    assert str(error).startswith("500")
+assert client.health() == {'ok': True} and service.errors == 7 and service.in_flight == 0
+
+client.close()
+server.stop()
+service.close()
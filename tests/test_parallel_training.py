@@ -0,0 +1,26 @@
+import numpy as np
+
+from training.parallel import merge_deltas, split_episodes, train_parallel
+from training.vectorized import new_q_arrays
+
+# Episodes are split without dropping the remainder
+assert split_episodes(10, 4) == [3, 3, 2, 2]
+assert split_episodes(3, 4) == [1, 1, 1, 0]
+
+# Deltas are weighted by each worker's visit counts
+q_values, visits = new_q_arrays()
+q_values[0, 4] = 1.0
+merge_deltas(q_values, visits, [
+    {'keys': np.array([4, 13]), 'deltas': np.array([0.4, 1.0]), 'counts': np.array([30, 2])},
+    {'keys': np.array([4]), 'deltas': np.array([-0.4]), 'counts': np.array([10])},
+    {'keys': np.array([], dtype=np.int64), 'deltas': np.array([]), 'counts': np.array([], dtype=np.int64)},
+])
+print(f"Merged: Q(0, 4) = {q_values[0, 4]:.2f}, Q(1, 4) = {q_values[1, 4]:.2f}")
+assert np.isclose(q_values[0, 4], 1.0 + (30 * 0.4 - 10 * 0.4) / 40)
+assert np.isclose(q_values[1, 4], 1.0)
+assert visits[0, 4] == 40 and visits[1, 4] == 2
+
+# Fewer episodes than workers: idle workers, no division by zero
+agent = train_parallel(num_episodes=6, workers=4, seed=0)
+print(f"States after 9 episodes: {len(agent.q_table)}")
+assert 0 < len(agent.q_table)
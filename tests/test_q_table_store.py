@@ -0,0 +1,43 @@
+import os
+import tempfile
+
+from agents.qlearning_agent import QLearningAgent
+from agents.q_table_store import convert_pickle, load_binary
+
+# Build a small table by hand
+agent = QLearningAgent(player=1)
+agent.q_table = {
+    (0, 0, 0, 0, 0, 0, 0, 0, 0): {4: 0.25, 0: -0.5},
+    (1, -1, 0, 0, 0, 0, 0, 0, 0): {8: 1.0},
+}
+
+with tempfile.TemporaryDirectory() as tmp:
+    pickle_path = os.path.join(tmp, "q_table.pkl")
+    binary_path = os.path.join(tmp, "q_table.qtb")
+
+    agent.save_q_table(pickle_path)
+    convert_pickle(pickle_path, binary_path)
+
+    table = load_binary(binary_path)
+    print(f"States: {len(table)}")
+    print(f"Empty board row: {table[(0,) * 9]}")
+    print(f"Unknown state present: {(0, 1, 0, 0, 0, 0, 0, 0, 0) in table}")
+
+    assert len(table) == 2
+    assert table[(0,) * 9] == {0: -0.5, 4: 0.25}
+    assert (0, 1, 0, 0, 0, 0, 0, 0, 0) not in table
+    assert table.to_dict() == agent.q_table
+    assert table[(0,) * 9] is table[(0,) * 9]  # Decoded once
+    assert table.get((0, 1, 0, 0, 0, 0, 0, 0, 0)) is None
+    copy = table.to_dict()
+    copy[(0,) * 9][4] = 2.0  # Training a copy leaves the mapped rows alone
+    assert table[(0,) * 9][4] == 0.25
+
+    # A loaded agent plays straight from the mapped file
+    loaded = QLearningAgent(player=1)
+    loaded.load_q_table(binary_path)
+    print(f"Best opening move: {loaded.get_best_move((0,) * 9, list(range(9)))}")
+    assert loaded.get_best_move((0,) * 9, list(range(9))) == 4
+
+    table.close()
+    loaded.q_table.close()
@@ -0,0 +1,29 @@
+from agents.qlearning_agent import QLearningAgent
+
+empty = (0,) * 9
+history = [
+    (empty, 4),
+    ((0, 0, 0, 0, 1, 0, 0, 0, -1), 0),
+    ((1, 0, -1, 0, 1, 0, 0, 0, -1), 1),
+]
+
+print("=== Q(λ) vs one-step update on a single won game ===")
+opening_values = {}
+for td_lambda in (None, 0.0, 0.9):
+    agent = QLearningAgent(player=1, td_lambda=td_lambda)
+    agent.history = list(history)
+    agent.learn(reward=1)
+    opening_values[td_lambda] = agent.q_table[empty][4]
+    print(f"td_lambda={td_lambda}: Q(empty, 4) = {opening_values[td_lambda]:.6f}")
+
+# Q(0) only updates the last move on the first game
+assert opening_values[0.0] == 0
+assert opening_values[0.9] > opening_values[None]
+
+# An exploratory (non-greedy) move cuts the trace
+agent = QLearningAgent(player=1, td_lambda=0.9)
+agent.q_table[history[1][0]] = {2: 0.5}  # Greedy move was 2, but 0 was played
+agent.history = list(history)
+agent.learn(reward=1)
+print(f"After exploratory move: Q(empty, 4) = {agent.q_table[empty][4]:.6f}")
+assert agent.q_table[empty][4] == 0.1 * 0.9 * 0.5
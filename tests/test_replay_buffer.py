@@ -0,0 +1,46 @@
+from agents.qlearning_agent import QLearningAgent
+from agents.replay_buffer import ReplayBuffer, TERMINAL
+from game.encoding import encode_board
+
+# FIFO eviction keeps the newest transitions
+buffer = ReplayBuffer(capacity=3)
+for i in range(5):
+    buffer.add(i, i % 9, 0.0, TERMINAL)
+print(f"FIFO buffer after 5 adds: {sorted(buffer.states.tolist())}")
+assert len(buffer) == 3
+assert sorted(buffer.states.tolist()) == [2, 3, 4]
+
+# A replayed winning game pushes value into the first move
+empty = (0,) * 9
+history = [
+    (empty, 4),
+    ((0, 0, 0, 0, 1, 0, 0, 0, -1), 0),
+    ((1, 0, -1, 0, 1, 0, 0, 0, -1), 1),
+]
+
+agent = QLearningAgent(player=1, replay_buffer=ReplayBuffer(capacity=100, seed=0),
+                       replay_ratio=20, replay_batch_size=16)
+agent.history = list(history)
+agent.learn(reward=1)
+
+plain = QLearningAgent(player=1)
+plain.history = list(history)
+plain.learn(reward=1)
+
+print(f"Buffered transitions: {len(agent.replay_buffer)}")
+print(f"Q(empty, 4) with replay:    {agent.q_table[empty][4]:.4f}")
+print(f"Q(empty, 4) without replay: {plain.q_table[empty][4]:.4f}")
+assert len(agent.replay_buffer) == 3
+assert agent.replay_buffer.next_states[0] == encode_board(history[1][0])
+assert agent.q_table[empty][4] > plain.q_table[empty][4]
+
+# One batched update: the best legal next value, duplicates merged
+next_state = (0, 0, 0, 0, 1, 0, 0, 0, -1)
+exact = QLearningAgent(player=1, learning_rate=0.1, discount_factor=0.9,
+                       replay_buffer=ReplayBuffer(capacity=2, seed=0), replay_batch_size=4)
+exact.q_table = {next_state: {0: 0.5, 4: 2.0, 8: 3.0}}  # 4 and 8 are taken
+exact.replay_buffer.add(encode_board(empty), 4, 0.0, encode_board(next_state))
+exact.replay(4)
+expected = (1 - 0.9 ** 4) * 0.9 * 0.5
+print(f"Q(empty, 4) after one batch: {exact.q_table[empty][4]:.4f} (expected {expected:.4f})")
+assert abs(exact.q_table[empty][4] - expected) < 1e-12
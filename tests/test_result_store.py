@@ -0,0 +1,85 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from functools import partial
+
+from agents.heuristic_agent import HeuristicAgent
+from agents.mcts_agent import MCTSAgent
+from agents.minimax_agent import MinimaxAgent
+from agents.random_agent import RandomAgent
+from tournament.runner import Tournament
+from tournament.store import ResultStore
+
+AGENTS = {
+    'Random': partial(RandomAgent, player=1),
+    'Heuristic': partial(HeuristicAgent, player=1),
+    'MCTS-20': partial(MCTSAgent, player=1, num_simulations=20),
+}
+
+
+def league(results_db, agents):
+    tournament = Tournament(games_per_side=10, seed=7, results_db=results_db)
+    with redirect_stdout(io.StringIO()):
+        for name, factory in agents.items():
+            tournament.add_agent(name, factory)
+        tournament.run()
+    played = int(tournament.table.games_played.sum())
+    tournament.store.close()
+    return tournament, played
+
+
+with tempfile.TemporaryDirectory() as directory:
+    results_db = os.path.join(directory, "league.db")
+
+    print("=== First run plays every matchup ===")
+    first, played = league(results_db, AGENTS)
+    print(f"{len(first.table.pairs())} matchups, {played} games played")
+    with ResultStore(results_db) as store:
+        assert len(store) == 6
+
+    print("\n=== Rerun restores everything ===")
+    again, _ = league(results_db, AGENTS)
+    print(f"MCTS rollouts this run: {again.agents['MCTS-20'].rollouts}")
+    assert again.agents['MCTS-20'].rollouts == 0
+    assert again.standings == first.standings
+    assert (again.table.outcomes == first.table.outcomes).all()
+
+    print("\n=== A new agent only plays its own matchups ===")
+    extended, _ = league(results_db, dict(AGENTS, Minimax=partial(MinimaxAgent, player=1)))
+    with ResultStore(results_db) as store:
+        print(f"{len(store)} matchups stored")
+        assert len(store) == 12
+    for name1, name2 in first.table.pairs():
+        assert extended.matchup_results(name1, name2) == first.matchup_results(name1, name2)
+
+    print("\n=== Different settings are stored separately ===")
+    tournament = Tournament(games_per_side=5, seed=7, results_db=results_db)
+    with redirect_stdout(io.StringIO()):
+        for name, factory in AGENTS.items():
+            tournament.add_agent(name, factory)
+        tournament.run()
+    assert len(tournament.store) == 18
+    tournament.store.close()
+
+    print("\n=== Agents sharing a fingerprint ===")
+    twins = {'H1': partial(HeuristicAgent, player=1), 'H2': partial(HeuristicAgent, player=1),
+             'Random': partial(RandomAgent, player=1)}
+    twins_db = os.path.join(directory, "twins.db")
+    tournament = Tournament(games_per_side=10, results_db=twins_db)  # Unseeded
+    with redirect_stdout(io.StringIO()):
+        for name, factory in twins.items():
+            tournament.add_agent(name, factory)
+        tournament.run()
+        tournament.store.close()
+    output = io.StringIO()
+    with redirect_stdout(output):
+        rerun = Tournament(games_per_side=10, results_db=twins_db)
+        for name, factory in twins.items():
+            rerun.add_agent(name, factory)
+        rerun.run()
+    rerun.store.close()
+    print(rerun.standings)
+    assert "Restored 6 of 6 matchups" in output.getvalue()
+    assert rerun.standings['H1']['games'] == rerun.standings['H2']['games'] == 80
+    assert rerun.latency['H2'].count == rerun.latency['H1'].count > 0
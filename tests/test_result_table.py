@@ -0,0 +1,56 @@
+import math
+
+from agents.heuristic_agent import HeuristicAgent
+from agents.mcts_agent import MCTSAgent
+from agents.random_agent import RandomAgent
+from tournament.matchup import Matchup
+from tournament.results import ResultTable
+
+AGENTS = {
+    'Random': lambda: RandomAgent(player=1),
+    'Heuristic': lambda: HeuristicAgent(player=1),
+    'MCTS-10': lambda: MCTSAgent(player=1, num_simulations=10),
+}
+
+print("=== Table matches the matchups it was built from ===")
+table = ResultTable()
+for name in AGENTS:
+    table.add_agent(name)
+
+matchups = {}
+for name1 in AGENTS:
+    for name2 in AGENTS:
+        if name1 != name2:
+            matchup = Matchup(AGENTS[name1](), AGENTS[name2](), name1, name2,
+                              games_per_side=15, seed=len(matchups))
+            matchup.run()
+            table.add(name1, name2, matchup.results, matchup.games_played)
+            matchups[name1, name2] = matchup
+
+for (name1, name2), matchup in matchups.items():
+    assert table.results(name1, name2) == matchup.results
+
+standings = table.standings()
+for name in AGENTS:
+    wins = sum(m.results['agent1_wins'] for (a, _), m in matchups.items() if a == name) + \
+        sum(m.results['agent2_wins'] for (_, b), m in matchups.items() if b == name)
+    games = sum(m.total_games() for pair, m in matchups.items() if name in pair)
+    print(f"{name}: {standings[name]}")
+    assert standings[name]['wins'] == wins and standings[name]['games'] == games
+
+rates = table.win_rates()
+for (name1, name2), matchup in matchups.items():
+    i, j = table.index[name1], table.index[name2]
+    assert math.isclose(rates[i, j], matchup.results['agent1_wins'] / matchup.total_games())
+
+print("\n=== Unplayed pairs ===")
+table = ResultTable()
+for name in ('A', 'B', 'C'):
+    table.add_agent(name)
+table.add('A', 'B', {'agent1_as_x_wins': 3, 'draws_as_x': 1, 'agent2_as_o_wins': 0,
+                     'agent1_as_o_wins': 1, 'draws_as_o': 2, 'agent2_as_x_wins': 1})
+rates = table.win_rates()
+print(rates)
+assert rates[0, 1] == 0.5 and rates[1, 0] == 0.125  # B's rate comes from the A vs B matchup
+assert math.isnan(rates[0, 2]) and table.results('A', 'C') is None
+assert table.pairs() == [('A', 'B')]
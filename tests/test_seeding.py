@@ -0,0 +1,42 @@
+from game.board import TicTacToe
+from game.rng import spawn_seeds
+from agents.random_agent import RandomAgent
+from agents.mcts_agent import MCTSAgent
+from agents.qlearning_agent import QLearningAgent
+from tournament.matchup import Matchup
+
+print("=== Same seed, same matchup results ===")
+runs = []
+for _ in range(2):
+    matchup = Matchup(MCTSAgent(player=1, num_simulations=50), RandomAgent(player=-1, prefetch=16),
+                      "MCTS", "Random", games_per_side=20, seed=42)
+    runs.append(matchup.run())
+assert runs[0] == runs[1]
+print(runs[0])
+
+print("\n=== A single game replays exactly from its own seed ===")
+seeds = spawn_seeds(7, 10)
+matchup = Matchup(RandomAgent(player=1), RandomAgent(player=-1), "A", "B", seed=7)
+first = [matchup.play_game(matchup.agent1, matchup.agent2, seed) for seed in seeds]
+again = [matchup.play_game(matchup.agent1, matchup.agent2, seed) for seed in reversed(seeds)]
+assert first == again[::-1]
+print(f"Winners: {first}")
+
+print("\n=== Seeded Q-Learning training is bit-identical ===")
+tables = []
+for _ in range(2):
+    agent = QLearningAgent(player=1, epsilon=0.3, rng=123)
+    opponent = RandomAgent(player=-1, rng=agent.rng)
+    for _ in range(300):
+        game = TicTacToe()
+        agent.reset_history()
+        while not game.is_game_over():
+            if game.current_player == 1:
+                move = agent.get_move(game, training=True)
+            else:
+                move = opponent.get_move(game)
+            game.make_move(move)
+        agent.learn(reward=game.check_winner())
+    tables.append(agent.q_table)
+assert tables[0] == tables[1]
+print(f"{len(tables[0])} states, identical")
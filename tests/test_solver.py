@@ -0,0 +1,50 @@
+from game.board import TicTacToe
+from agents.qlearning_agent import QLearningAgent
+from agents.random_agent import RandomAgent
+from agents.minimax_agent import MinimaxAgent
+from training.solver import game_value, solve_q_table
+
+print(f"Value of the empty board: {game_value((0,) * 9)}")
+assert game_value((0,) * 9) == 0
+
+agent = QLearningAgent(player=1, epsilon=0)
+agent.q_table = solve_q_table(opponent='minimax')
+print(f"Solved states: {len(agent.q_table):,}")
+
+# Solved table vs Minimax, both sides
+for agent_player in (1, -1):
+    game = TicTacToe()
+    agent.player = agent_player
+    minimax = MinimaxAgent(player=-agent_player)
+
+    while not game.is_game_over():
+        if game.current_player == agent_player:
+            move = agent.get_move(game)
+        else:
+            move = minimax.get_move(game)
+        game.make_move(move)
+
+    print(f"Solved agent as {'X' if agent_player == 1 else 'O'} vs Minimax: "
+          f"{'draw' if game.check_winner() == 0 else 'decisive'}")
+    assert game.check_winner() == 0
+
+# Solved table vs Random never loses
+losses = 0
+for i in range(200):
+    agent_player = 1 if i % 2 == 0 else -1
+    game = TicTacToe()
+    agent.player = agent_player
+    random_agent = RandomAgent(player=-agent_player)
+
+    while not game.is_game_over():
+        if game.current_player == agent_player:
+            move = agent.get_move(game)
+        else:
+            move = random_agent.get_move(game)
+        game.make_move(move)
+
+    if game.check_winner() == -agent_player:
+        losses += 1
+
+print(f"Losses vs Random in 200 games: {losses}")
+assert losses == 0
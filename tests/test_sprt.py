@@ -0,0 +1,65 @@
+import random
+
+from agents.heuristic_agent import HeuristicAgent
+from agents.minimax_agent import MinimaxAgent
+from agents.random_agent import RandomAgent
+from tournament.matchup import Matchup
+from tournament.stats import SPRT, wilson_interval
+
+print("=== Wilson interval ===")
+low, high = wilson_interval(50, 100)
+print(f"50/100: {low:.3f}-{high:.3f}")
+assert abs(low - 0.404) < 0.001 and abs(high - 0.596) < 0.001
+assert wilson_interval(0, 10)[0] == 0.0 and wilson_interval(10, 10)[1] == 1.0
+assert wilson_interval(0, 0) == (0.0, 1.0)
+
+print("\n=== Decisions on clear results ===")
+sprt = SPRT()
+assert sprt.decide(5, 0, 0) is None  # Below min_games
+assert sprt.decide(10, 0, 0) == 'agent1'
+assert sprt.decide(0, 0, 10) == 'agent2'
+assert sprt.decide(0, 20, 0) == 'even'
+assert sprt.decide(5, 0, 5) is None
+
+print("\n=== Error rate on evenly matched coin flips ===")
+rng = random.Random(0)
+wrong = 0
+runs = 400
+for _ in range(runs):
+    wins = draws = losses = 0
+    for game in range(1000):
+        outcome = rng.random()
+        if outcome < 0.3:
+            wins += 1
+        elif outcome < 0.6:
+            losses += 1
+        else:
+            draws += 1
+        decision = sprt.decide(wins, draws, losses)
+        if decision is not None:
+            break
+    wrong += decision in ('agent1', 'agent2')
+print(f"Declared a winner in {wrong} of {runs} even matchups")
+assert wrong / runs < 2 * sprt.alpha
+
+print("\n=== Matchup stops early ===")
+matchup = Matchup(HeuristicAgent(player=1), RandomAgent(player=-1), "Heuristic", "Random",
+                  games_per_side=100, seed=1, early_stop=SPRT())
+results = matchup.run()
+print(matchup.get_summary())
+assert matchup.decision == 'agent1'
+assert matchup.total_games() < 200
+assert results['agent1_as_x_wins'] + results['draws_as_x'] + results['agent2_as_o_wins'] == \
+    matchup.total_games() // 2
+
+print("=== Early-stopped games are a prefix of the full matchup ===")
+full = Matchup(HeuristicAgent(player=1), RandomAgent(player=-1), "Heuristic", "Random",
+               games_per_side=matchup.total_games() // 2, seed=1)
+assert full.run() == results
+
+print("\n=== Deterministic pairing is decided as even ===")
+matchup = Matchup(MinimaxAgent(player=1), MinimaxAgent(player=-1), "A", "B",
+                  games_per_side=100, early_stop=SPRT())
+matchup.run()
+print(f"{matchup.total_games()} games, {matchup.games_played} played: {matchup.decision}")
+assert matchup.decision == 'even' and matchup.games_played <= 2
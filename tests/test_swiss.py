@@ -0,0 +1,67 @@
+import io
+import math
+import random
+from contextlib import redirect_stdout
+from functools import partial
+
+from agents.heuristic_agent import HeuristicAgent
+from agents.mcts_agent import MCTSAgent
+from agents.random_agent import RandomAgent
+from tournament.ratings import Ratings
+from tournament.runner import Tournament
+from tournament.stats import SPRT
+from tournament.swiss import swiss_pairs
+
+print("=== Bradley-Terry fit ===")
+ratings = Ratings(['A', 'B', 'C'])
+ratings.add('A', 'B', 30, 40)  # A scores 75% against B
+ratings.add('B', 'C', 30, 40)
+ratings.fit()
+for name, elo, stderr, games in ratings.table():
+    print(f"{name}: {elo:+.0f} ± {stderr:.0f} ({games} games)")
+assert ratings.ranking() == ['A', 'B', 'C']
+assert abs(ratings.elo('A') + ratings.elo('B') + ratings.elo('C')) < 1e-6
+assert 0.6 < ratings.expected_score('A', 'B') < 0.75  # Pulled toward even by the prior
+
+print("\n=== Perfect records stay finite ===")
+ratings = Ratings()
+ratings.add('Winner', 'Loser', 100, 100)
+ratings.fit()
+print(f"Winner {ratings.elo('Winner'):+.0f}, Loser {ratings.elo('Loser'):+.0f}")
+assert math.isfinite(ratings.elo('Winner'))
+
+print("\n=== Swiss pairs never repeat ===")
+ranking = ['A', 'B', 'C', 'D', 'E']
+assert swiss_pairs(ranking, set()) == [('A', 'B'), ('C', 'D')]
+assert swiss_pairs(ranking, {frozenset(('A', 'B'))}) == [('A', 'C'), ('B', 'D')]
+
+print("\n=== Swiss rounds recover a simulated league ===")
+rng = random.Random(0)
+strength = {f"Agent{i}": rng.gauss(0, 300) for i in range(64)}
+ratings = Ratings(strength)
+played = set()
+for _ in range(8):
+    for name1, name2 in swiss_pairs(ratings.ranking(), played):
+        expected = 1 / (1 + 10 ** ((strength[name2] - strength[name1]) / 400))
+        ratings.add(name1, name2, sum(rng.random() < expected for _ in range(40)), 40)
+        played.add(frozenset((name1, name2)))
+    ratings.fit()
+top = sorted(strength, key=strength.get, reverse=True)[:8]
+print(f"{len(played)} of {64 * 63 // 2} pairs played; true top 8 in rated top 12: "
+      f"{len(set(top) & set(ratings.ranking()[:12]))}")
+assert len(played) <= 8 * 32
+assert len(set(top) & set(ratings.ranking()[:12])) >= 7
+
+print("\n=== Tournament.run_swiss ===")
+tournament = Tournament(games_per_side=20, seed=1, early_stop=SPRT())
+with redirect_stdout(io.StringIO()):
+    tournament.add_agent('Random', partial(RandomAgent, player=1))
+    tournament.add_agent('Heuristic', partial(HeuristicAgent, player=1))
+    for simulations in (2, 10, 50):
+        tournament.add_agent(f"MCTS-{simulations}",
+                             partial(MCTSAgent, player=1, num_simulations=simulations))
+    tournament.run_swiss()
+    tournament.print_head_to_head_matrix()  # Unplayed pairs are left blank
+tournament.print_ratings()
+assert len(tournament.table.pairs()) < 5 * 4
+assert 'Heuristic' in tournament.ratings.ranking()[:2]
@@ -0,0 +1,18 @@
+from functools import partial
+from agents.mcts_agent import MCTSAgent
+from tournament.runner import Tournament
+
+print("=== Seeded tournament: 1 process vs 2 workers ===")
+runs = {}
+for workers in (None, 2):
+    tournament = Tournament(games_per_side=5, q_table_path="results/q_table.qtb",
+                            compile_policies=True, seed=11)
+    tournament.setup_agents()
+    # Fewer simulations to keep the test quick
+    tournament.factories['MCTS'] = partial(MCTSAgent, player=1, num_simulations=100)
+    tournament.agents['MCTS'] = tournament.factories['MCTS']()
+    tournament.run(workers=workers)
+    runs[workers] = tournament.standings
+
+assert runs[None] == runs[2]
+print("Standings identical")
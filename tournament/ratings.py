@@ -0,0 +1,147 @@
+"""
+Bradley-Terry ratings for leagues too large to play round-robin.
+
+Ratings are the maximum a posteriori fit to matchup scores (wins +
+draws / 2), found by Newton's method warm-started from the previous
+fit, so adding a round of results takes a couple of iterations rather
+than a fresh solve. Each agent also plays one virtual draw against a
+fixed 0-rated opponent, which keeps perfect records finite and pulls
+agents with few games toward the middle.
+
+Ratings are reported on the Elo scale (400 points = 10:1 odds) relative
+to the field's average, with standard errors from the inverse of the
+fit's Hessian. Only differences between agents are well determined, so
+the errors are those of each rating against the average.
+"""
+
+import math
+
+import numpy as np
+
+_ELO = 400 / math.log(10)
+
+
+class Ratings:
+    """Bradley-Terry strengths, refit as matchup results come in."""
+
+    def __init__(self, names=(), prior_games=1.0):
+        """
+        Args:
+            names: Agents to rate (more can be added later)
+            prior_games (float): Weight of each agent's virtual draw
+        """
+        self.prior_games = prior_games
+        self.names = []
+        self.index = {}
+        self.rating = np.zeros(0)  # Natural-log strengths, in names order
+        self.covariance = np.zeros((0, 0))
+        self.opponents = {}  # Name -> {opponent: [score, games]}
+        for name in names:
+            self.add_agent(name)
+
+    def add_agent(self, name):
+        if name not in self.index:
+            self.index[name] = len(self.names)
+            self.names.append(name)
+            self.opponents[name] = {}
+            self.rating = np.append(self.rating, 0.0)
+            self.covariance = np.diag(np.append(np.diag(self.covariance),
+                                                4.0 / self.prior_games))
+
+    def add(self, name1, name2, score1, games):
+        """Record games between two agents; score1 is name1's points (win 1, draw 0.5)."""
+        self.add_agent(name1)
+        self.add_agent(name2)
+        for name, opponent, score in ((name1, name2, score1), (name2, name1, games - score1)):
+            entry = self.opponents[name].setdefault(opponent, [0.0, 0])
+            entry[0] += score
+            entry[1] += games
+
+    def fit(self, tolerance=1e-6, max_iterations=50):
+        """
+        Update ratings to the maximum a posteriori fit.
+
+        Returns:
+            int: Newton iterations taken
+        """
+        n = len(self.names)
+        games = np.zeros((n, n))
+        scores = np.full(n, self.prior_games / 2)
+        for name, opponents in self.opponents.items():
+            i = self.index[name]
+            for opponent, (points, count) in opponents.items():
+                games[i, self.index[opponent]] = count
+                scores[i] += points
+
+        rating = self.rating
+        for iteration in range(1, max_iterations + 1):
+            expected = 1 / (1 + np.exp(rating[None, :] - rating[:, None]))
+            prior_expected = 1 / (1 + np.exp(-rating))
+            gradient = scores - (games * expected).sum(axis=1) - self.prior_games * prior_expected
+
+            weights = games * expected * expected.T
+            hessian = weights.copy()
+            np.fill_diagonal(hessian, -weights.sum(axis=1)
+                             - self.prior_games * prior_expected * (1 - prior_expected))
+            step = np.linalg.solve(hessian, gradient)
+            rating = rating - step
+            if np.abs(step).max() < tolerance:
+                break
+
+        self.rating = rating
+        self.covariance = np.linalg.inv(-hessian)
+        return iteration
+
+    def elo(self, name):
+        """Rating relative to the field's average, in Elo points."""
+        return _ELO * (self.rating[self.index[name]] - self.rating.mean())
+
+    def stderr(self, name):
+        """Standard error of elo(name), i.e. of the rating minus the average."""
+        i = self.index[name]
+        c = self.covariance
+        n = len(self.names)
+        variance = c[i, i] - 2 * c[i].mean() + c.mean()
+        return _ELO * math.sqrt(max(variance, 0.0)) if n > 1 else _ELO * math.sqrt(c[i, i])
+
+    def difference_stderr(self, name1, name2):
+        """Standard error of elo(name1) - elo(name2)."""
+        i, j = self.index[name1], self.index[name2]
+        c = self.covariance
+        return _ELO * math.sqrt(max(c[i, i] + c[j, j] - 2 * c[i, j], 0.0))
+
+    def games(self, name):
+        return sum(games for _, games in self.opponents[name].values())
+
+    def expected_score(self, name1, name2):
+        """Predicted score of name1 against name2 (0 to 1)."""
+        return 1 / (1 + math.exp(self.rating[self.index[name2]] - self.rating[self.index[name1]]))
+
+    def ranking(self):
+        """Agent names, highest rated first."""
+        return [self.names[i] for i in np.argsort(-self.rating, kind='stable')]
+
+    def significant_flips(self, previous, z=2.0):
+        """
+        Pairs ordered differently in previous (an earlier ranking) whose
+        current rating gap is more than z standard errors, i.e. rank
+        changes that aren't just reshuffled statistical ties.
+        """
+        position = {name: rank for rank, name in enumerate(previous)}
+        ranking = self.ranking()
+        flips = 0
+        for rank, name1 in enumerate(ranking):
+            for name2 in ranking[rank + 1:]:
+                if name1 in position and name2 in position and position[name1] > position[name2]:
+                    gap = self.elo(name1) - self.elo(name2)
+                    if gap > z * self.difference_stderr(name1, name2):
+                        flips += 1
+        return flips
+
+    def table(self):
+        """
+        Returns:
+            list: (name, elo, stderr, games) highest rated first
+        """
+        return [(name, self.elo(name), self.stderr(name), self.games(name))
+                for name in self.ranking()]
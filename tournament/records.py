@@ -0,0 +1,251 @@
+"""
+Compact append-only game records.
+
+File layout (little-endian):
+
+    offset  size   field
+    0       4      magic b"TTTR"
+    4       2      format version (1)
+    6       1      board size
+    7       1      win length
+    8       ...    one frame per game, back to back
+
+Each frame is a varint (LEB128) holding n_moves << 2 | result, where
+result is 0 for a draw, 1 for an X win and 2 for an O win, followed by
+the moves in play order. Boards of up to 16 cells pack two moves per
+byte (4 bits each, low nibble first), larger boards (up to 16x16) use
+one byte per move. A 3x3 game takes 3 to 6 bytes.
+
+Frames are never rewritten, so a file can be appended to by later runs
+and read while it grows; a torn last frame (interrupted write) is
+skipped by the reader and cut off by the next writer.
+"""
+
+import os
+import struct
+import sys
+
+MAGIC = b"TTTR"
+VERSION = 1
+HEADER = struct.Struct("<4sHBB")
+
+_RESULT_CODES = {0: 0, 1: 1, -1: 2}
+_WINNERS = (0, 1, -1)
+
+
+def _nibbles(size):
+    """True if moves on this board fit in 4 bits."""
+    if size * size > 256:
+        raise ValueError(f"Game records support boards up to 16x16, got {size}x{size}")
+    return size * size <= 16
+
+
+def encode_game(moves, winner, size=3):
+    """
+    Pack one game into a frame.
+
+    Args:
+        moves (list): Board indices in play order (game.moves)
+        winner (int): 1 X wins, -1 O wins, 0 draw
+
+    Returns:
+        bytes: The frame
+    """
+    meta = len(moves) << 2 | _RESULT_CODES[winner]
+    frame = bytearray()
+    while meta >= 0x80:
+        frame.append(meta & 0x7F | 0x80)
+        meta >>= 7
+    frame.append(meta)
+
+    if _nibbles(size):
+        for i in range(0, len(moves) - 1, 2):
+            frame.append(moves[i] | moves[i + 1] << 4)
+        if len(moves) % 2:
+            frame.append(moves[-1])
+    else:
+        frame.extend(moves)
+    return bytes(frame)
+
+
+def _decode_frame(data, pos, nibbles):
+    """
+    Decode the frame starting at pos.
+
+    Returns:
+        tuple: (moves, winner, next_pos), or None if the frame is incomplete
+    """
+    meta = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            return None
+        byte = data[pos]
+        pos += 1
+        meta |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            break
+
+    n_moves = meta >> 2
+    n_bytes = (n_moves + 1) // 2 if nibbles else n_moves
+    if pos + n_bytes > len(data):
+        return None
+
+    body = data[pos:pos + n_bytes]
+    if nibbles:
+        moves = []
+        for byte in body:
+            moves.append(byte & 0x0F)
+            moves.append(byte >> 4)
+        del moves[n_moves:]
+    else:
+        moves = list(body)
+    return moves, _WINNERS[meta & 3], pos + n_bytes
+
+
+class GameRecordBuffer:
+    """
+    In-memory frames, e.g. built in a worker process and appended to a
+    file by the coordinator with GameRecordWriter.write_frames.
+    """
+
+    def __init__(self, size=3):
+        self.size = size
+        self.data = bytearray()
+        self.games = 0
+
+    def write(self, moves, winner, count=1):
+        """Add a game (count times, for games known to repeat)."""
+        self.data += encode_game(moves, winner, self.size) * count
+        self.games += count
+
+
+class GameRecordWriter:
+    """
+    Append-only game record file.
+
+    Opens an existing file for appending (checking its header matches
+    and cutting off a torn last frame) or starts a new one. Writes go through the file's buffer, so
+    recording costs a few microseconds per game.
+    """
+
+    def __init__(self, filename, size=3, win_length=None):
+        self.filename = filename
+        self.size = size
+        self.win_length = win_length or size
+        _nibbles(size)
+
+        exists = os.path.exists(filename) and os.path.getsize(filename) > 0
+        if exists:
+            with open(filename, 'rb') as f:
+                header = _read_header(f)
+                if header != (self.size, self.win_length):
+                    raise ValueError(f"{filename} holds {header[0]}x{header[0]} games, "
+                                     f"not {size}x{size}")
+                end = HEADER.size
+                for *_, end in _frames(f, _nibbles(size)):
+                    pass
+            if end < os.path.getsize(filename):
+                # Drop a torn last frame, or new frames would be read as its tail
+                os.truncate(filename, end)
+
+        self.file = open(filename, 'ab')
+        if not exists:
+            self.file.write(HEADER.pack(MAGIC, VERSION, self.size, self.win_length))
+        self.games = 0
+
+    def write(self, moves, winner, count=1):
+        """Append a game (count times, for games known to repeat)."""
+        self.file.write(encode_game(moves, winner, self.size) * count)
+        self.games += count
+
+    def write_frames(self, data, games=0):
+        """Append frames already encoded for this board size."""
+        self.file.write(data)
+        self.games += games
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _read_header(f):
+    header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError("Not a game record file (too short)")
+    magic, version, size, win_length = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a game record file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported game record version {version}")
+    return size, win_length
+
+
+def read_games(filename, chunk_size=1 << 16):
+    """
+    Stream the games in a record file.
+
+    Reads chunk_size bytes at a time, so memory use does not grow with
+    the file.
+
+    Yields:
+        tuple: (moves, winner) per game, in the order they were written
+    """
+    with open(filename, 'rb') as f:
+        size, _ = _read_header(f)
+        for moves, winner, _ in _frames(f, _nibbles(size), chunk_size):
+            yield moves, winner
+
+
+def _frames(f, nibbles, chunk_size=1 << 16):
+    """
+    Decode frames from f's current position to the end.
+
+    Yields:
+        tuple: (moves, winner, file offset just past the frame)
+    """
+    data = b""
+    offset = f.tell()  # File offset of data[0]
+    while True:
+        chunk = f.read(chunk_size)
+        data = data + chunk if data else chunk
+        pos = 0
+        while True:
+            frame = _decode_frame(data, pos, nibbles)
+            if frame is None:
+                break
+            moves, winner, pos = frame
+            yield moves, winner, offset + pos
+        data = data[pos:]
+        offset += pos
+        if not chunk:
+            return  # Anything left is a torn last frame
+
+
+def summarize(filename):
+    """Count games and results in a record file."""
+    counts = {'games': 0, 'x_wins': 0, 'o_wins': 0, 'draws': 0, 'moves': 0}
+    for moves, winner in read_games(filename):
+        counts['games'] += 1
+        counts['moves'] += len(moves)
+        counts[{1: 'x_wins', -1: 'o_wins', 0: 'draws'}[winner]] += 1
+    return counts
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m tournament.records <file.ttr> [...]")
+        sys.exit(1)
+    for filename in sys.argv[1:]:
+        counts = summarize(filename)
+        games = counts['games'] or 1
+        print(f"{filename}: {counts['games']:,} games, "
+              f"X {counts['x_wins'] / games * 100:.1f}% / O {counts['o_wins'] / games * 100:.1f}% / "
+              f"draw {counts['draws'] / games * 100:.1f}%, "
+              f"{os.path.getsize(filename) / games:.2f} bytes per game")
@@ -0,0 +1,117 @@
+"""
+Fixed-size result counters for a whole league.
+
+ResultTable keeps one int32 count per (agent 1, agent 2, side, outcome):
+
+    outcomes[i, j, side, outcome]
+        i, j     agent 1 and agent 2 of the matchup i vs j
+        side     0: agent 1 played X, 1: agent 1 played O
+        outcome  0: agent 1 won, 1: draw, 2: agent 2 won
+
+Finished matchups are folded in and dropped, so memory depends only on
+the number of agents, and standings, win-rate matrices and per-matchup
+results are computed from the array on demand.
+"""
+
+import numpy as np
+
+AGENT1_WIN, DRAW, AGENT2_WIN = range(3)
+DECISIONS = (None, 'agent1', 'agent2', 'even')  # Codes stored in decisions
+
+
+class ResultTable:
+    """W/D/L counts per agent pair and side."""
+
+    def __init__(self):
+        self.names = []
+        self.index = {}
+        self.outcomes = np.zeros((0, 0, 2, 3), dtype=np.int32)
+        self.games_played = np.zeros((0, 0), dtype=np.int32)  # Played, not reused
+        self.decisions = np.zeros((0, 0), dtype=np.int8)  # DECISIONS codes
+
+    def add_agent(self, name):
+        if name in self.index:
+            return
+        self.index[name] = len(self.names)
+        self.names.append(name)
+        self.outcomes = np.pad(self.outcomes, ((0, 1), (0, 1), (0, 0), (0, 0)))
+        self.games_played = np.pad(self.games_played, ((0, 1), (0, 1)))
+        self.decisions = np.pad(self.decisions, ((0, 1), (0, 1)))
+
+    def add(self, name1, name2, results, games_played=0, decision=None):
+        """Fold in a matchup's results (Matchup.results format)."""
+        i, j = self.index[name1], self.index[name2]
+        self.outcomes[i, j] += [
+            [results['agent1_as_x_wins'], results['draws_as_x'], results['agent2_as_o_wins']],
+            [results['agent1_as_o_wins'], results['draws_as_o'], results['agent2_as_x_wins']],
+        ]
+        self.games_played[i, j] += games_played
+        self.decisions[i, j] = DECISIONS.index(decision)
+
+    def played(self):
+        """Boolean matrix: matchup i vs j has games."""
+        return self.outcomes.sum(axis=(2, 3)) > 0
+
+    def pairs(self):
+        """(name1, name2) of every matchup with games, row by row."""
+        return [(self.names[i], self.names[j]) for i, j in np.argwhere(self.played())]
+
+    def results(self, name1, name2):
+        """
+        A matchup's counts in Matchup.results format (None if unplayed).
+        """
+        counts = self.outcomes[self.index[name1], self.index[name2]]
+        if not counts.any():
+            return None
+        (x_win, x_draw, x_loss), (o_win, o_draw, o_loss) = counts.tolist()
+        return {
+            'agent1_wins': x_win + o_win,
+            'agent2_wins': x_loss + o_loss,
+            'draws': x_draw + o_draw,
+            'agent1_as_x_wins': x_win,
+            'agent1_as_o_wins': o_win,
+            'agent2_as_x_wins': o_loss,
+            'agent2_as_o_wins': x_loss,
+            'draws_as_x': x_draw,
+            'draws_as_o': o_draw,
+        }
+
+    def decision(self, name1, name2):
+        return DECISIONS[self.decisions[self.index[name1], self.index[name2]]]
+
+    def totals(self):
+        """
+        Per-agent wins, draws and losses over all matchups, either side.
+
+        Returns:
+            tuple: Three int arrays in names order
+        """
+        as_agent1 = self.outcomes.sum(axis=(1, 2))
+        as_agent2 = self.outcomes.sum(axis=(0, 2))
+        wins = as_agent1[:, AGENT1_WIN] + as_agent2[:, AGENT2_WIN]
+        draws = as_agent1[:, DRAW] + as_agent2[:, DRAW]
+        losses = as_agent1[:, AGENT2_WIN] + as_agent2[:, AGENT1_WIN]
+        return wins, draws, losses
+
+    def standings(self):
+        """Per-agent points (win 2, draw 1), wins, draws, losses and games."""
+        wins, draws, losses = self.totals()
+        return {
+            name: {'points': int(2 * wins[i] + draws[i]), 'wins': int(wins[i]),
+                   'draws': int(draws[i]), 'losses': int(losses[i]),
+                   'games': int(wins[i] + draws[i] + losses[i])}
+            for i, name in enumerate(self.names)
+        }
+
+    def win_rates(self):
+        """
+        Matrix of row agent's win rate against column agent, from their
+        matchup in that order, or the reverse one if only that was
+        played (NaN if they never met).
+        """
+        games = self.outcomes.sum(axis=(2, 3)).astype(float)
+        wins = self.outcomes[..., AGENT1_WIN].sum(axis=2)
+        reverse_wins = self.outcomes[..., AGENT2_WIN].sum(axis=2).T
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rates = np.where(games > 0, wins / games, reverse_wins / games.T)
+        return rates
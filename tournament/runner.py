@@ -3,169 +3,556 @@ from agents.heuristic_agent import HeuristicAgent
 from agents.minimax_agent import MinimaxAgent
 from agents.qlearning_agent import QLearningAgent
 from agents.mcts_agent import MCTSAgent
-from tournament.matchup import Matchup
+from agents.cached_policy import CachedPolicy, compile_policy
+from tournament.matchup import GameCache, Matchup, format_summary
+from tournament.records import GameRecordBuffer, GameRecordWriter
+from tournament.metrics import LatencyHistogram, merge_counters, write_json
+from tournament.stats import wilson_interval
+from tournament.ratings import Ratings
+from tournament.swiss import default_rounds, swiss_pairs
+from tournament.store import ResultStore
+from tournament.results import ResultTable
+from game.rng import child_seed
+from functools import partial
+import contextlib
+import hashlib
+import math
+import multiprocessing
+import os
+
+import numpy as np
+import random
 import time
 
+
+def load_qlearning_agent(q_table_path, player=1):
+    """Greedy Q-Learning agent with a trained table (picklable factory)."""
+    qlearning = QLearningAgent(player=player)
+    qlearning.load_q_table(q_table_path)
+    qlearning.epsilon = 0  # No exploration
+    return qlearning
+
+
+def compiled_agent(factory):
+    """Build an agent and compile it into a lookup table (picklable factory)."""
+    return compile_policy(factory())
+
+
+_worker_agents = {}  # Per-process agents, built once from their factories
+_worker_cache = GameCache()  # Per-process game results
+
+
+def _init_worker():
+    # Forked workers inherit the parent's global random state; unseeded
+    # agents would otherwise draw identical streams in every process
+    random.seed()
+
+
+def _play_shard(task):
+    """
+    Play one side of a matchup in a worker process (both sides,
+    alternating, when stopping early).
+
+    Agents come from factories rather than the parent's instances, since
+    play_game sets agent.player on every game.
+
+    Returns:
+        dict: Pair, side, results, games played, latency histograms,
+              counters, encoded game records (or None) and seconds
+    """
+    (name1, factory1, name2, factory2, games_per_side, seed, agent1_as_x, record, early_stop,
+     batch) = task
+    for name, factory in ((name1, factory1), (name2, factory2)):
+        if name not in _worker_agents:
+            _worker_agents[name] = factory()
+
+    start = time.time()
+    recorder = GameRecordBuffer() if record else None
+    matchup = Matchup(_worker_agents[name1], _worker_agents[name2],
+                      name1, name2, games_per_side, seed=seed, cache=_worker_cache,
+                      recorder=recorder, early_stop=early_stop, batch=batch)
+    if early_stop is not None:
+        matchup.play_adaptive()
+    else:
+        matchup.play_side(agent1_as_x)
+    return {
+        'pair': (name1, name2),
+        'agent1_as_x': agent1_as_x,
+        'results': matchup.results,
+        'games_played': matchup.games_played,
+        'decision': matchup.decision,
+        'latency': matchup.latency,
+        'counters': matchup.counters,
+        'records': bytes(recorder.data) if record else None,
+        'seconds': time.time() - start,
+    }
+
+
 class Tournament:
     """
     Runs a round-robin tournament with all agents.
     """
     
-    def __init__(self, games_per_side=100):
+    def __init__(self, games_per_side=100, q_table_path="results/q_table.qtb",
+                 compile_policies=False, seed=None, record_dir=None, metrics_dir=None,
+                 early_stop=None, results_db=None, batch=False):
         """
         Args:
-            games_per_side (int): Games per agent per side (X and O)
+            games_per_side (int): Games per agent per side (X and O); the
+                cap per side with early_stop
+            q_table_path (str): Trained Q-table for the Q-Learning agent
+            compile_policies (bool): Precompute Heuristic and Minimax moves
+                for every position, so each move is a table lookup
+            seed (int): Root seed; each matchup and game gets an
+                independent stream from it (None: global random module)
+            record_dir (str): Append every game to a binary record file per
+                matchup here (see tournament/records.py)
+            metrics_dir (str): Write each matchup's per-agent move latency
+                and search counters here as JSON
+            early_stop (SPRT): End each matchup once its result is
+                significant (tournament/stats.py)
+            results_db (str): SQLite file keeping every finished matchup;
+                matchups already in it are restored instead of played
+                (see tournament/store.py)
+            batch (bool): Play fixed-length sides between batch-capable
+                agents in lockstep (Matchup.play_lockstep). Random,
+                Heuristic, Minimax, Q-Learning and compiled policies all
+                batch; Minimax looks moves up in a per-position table filled
+                by its first search of each position, so compile_policies
+                isn't needed. MCTS plays game by game.
         """
         self.games_per_side = games_per_side
+        self.q_table_path = q_table_path
+        self.compile_policies = compile_policies
+        self.seed = seed
+        self.record_dir = record_dir
+        self.metrics_dir = metrics_dir
+        self.early_stop = early_stop
+        self.batch = batch
+        self.store = ResultStore(results_db) if results_db else None
         self.agents = {}
-        self.results = {}
-        self.standings = {}
+        self.factories = {}
+        self.game_cache = GameCache()  # Shared by all matchups in this process
+        self.table = ResultTable()  # W/D/L counts; matchups are dropped once folded in
+        self.latency = {}  # Per-agent move latency over all matchups
+        self.counters = {}  # Per-agent search counters over all matchups
+        self.ratings = Ratings()  # Bradley-Terry fit to every matchup played
         
-    def setup_agents(self):
-        """Initialize all agents."""
+    def setup_agents(self, mcts_simulations=()):
+        """
+        Initialize all agents.
+
+        Args:
+            mcts_simulations: Extra MCTS configurations to enter, one per
+                simulation count (named MCTS-<count>)
+        """
         print("Setting up agents...")
         
-        # Random
-        self.agents['Random'] = RandomAgent(player=1)
+        # Factories rebuild an agent anywhere (e.g. in worker processes)
+        factories = {
+            'Random': partial(RandomAgent, player=1),
+            'Heuristic': partial(HeuristicAgent, player=1),
+            'Minimax': partial(MinimaxAgent, player=1),
+            # Q-Learning (load trained model)
+            'Q-Learning': partial(load_qlearning_agent, self.q_table_path),
+            'MCTS': partial(MCTSAgent, player=1, num_simulations=1000),
+        }
+        for simulations in mcts_simulations:
+            factories[f"MCTS-{simulations}"] = partial(MCTSAgent, player=1,
+                                                       num_simulations=simulations)
         
-        # Heuristic
-        self.agents['Heuristic'] = HeuristicAgent(player=1)
+        if self.compile_policies:
+            # Deterministic agents only; greedy Q-Learning breaks ties randomly
+            for name in ('Heuristic', 'Minimax'):
+                factories[name] = partial(compiled_agent, factories[name])
         
-        # Minimax
-        self.agents['Minimax'] = MinimaxAgent(player=1)
-        
-        # Q-Learning (load trained model)
-        qlearning = QLearningAgent(player=1)
-        qlearning.load_q_table("q_table.pkl")
-        qlearning.epsilon = 0  # No exploration
-        self.agents['Q-Learning'] = qlearning
-        
-        # MCTS
-        self.agents['MCTS'] = MCTSAgent(player=1, num_simulations=1000)
+        for name, factory in factories.items():
+            self.add_agent(name, factory)
         
         print(f"✓ Loaded {len(self.agents)} agents")
+
+    def add_agent(self, name, factory):
+        """
+        Enter an agent.
+
+        Args:
+            factory: Picklable callable building the agent (so worker
+                processes can build their own copy)
+        """
+        build_start = time.time()
+        self.agents[name] = factory()
+        self.factories[name] = factory
+        if isinstance(self.agents[name], CachedPolicy):
+            print(f"  Compiled {name} ({len(self.agents[name].cache):,} positions, "
+                  f"{time.time() - build_start:.2f}s)")
+            # Workers load the finished table instead of compiling again
+            self.factories[name] = partial(CachedPolicy.from_array,
+                                           self.agents[name].to_array())
         
-        # Initialize standings
-        for name in self.agents:
-            self.standings[name] = {
-                'points': 0,
-                'wins': 0,
-                'draws': 0,
-                'losses': 0,
-                'games': 0
-            }
+        self.table.add_agent(name)
+        self.latency[name] = LatencyHistogram()
+        self.counters[name] = {}
+        self.ratings.add_agent(name)
     
-    def run(self):
+    def run(self, workers=None):
         """
         Run complete round-robin tournament.
+
+        Args:
+            workers (int): Play matchup sides on this many processes
+                (None or 1 plays everything here, in order)
         """
         agent_names = list(self.agents.keys())
-        total_matchups = 0
-        for i in range(len(agent_names)):
-            for j in range(len(agent_names)):
-                if i != j:  # <-- Only count when agents are different
-                    total_matchups += 1
+        pairs = [(name1, name2) for name1 in agent_names for name2 in agent_names
+                 if name1 != name2]  # Skip self-matchups
+        total_matchups = len(pairs)
         
         print(f"\n{'='*60}")
         print(f"STARTING TOURNAMENT")
         print(f"{'='*60}")
         print(f"Format: Round-robin (everyone vs everyone)")
-        print(f"Games per matchup: {self.games_per_side * 2}")
+        self._print_format(workers)
         print(f"Total matchups: {total_matchups}")
-        print(f"Total games: {total_matchups * self.games_per_side * 2}")
+        print(f"Total games: {'up to ' if self.early_stop else ''}"
+              f"{total_matchups * self.games_per_side * 2}")
         print(f"{'='*60}\n")
         
-        matchup_count = 0
         start_time = time.time()
-        
-        # Play each agent against each other (including self)
-        for i, name1 in enumerate(agent_names):
-            for j, name2 in enumerate(agent_names):
-
-                if name1 == name2:
-                    continue  # Skip self-matchups
-
-                matchup_count += 1
-                
-                print(f"[{matchup_count}/{total_matchups}] {name1} vs {name2}...", end=" ", flush=True)
-                
-                matchup_start = time.time()
-                
-                # Create matchup
-                matchup = Matchup(
-                    self.agents[name1],
-                    self.agents[name2],
-                    name1,
-                    name2,
-                    self.games_per_side
-                )
-                
-                # Run matchup
-                results = matchup.run()
-                
-                matchup_time = time.time() - matchup_start
-                
-                # Store detailed results
-                self.results[f"{name1}_vs_{name2}"] = {
-                    'matchup': matchup,
-                    'results': results
-                }
-                
-                # Update standings
-                total_games = self.games_per_side * 2
-                
-                # Agent 1 points: 2 per win, 1 per draw
-                agent1_points = results['agent1_wins'] * 2 + results['draws'] * 1
-                agent2_points = results['agent2_wins'] * 2 + results['draws'] * 1
-                
-                self.standings[name1]['points'] += agent1_points
-                self.standings[name1]['wins'] += results['agent1_wins']
-                self.standings[name1]['draws'] += results['draws']
-                self.standings[name1]['losses'] += results['agent2_wins']
-                self.standings[name1]['games'] += total_games
-                
-                self.standings[name2]['points'] += agent2_points
-                self.standings[name2]['wins'] += results['agent2_wins']
-                self.standings[name2]['draws'] += results['draws']
-                self.standings[name2]['losses'] += results['agent1_wins']
-                self.standings[name2]['games'] += total_games
-                
-                print(f"Done ({matchup_time:.2f}s)")
-        
+
+        with self._pool(workers) as pool:
+            self._play_matchups(pairs, pool)
+        self._print_totals(start_time)
+
+    def run_swiss(self, workers=None, max_rounds=None, patience=2):
+        """
+        Rank the agents with Swiss rounds instead of a full round-robin.
+
+        Every round pairs agents of similar rating that haven't met (see
+        tournament/swiss.py); each pair plays one matchup (both sides) and
+        the Bradley-Terry ratings are refit. Play stops once the ranking
+        has held for patience rounds in a row (after at least log2(n)
+        rounds), or no new pairs are left. A ranking holds when no two
+        agents that are significantly apart swapped places; reshuffles
+        among statistical ties don't count.
+
+        Args:
+            workers (int): Play matchup sides on this many processes
+            max_rounds (int): Stop after this many rounds regardless
+            patience (int): Rounds in a row the ranking must hold
+        """
+        agent_names = list(self.agents.keys())
+        n = len(agent_names)
+        min_rounds = math.ceil(math.log2(max(n, 2)))
+        max_rounds = max_rounds or default_rounds(n)
+
+        print(f"\n{'='*60}")
+        print(f"STARTING TOURNAMENT")
+        print(f"{'='*60}")
+        print(f"Format: Swiss ({n} agents, {min_rounds} to {max_rounds} rounds)")
+        self._print_format(workers)
+        print(f"Round-robin would take: {n * (n - 1)} matchups")
+        print(f"{'='*60}\n")
+
+        start_time = time.time()
+        played = set()
+        previous = None
+        stable = 0
+        with self._pool(workers) as pool:
+            for round_number in range(1, max_rounds + 1):
+                pairs = swiss_pairs(self.ratings.ranking(), played)
+                if not pairs:
+                    break
+
+                print(f"Round {round_number}: {len(pairs)} matchups")
+                self._play_matchups(pairs, pool)
+                played.update(frozenset(pair) for pair in pairs)
+
+                self.ratings.fit()
+                ranking = self.ratings.ranking()
+                flips = self.ratings.significant_flips(previous) if previous else None
+                stable = stable + 1 if flips == 0 else 0
+                previous = ranking
+                leader = ranking[0]
+                print(f"  Leader: {leader} ({self.ratings.elo(leader):+.0f} ± "
+                      f"{self.ratings.stderr(leader):.0f}), significant rank changes: "
+                      f"{'-' if flips is None else flips}\n")
+                if round_number >= min_rounds and stable >= patience:
+                    break
+
+        print(f"Matchups played: {len(played)} of {n * (n - 1)} for a round-robin")
+        self._print_totals(start_time)
+
+    def _print_format(self, workers):
+        if self.early_stop is not None:
+            print(f"Games per matchup: up to {self.games_per_side * 2} ({self.early_stop})")
+        else:
+            print(f"Games per matchup: {self.games_per_side * 2}")
+        if workers and workers > 1:
+            print(f"Workers: {workers}")
+
+    def pair_seed(self, name1, name2):
+        """
+        Seed of the matchup name1 vs name2 (None when unseeded).
+
+        Derived from the two names rather than a position, so a matchup
+        plays the same games whatever else is in the league or whichever
+        round it lands in, and stored results stay valid.
+        """
+        if self.seed is None:
+            return None
+        digest = hashlib.sha1(f"{name1}\0{name2}".encode()).digest()
+        return child_seed(self.seed, int.from_bytes(digest[:8], 'little'))
+
+    def _matchup(self, pair):
+        return Matchup(self.agents[pair[0]], self.agents[pair[1]], pair[0], pair[1],
+                       self.games_per_side, seed=self.pair_seed(*pair), cache=self.game_cache,
+                       early_stop=self.early_stop, batch=self.batch)
+
+    def store_config(self):
+        """Settings besides the agents and seed that a stored result depends on."""
+        config = {'games_per_side': self.games_per_side,
+                  'early_stop': repr(self.early_stop) if self.early_stop else None}
+        if self.batch:
+            config['batch'] = True  # Lockstep games differ; unbatched keys stay valid
+        return config
+
+    def _restore_stored(self, pairs):
+        """
+        Record the matchups already in the result store.
+
+        Returns:
+            list: The pairs still to play
+        """
+        config = self.store_config()
+        remaining = []
+        for pair in pairs:
+            matchup = self._matchup(pair)
+            key = self.store.key(matchup, config)
+            if key is not None and self.store.load(key, matchup):
+                self._record_matchup(matchup, save=False)
+            else:
+                remaining.append(pair)
+        if len(remaining) < len(pairs):
+            print(f"Restored {len(pairs) - len(remaining)} of {len(pairs)} matchups "
+                  f"from {self.store.filename}")
+        return remaining
+
+    @staticmethod
+    def _pool(workers):
+        """Process pool for workers > 1, otherwise a stand-in for playing here."""
+        if workers and workers > 1:
+            return multiprocessing.Pool(workers, initializer=_init_worker)
+        return contextlib.nullcontext()
+
+    def _play_matchups(self, pairs, pool=None):
+        """
+        Play the matchups between pairs (on the pool if given) and record
+        each as it finishes.
+        """
+        for directory in (self.record_dir, self.metrics_dir):
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        if self.store is not None:
+            pairs = self._restore_stored(pairs)
+
+        if pool is not None:
+            self._run_parallel(pairs, pool)
+            return
+
+        total_matchups = len(pairs)
+        for matchup_count, (name1, name2) in enumerate(pairs, 1):
+            print(f"[{matchup_count}/{total_matchups}] {name1} vs {name2}...", end=" ", flush=True)
+            
+            matchup_start = time.time()
+            matchup = self._matchup((name1, name2))
+            if self.record_dir:
+                with GameRecordWriter(self.record_path(name1, name2)) as writer:
+                    matchup.recorder = writer
+                    matchup.run()
+            else:
+                matchup.run()
+            self._record_matchup(matchup)
+            
+            print(f"Done ({time.time() - matchup_start:.2f}s)")
+
+    def _print_totals(self, start_time):
+        played = self.table.played()
+        total_matchups = int(played.sum())
         elapsed = time.time() - start_time
         print(f"\n{'='*60}")
         print(f"TOURNAMENT COMPLETE!")
         print(f"Total time: {elapsed:.1f}s ({elapsed/60:.1f} minutes)")
+        games_played = int(self.table.games_played.sum())
+        counted = int(self.table.outcomes.sum())
+        if self.early_stop is not None:
+            print(f"Games counted: {counted:,} of up to {total_matchups * self.games_per_side * 2:,} "
+                  f"(matchups stopped once significant)")
+            decided = int((self.table.decisions[played] > 0).sum())
+            print(f"Matchups decided before the cap: {decided} of {total_matchups}")
+        print(f"Games played: {games_played:,} of {counted:,} "
+              f"(the rest were repeats of deterministic games)")
+        for name, agent in self.agents.items():
+            if isinstance(agent, CachedPolicy) and agent.hits + agent.misses:
+                stats = agent.stats()
+                print(f"{name} cache: {stats['hit_rate'] * 100:.1f}% hits "
+                      f"({stats['hits']:,} of {stats['hits'] + stats['misses']:,} moves)")
         print(f"{'='*60}\n")
+
+    def _run_parallel(self, pairs, pool):
+        """
+        Play each matchup's two sides as separate tasks on a process pool.
+
+        Splitting by side gives twice as many tasks as matchups, which
+        evens out the load when a few matchups (MCTS) dominate. Stopping
+        early needs both sides' results, so then each matchup is one task.
+        """
+        record = bool(self.record_dir)
+        sides = (None,) if self.early_stop is not None else (True, False)
+        tasks = []
+        for name1, name2 in pairs:
+            seed = self.pair_seed(name1, name2)
+            for agent1_as_x in sides:
+                tasks.append((name1, self.factories[name1], name2, self.factories[name2],
+                              self.games_per_side, seed, agent1_as_x, record,
+                              self.early_stop, self.batch))
+
+        in_flight = {}  # Pair -> (matchup, shards left, seconds, records by side)
+        done = 0
+        for shard in pool.imap_unordered(_play_shard, tasks):
+            pair = shard['pair']
+            name1, name2 = pair
+            if pair not in in_flight:
+                in_flight[pair] = [self._matchup(pair), len(sides), 0.0, {}]
+            entry = in_flight[pair]
+            matchup = entry[0]
+            matchup.add_results(shard['results'], shard['games_played'],
+                                shard['latency'], shard['counters'])
+            matchup.decision = shard['decision']
+            entry[1] -= 1
+            entry[2] += shard['seconds']
+            entry[3][shard['agent1_as_x']] = shard['records']
+            if entry[1] == 0:
+                done += 1
+                if record:
+                    # Same order as a sequential run: agent 1 as X first
+                    with GameRecordWriter(self.record_path(name1, name2)) as writer:
+                        writer.write_frames(b"".join(entry[3][side] for side in sides))
+                self._record_matchup(matchup)
+                del in_flight[pair]
+                print(f"[{done}/{len(pairs)}] {name1} vs {name2}... "
+                      f"Done ({entry[2]:.2f}s)")
+
+    def record_path(self, name1, name2):
+        """Game record file for a matchup."""
+        return os.path.join(self.record_dir, f"{name1}_vs_{name2}.ttr")
+
+    def _record_matchup(self, matchup, save=True):
+        """
+        Fold a finished matchup into the result table, ratings and metrics.
+
+        Args:
+            save (bool): Also add it to the result store, if there is one
+                (False for matchups restored from it)
+        """
+        name1, name2 = matchup.agent1_name, matchup.agent2_name
+        results = matchup.results
+        self.table.add(name1, name2, results, matchup.games_played, matchup.decision)
+
+        if save and self.store is not None:
+            key = self.store.key(matchup, self.store_config())
+            if key is not None:
+                self.store.save(key, matchup)
+
+        if self.metrics_dir:
+            write_json(matchup.metrics(),
+                       os.path.join(self.metrics_dir, f"{name1}_vs_{name2}.json"))
+
+        for name in (name1, name2):
+            self.latency[name].merge(matchup.latency[name])
+            merge_counters(self.counters[name], matchup.counters[name])
+
+        self.ratings.add(name1, name2, results['agent1_wins'] + results['draws'] / 2,
+                         matchup.total_games())
+
+    @property
+    def standings(self):
+        """Per-agent points, wins, draws, losses and games (from the table)."""
+        return self.table.standings()
+
+    def matchup_results(self, name1, name2):
+        """Results of the matchup name1 vs name2 (Matchup.results format, None if unplayed)."""
+        return self.table.results(name1, name2)
     
+    def print_latency(self):
+        """Print move latency percentiles and search counters per agent."""
+        print("\n" + "="*80)
+        print("MOVE LATENCY (µs)".center(80))
+        print("="*80)
+        print(f"{'Agent':<15}{'Moves':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'Max':>10}  Counters")
+        print("-"*80)
+        for name, histogram in self.latency.items():
+            stats = histogram.to_dict()
+            effort = ", ".join(f"{key} {value:,}" for key, value in self.counters[name].items())
+            print(f"{name:<15}{stats['moves']:>10,}{stats['p50_us']:>10.1f}{stats['p95_us']:>10.1f}"
+                  f"{stats['p99_us']:>10.1f}{stats['max_us']:>10.1f}  {effort}")
+        print("="*80 + "\n")
+
     def print_standings(self):
         """Print final standings table."""
-        # Sort by losses (ascending), then by wins (descending) as tiebreaker
-        sorted_standings = sorted(
-            self.standings.items(),
-            key=lambda x: (x[1]['losses'], -x[1]['wins'])
-        )
+        wins, draws, losses = self.table.totals()
+        games = wins + draws + losses
+        with np.errstate(invalid='ignore', divide='ignore'):
+            win_rates = np.where(games > 0, wins / games, 0.0)
+            loss_rates = np.where(games > 0, losses / games, 0.0)
+        # Sort by loss rate (ascending), then by win rate (descending) as
+        # tiebreaker; rates, since early-stopped matchups differ in length
+        order = np.lexsort((-win_rates, loss_rates))
         
         print("\n" + "="*80)
         print("FINAL STANDINGS".center(80))
         print("="*80)
-        print(f"{'Rank':<6}{'Agent':<15}{'Points':<10}{'W':<8}{'D':<8}{'L':<8}{'Games':<8}{'Win%':<8}")
+        print(f"{'Rank':<6}{'Agent':<15}{'Points':<12}{'W':<6}{'D':<6}{'L':<6}{'Games':<7}"
+              f"{'Win%':>7}{'95% CI':>14}")
         print("-"*80)
         
-        for rank, (name, stats) in enumerate(sorted_standings, 1):
-            win_pct = stats['wins'] / stats['games'] * 100 if stats['games'] > 0 else 0
-            max_points = stats['games'] * 2
+        for rank, i in enumerate(order, 1):
+            name = self.table.names[i]
+            low, high = wilson_interval(wins[i], games[i])
+            points = f"{2 * wins[i] + draws[i]}/{2 * games[i]}"
             
-            print(f"{rank:<6}{name:<15}{stats['points']}/{max_points:<8}{stats['wins']:<8}"
-                f"{stats['draws']:<8}{stats['losses']:<8}{stats['games']:<8}{win_pct:>6.1f}%")
+            print(f"{rank:<6}{name:<15}{points:<12}{wins[i]:<6}"
+                f"{draws[i]:<6}{losses[i]:<6}{games[i]:<7}{win_rates[i] * 100:>6.1f}%"
+                f"{low * 100:>8.1f}-{high * 100:.1f}%")
         
         print("="*80)
         print("Scoring: Win = 2 points, Draw = 1 point, Loss = 0 points")
         print("="*80 + "\n")
     
+    def win_rate(self, name1, name2):
+        """
+        Share of games name1 won in its matchup against name2, or in the
+        reverse matchup if only that was played (None if they never met).
+        """
+        rate = self.table.win_rates()[self.table.index[name1], self.table.index[name2]]
+        return None if np.isnan(rate) else float(rate)
+
+    def print_ratings(self):
+        """Print Bradley-Terry ratings with their uncertainty."""
+        self.ratings.fit()
+        print("\n" + "="*80)
+        print("RATINGS (Bradley-Terry, Elo scale)".center(80))
+        print("="*80)
+        print(f"{'Rank':<6}{'Agent':<20}{'Elo':>8}{'± 2σ':>8}{'Games':>10}")
+        print("-"*80)
+        for rank, (name, elo, stderr, games) in enumerate(self.ratings.table(), 1):
+            print(f"{rank:<6}{name:<20}{elo:>+8.0f}{2 * stderr:>8.0f}{games:>10,}")
+        print("="*80 + "\n")
+
     def print_head_to_head_matrix(self):
         """Print head-to-head win rate matrix."""
-        agent_names = list(self.agents.keys())
+        agent_names = self.table.names
+        rates = self.table.win_rates()
         
         print("\n" + "="*80)
         print("HEAD-TO-HEAD WIN RATES (%)".center(80))
@@ -179,21 +566,15 @@ class Tournament:
         print("-"*80)
         
         # Each row
-        for name1 in agent_names:
+        for i, name1 in enumerate(agent_names):
             row = f"{name1:<15}"
-            for name2 in agent_names:
-                if name1 == name2:  # <-- ADD THIS CHECK
-                    row += f"{'---':>12}"
-                    continue  # <-- SKIP to next agent
-                key = f"{name1}_vs_{name2}"
-                results = self.results[key]['results']
-                total = self.games_per_side * 2
-                win_rate = results['agent1_wins'] / total * 100
-                
-                if name1 == name2:
+            for j in range(len(agent_names)):
+                if i == j:
                     row += f"{'---':>12}"
+                elif np.isnan(rates[i, j]):  # Never met (Swiss)
+                    row += f"{'.':>12}"
                 else:
-                    row += f"{win_rate:>11.1f}%"
+                    row += f"{rates[i, j] * 100:>11.1f}%"
             print(row)
         
         print("="*80 + "\n")
@@ -205,8 +586,9 @@ class Tournament:
             f.write("TIC-TAC-TOE AI TOURNAMENT - DETAILED RESULTS\n")
             f.write("="*80 + "\n\n")
             
-            for key, data in self.results.items():
-                f.write(data['matchup'].get_summary())
+            for name1, name2 in self.table.pairs():
+                f.write(format_summary(name1, name2, self.table.results(name1, name2),
+                                       self.table.decision(name1, name2), self.early_stop))
                 f.write("\n")
         
         print(f"✓ Detailed results saved to {filename}")
\ No newline at end of file
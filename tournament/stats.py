@@ -0,0 +1,102 @@
+"""
+Confidence intervals and sequential stopping for matchups.
+
+SPRT tests a matchup's score (agent 1's wins + draws / 2, per game)
+after every pair of games and stops as soon as one of three outcomes
+is established at the configured error rates:
+
+    'agent1'  agent 1 scores at least 0.5 + margin
+    'agent2'  agent 2 scores at least 0.5 + margin
+    'even'    neither is ahead by margin
+
+It runs two Wald tests side by side (0.5 against 0.5 + margin, and 0.5
+against 0.5 - margin, each at half the error rates) using the normal approximation of the
+generalized SPRT on win/draw/loss counts, the approach chess engine
+testing frameworks use. Half a game of each outcome is added when
+estimating the variance, so runs of identical results (all draws, all
+wins) still produce a finite statistic.
+"""
+
+import math
+from statistics import NormalDist
+
+
+def wilson_interval(successes, n, confidence=0.95):
+    """
+    Wilson score interval for a proportion.
+
+    Returns:
+        tuple: (low, high) as fractions, (0.0, 1.0) when n is 0
+    """
+    if n == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    spread = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    low = 0.0 if successes == 0 else center - spread
+    high = 1.0 if successes == n else center + spread
+    return low, high
+
+
+class SPRT:
+    """
+    Early-stopping rule for Matchup.
+
+    Holds only the configuration; decide() works from the current
+    counts, so one instance can be shared by every matchup (and
+    pickled to worker processes).
+    """
+
+    def __init__(self, alpha=0.05, beta=0.05, margin=0.1, min_games=10):
+        """
+        Args:
+            alpha (float): Chance of declaring either agent stronger when
+                they are even
+            beta (float): Chance of missing a score difference of margin
+            margin (float): Smallest score difference worth detecting
+                (0.1 means one agent scores 60%)
+            min_games (int): Never stop before this many games
+        """
+        self.alpha = alpha
+        self.beta = beta
+        self.margin = margin
+        self.min_games = min_games
+        # Split between the two one-sided tests
+        self.lower = math.log((beta / 2) / (1 - alpha / 2))
+        self.upper = math.log((1 - beta / 2) / (alpha / 2))
+
+    def llr(self, wins, draws, losses, s0, s1):
+        """Log-likelihood ratio of score s1 against s0 (agent 1's view)."""
+        n = wins + draws + losses
+        if n == 0:
+            return 0.0
+        w, d, l = wins + 0.5, draws + 0.5, losses + 0.5
+        total = w + d + l
+        score = (w + d / 2) / total
+        variance = (w * (1 - score) ** 2 + d * (0.5 - score) ** 2 + l * score ** 2) / total
+        return n * (s1 - s0) * (2 * score - s0 - s1) / (2 * variance)
+
+    def decide(self, wins, draws, losses):
+        """
+        Outcome established by agent 1's wins, draws and losses so far.
+
+        Returns:
+            str: 'agent1', 'agent2', 'even', or None to keep playing
+        """
+        if wins + draws + losses < self.min_games:
+            return None
+        ahead = self.llr(wins, draws, losses, 0.5, 0.5 + self.margin)
+        behind = self.llr(wins, draws, losses, 0.5, 0.5 - self.margin)
+        if ahead >= self.upper:
+            return 'agent1'
+        if behind >= self.upper:
+            return 'agent2'
+        if ahead <= self.lower and behind <= self.lower:
+            return 'even'
+        return None
+
+    def __repr__(self):
+        return (f"SPRT(alpha={self.alpha}, beta={self.beta}, margin={self.margin}, "
+                f"min_games={self.min_games})")
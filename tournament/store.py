@@ -0,0 +1,113 @@
+"""
+Persistent matchup results, so interrupted or extended tournaments resume.
+
+Each finished matchup is committed to a SQLite file as soon as it is
+recorded, under a key made from both agents' fingerprints, the match
+configuration (games per side, stopping rule) and the matchup's seed.
+A rerun looks every matchup up first and only plays the missing ones:
+an interrupted run loses at most the matchups in flight, and entering
+one more agent into a league costs only that agent's matchups.
+
+Agents without a fingerprint can't be identified across runs, so their
+matchups are always played. The key doesn't include agent names: a
+renamed agent, or a second entry of the same agent, reuses the results
+of its twin.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+
+from tournament.matchup import fingerprint
+from tournament.metrics import LatencyHistogram
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matchups (
+    key TEXT PRIMARY KEY,
+    agent1 TEXT NOT NULL,
+    agent2 TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created REAL NOT NULL
+)
+"""
+
+
+def seed_id(seed):
+    """JSON-ready identity of a matchup seed (SeedSequence or None)."""
+    if seed is None:
+        return None
+    return [str(seed.entropy), list(seed.spawn_key)]
+
+
+class ResultStore:
+    """SQLite-backed matchup results."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.execute(SCHEMA)
+        self.connection.commit()
+
+    def key(self, matchup, config):
+        """
+        Lookup key for a matchup, or None if an agent has no fingerprint.
+
+        Args:
+            config (dict): Settings that change the result (JSON-ready)
+        """
+        fingerprints = (fingerprint(matchup.agent1), fingerprint(matchup.agent2))
+        if None in fingerprints:
+            return None
+        identity = json.dumps([fingerprints, config, seed_id(matchup.seed)], sort_keys=True)
+        return hashlib.sha1(identity.encode()).hexdigest()
+
+    def load(self, key, matchup):
+        """
+        Restore a stored matchup's results into matchup.
+
+        Returns:
+            bool: True if the key was found
+        """
+        row = self.connection.execute("SELECT data FROM matchups WHERE key = ?",
+                                      (key,)).fetchone()
+        if row is None:
+            return False
+        data = json.loads(row[0])
+        names = (matchup.agent1_name, matchup.agent2_name)
+        matchup.add_results(
+            data['results'], data['games_played'],
+            {name: LatencyHistogram.from_state(state)
+             for name, state in zip(names, data['latency'])},
+            dict(zip(names, data['counters'])))
+        matchup.decision = data['decision']
+        return True
+
+    def save(self, key, matchup):
+        """Store a finished matchup (committed immediately)."""
+        names = (matchup.agent1_name, matchup.agent2_name)
+        data = {
+            'results': matchup.results,
+            'games_played': matchup.games_played,
+            'decision': matchup.decision,
+            # By position (agent 1, agent 2): another pair with the same
+            # fingerprints, e.g. a renamed agent, shares the key
+            'latency': [matchup.latency[name].state() for name in names],
+            'counters': [matchup.counters[name] for name in names],
+        }
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO matchups VALUES (?, ?, ?, ?, ?)",
+                (key, matchup.agent1_name, matchup.agent2_name, json.dumps(data), time.time()))
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM matchups").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,40 @@
+"""
+Swiss pairing for rating large leagues.
+
+Each round pairs every agent with the closest-rated opponent it hasn't
+met yet. Closely rated agents are the ones whose result is least
+predictable, so their games move the ratings most; far-apart pairs,
+whose outcome the ratings already predict, are never scheduled. A
+league of n agents settles in O(log n) rounds of n / 2 matchups.
+"""
+
+import math
+
+
+def swiss_pairs(ranking, played):
+    """
+    Pair agents for one round.
+
+    Args:
+        ranking (list): Agent names, highest rated first
+        played (set): frozensets of pairs that have already met
+
+    Returns:
+        list: (name1, name2) pairs; with an odd number of agents, or when
+              everyone left has met, some agents sit the round out
+    """
+    unpaired = list(ranking)
+    pairs = []
+    while len(unpaired) > 1:
+        name = unpaired.pop(0)
+        for index, opponent in enumerate(unpaired):
+            if frozenset((name, opponent)) not in played:
+                pairs.append((name, opponent))
+                del unpaired[index]
+                break
+    return pairs
+
+
+def default_rounds(n):
+    """Rounds at which a league of n agents stops if its ranking never settles."""
+    return 2 * max(1, math.ceil(math.log2(max(n, 2)))) + 2
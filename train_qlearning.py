@@ -1,154 +1,206 @@
-from game.board import TicTacToe
 from agents.qlearning_agent import QLearningAgent
-from agents.random_agent import RandomAgent
-import matplotlib.pyplot as plt
+from agents.replay_buffer import ReplayBuffer
+from training.league import LeagueTrainer
+from training.convergence import ConvergenceTracker
+from training.episodes import play_training_episode
+from training.checkpoint import (MetricsWriter, get_rng_state, load_checkpoint,
+                                 read_metrics, save_checkpoint, set_rng_state,
+                                 truncate_metrics)
+from training.vectorized import train_vectorized
+from training.parallel import train_parallel
+from training.solver import OPPONENTS, solve_q_table
+import argparse
+import time
 
-def train_qlearning(num_episodes=50000, save_filename="q_table.pkl"):
+def train_qlearning(num_episodes=50000, save_filename="q_table.qtb",
+                    checkpoint_dir=None, checkpoint_every=5000, resume=False,
+                    metrics_path=None, replay_capacity=0, replay_ratio=1.0,
+                    replay_eviction='fifo', td_lambda=None, eval_every=None,
+                    target_agreement=None, seed=None):
     """
     Train Q-Learning agent by playing against Random opponent.
+
+    The agent first plays num_episodes as X (with epsilon decay), then
+    num_episodes // 2 as O.
+
+    Args:
+        checkpoint_dir (str): Where to keep checkpoints (None disables them)
+        checkpoint_every (int): Episodes between checkpoints
+        resume (bool): Continue from the checkpoint in checkpoint_dir
+            (metrics records after it are dropped, as those episodes
+            are played again)
+        metrics_path (str): Append per-window metrics to this JSONL file
+        replay_capacity (int): Replay buffer size (0 disables replay)
+        replay_ratio (float): Replayed transitions per new transition
+        replay_eviction (str): 'fifo' or 'random' once the buffer is full
+        td_lambda (float): Use Watkins Q(λ) with this trace decay
+        eval_every (int): Episodes between comparisons with exact minimax
+            values (greedy agreement and mean absolute error)
+        target_agreement (float): End a phase early once the greedy policy
+            agrees with minimax on this fraction of positions for that side
+        seed (int): Seeds the agent's stream, which the Random opponent
+            shares (None uses the global random module)
+
+    The replay buffer is not part of checkpoints; a resumed run refills it.
     """
     print("=" * 50)
     print("TRAINING Q-LEARNING AGENT VS RANDOM")
     print("=" * 50)
-    
+
     # Create learning agent
     agent = QLearningAgent(
-        player=1,  # Always play as X for now
+        player=1,
         learning_rate=0.1,
         discount_factor=0.9,
-        epsilon=0.3
+        epsilon=0.3,
+        replay_buffer=ReplayBuffer(replay_capacity, replay_eviction, seed) if replay_capacity else None,
+        replay_ratio=replay_ratio,
+        td_lambda=td_lambda,
+        rng=seed
     )
-    
-    # Epsilon decay
+
+    # Epsilon decay (only while playing as X)
     epsilon_start = 0.3
     epsilon_end = 0.05
     epsilon_decay = (epsilon_start - epsilon_end) / num_episodes
-    
-    # Track progress
-    wins = 0
-    losses = 0
-    draws = 0
-    
-    # For plotting
-    window_size = 1000
-    win_rates = []
-    
-    print(f"\nTraining for {num_episodes:,} episodes...")
-    print("Agent plays as X, Random plays as O\n")
-    
-    for episode in range(num_episodes):
-        game = TicTacToe()
-        agent.reset_history()
-        random_opponent = RandomAgent(player=-1)
-        
-        while not game.is_game_over():
-            if game.current_player == 1:
-                # Agent's turn
-                move = agent.get_move(game, training=True)
-            else:
-                # Random opponent's turn
-                move = random_opponent.get_move(game)
-            
-            game.make_move(move)
-        
-        # Determine outcome and learn
-        winner = game.check_winner()
-        
-        if winner == 1:
-            wins += 1
-            agent.learn(reward=1)  # Win!
-        elif winner == -1:
-            losses += 1
-            agent.learn(reward=-1)  # Loss
+
+    phases = [
+        ('X', 1, num_episodes, epsilon_decay),
+        ('O', -1, num_episodes // 2, 0.0),  # Half as many episodes as O
+    ]
+
+    # Training position: everything needed to continue after a crash
+    position = {'phase': 0, 'episode': 0, 'wins': 0, 'losses': 0, 'draws': 0}
+
+    if resume:
+        checkpoint = load_checkpoint(checkpoint_dir) if checkpoint_dir else None
+        if checkpoint is None:
+            print("\nNo checkpoint found, starting from scratch")
         else:
-            draws += 1
-            agent.learn(reward=0)  # Draw
-        
-        # Decay epsilon
-        agent.epsilon = max(epsilon_end, agent.epsilon - epsilon_decay)
-        
-        # Track progress
-        if (episode + 1) % window_size == 0:
-            win_rate = wins / window_size * 100
-            loss_rate = losses / window_size * 100
-            draw_rate = draws / window_size * 100
-            win_rates.append(win_rate)
-            
-            print(f"Episode {episode + 1:6,} | "
-                  f"W: {win_rate:5.1f}% | L: {loss_rate:5.1f}% | D: {draw_rate:5.1f}% | "
-                  f"ε: {agent.epsilon:.3f} | States: {len(agent.q_table):,}")
-            
-            wins = 0
-            losses = 0
-            draws = 0
-    
-    print("\n" + "=" * 50)
-    print("Now training as O (playing second)...")
-    print("=" * 50)
-    
-    # Train as O too
-    agent.player = -1
-    wins = 0
-    losses = 0
-    draws = 0
-    
-    for episode in range(num_episodes // 2):  # Half as many episodes as O
-        game = TicTacToe()
-        agent.reset_history()
-        random_opponent = RandomAgent(player=1)
-        
-        while not game.is_game_over():
-            if game.current_player == 1:
-                # Random goes first
-                move = random_opponent.get_move(game)
+            agent.q_table, saved = checkpoint
+            agent.epsilon = saved['epsilon']
+            set_rng_state(saved['rng_state'], agent.rng)
+            position = saved['position']
+            print(f"\nResumed from checkpoint: phase {phases[position['phase']][0]}, "
+                  f"episode {position['episode']:,}, {len(agent.q_table):,} states")
+
+    if resume and metrics_path:
+        # Episodes after the checkpoint are played again; drop their records
+        sides = [phase[0] for phase in phases]
+        resumed_at = (position['phase'], position['episode'])
+        truncate_metrics(metrics_path, lambda record:
+                         (sides.index(record['side']), record['episode']) <= resumed_at)
+    metrics = MetricsWriter(metrics_path) if metrics_path else None
+    tracker = ConvergenceTracker(agent.discount_factor) if eval_every else None
+    window_size = 1000
+
+    def checkpoint():
+        if checkpoint_dir:
+            save_checkpoint(checkpoint_dir, agent.q_table, {
+                'epsilon': agent.epsilon,
+                'rng_state': get_rng_state(agent.rng),
+                'position': position,
+            })
+
+    for phase_index in range(position['phase'], len(phases)):
+        side, player, phase_episodes, decay = phases[phase_index]
+        agent.player = player
+        position['phase'] = phase_index
+        if position['episode'] == 0:
+            # Games left in a partial window (or a phase ended early) aren't
+            # carried into this phase's first record
+            position['wins'] = position['losses'] = position['draws'] = 0
+
+        print(f"\nTraining for {phase_episodes:,} episodes as {side}...\n")
+        window_start = time.perf_counter()
+
+        while position['episode'] < phase_episodes:
+            outcome = play_training_episode(agent, tracker)
+            if outcome == 1:
+                position['wins'] += 1
+            elif outcome == -1:
+                position['losses'] += 1
             else:
-                # Agent plays as O
-                move = agent.get_move(game, training=True)
-            
-            game.make_move(move)
-        
-        winner = game.check_winner()
-        
-        if winner == -1:
-            wins += 1
-            agent.learn(reward=1)
-        elif winner == 1:
-            losses += 1
-            agent.learn(reward=-1)
-        else:
-            draws += 1
-            agent.learn(reward=0)
-        
-        if (episode + 1) % window_size == 0:
-            win_rate = wins / window_size * 100
-            loss_rate = losses / window_size * 100
-            draw_rate = draws / window_size * 100
-            
-            print(f"Episode {episode + 1:6,} | "
-                  f"W: {win_rate:5.1f}% | L: {loss_rate:5.1f}% | D: {draw_rate:5.1f}% | "
-                  f"States: {len(agent.q_table):,}")
-            
-            wins = 0
-            losses = 0
-            draws = 0
-    
+                position['draws'] += 1
+
+            # Decay epsilon
+            agent.epsilon = max(epsilon_end, agent.epsilon - decay)
+            position['episode'] += 1
+            episode = position['episode']
+
+            # Track progress
+            if episode % window_size == 0:
+                elapsed = time.perf_counter() - window_start
+                window_start = time.perf_counter()
+                games = position['wins'] + position['losses'] + position['draws']
+                win_rate = position['wins'] / games * 100
+                loss_rate = position['losses'] / games * 100
+                draw_rate = position['draws'] / games * 100
+
+                print(f"Episode {episode:6,} | "
+                      f"W: {win_rate:5.1f}% | L: {loss_rate:5.1f}% | D: {draw_rate:5.1f}% | "
+                      f"ε: {agent.epsilon:.3f} | States: {len(agent.q_table):,}")
+
+                if metrics:
+                    metrics.write({
+                        'side': side,
+                        'episode': episode,
+                        'wins': position['wins'],
+                        'losses': position['losses'],
+                        'draws': position['draws'],
+                        'win_rate': win_rate,
+                        'epsilon': agent.epsilon,
+                        'states': len(agent.q_table),
+                        'episodes_per_sec': games / elapsed if elapsed > 0 else None,
+                    })
+
+                position['wins'] = position['losses'] = position['draws'] = 0
+
+            if episode % checkpoint_every == 0:
+                checkpoint()
+
+            if tracker and episode % eval_every == 0:
+                if agent.replay_buffer is not None:
+                    tracker.mark_all_dirty()  # Replay touches arbitrary positions
+                convergence = tracker.update(agent.q_table, side=player)
+                print(f"  Minimax agreement ({side}): {convergence['agreement'] * 100:5.1f}% | "
+                      f"MAE: {convergence['mae']:.4f}")
+                if metrics:
+                    metrics.write({'side': side, 'episode': episode, **convergence})
+                if target_agreement is not None and convergence['agreement'] >= target_agreement:
+                    print(f"\nConverged as {side} after {episode:,} episodes, ending phase early")
+                    break
+
+        position['phase'] = phase_index + 1
+        position['episode'] = 0
+        checkpoint()
+
+    if metrics:
+        metrics.close()
+
     # Save
     agent.save_q_table(save_filename)
-    
+
     print("\n" + "=" * 50)
     print("TRAINING COMPLETE!")
     print("=" * 50)
     print(f"Total states learned: {len(agent.q_table):,}")
-    
-    # Plot
-    plot_learning_curve(win_rates)
-    
+
     return agent
 
-def plot_learning_curve(win_rates):
-    """Visualize learning progress."""
+def plot_learning_curve(metrics_path, filename='qlearning_training_curve.png', show=False):
+    """
+    Visualize learning progress from a metrics file (offline step).
+
+    Plots the win rate of the X phase; pass show=True to also open a window.
+    """
+    import matplotlib.pyplot as plt
+
+    records = [r for r in read_metrics(metrics_path) if r['side'] == 'X' and 'win_rate' in r]
+    episodes = [r['episode'] for r in records]
+    win_rates = [r['win_rate'] for r in records]
+
     plt.figure(figsize=(10, 6))
-    episodes = [i * 1000 for i in range(1, len(win_rates) + 1)]
     plt.plot(episodes, win_rates, linewidth=2, color='blue', marker='o', markersize=4)
     plt.xlabel('Training Episodes', fontsize=12)
     plt.ylabel('Win Rate vs Random (%)', fontsize=12)
@@ -162,9 +214,95 @@ def plot_learning_curve(win_rates):
     plt.legend()
     
     plt.tight_layout()
-    plt.savefig('qlearning_training_curve.png', dpi=300)
-    print("\nLearning curve saved to: qlearning_training_curve.png")
-    plt.show()
+    plt.savefig(filename, dpi=300)
+    print(f"\nLearning curve saved to: {filename}")
+    if show:
+        plt.show()
+    plt.close()
 
 if __name__ == "__main__":
-    trained_agent = train_qlearning(num_episodes=50000)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Train the Q-Learning agent")
+    parser.add_argument("--episodes", type=int, default=50000,
+                        help="Episodes as X (half as many are played as O)")
+    parser.add_argument("--output", default="q_table.qtb",
+                        help="Where to save the Q-table")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="Run many games in lockstep on NumPy arrays")
+    parser.add_argument("--num-envs", type=int, default=4096,
+                        help="Games per batch in vectorized mode")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Train on this many processes (implies vectorized)")
+    parser.add_argument("--sync-every", type=int, default=20000,
+                        help="Episodes per worker between Q-table merges")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed (reruns with the same seed are identical)")
+    parser.add_argument("--checkpoint-dir", default=None,
+                        help="Directory for periodic checkpoints")
+    parser.add_argument("--checkpoint-every", type=int, default=5000,
+                        help="Episodes between checkpoints")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue from the checkpoint in --checkpoint-dir")
+    parser.add_argument("--metrics", default=None,
+                        help="Append per-window metrics to this JSONL file")
+    parser.add_argument("--replay-capacity", type=int, default=0,
+                        help="Enable experience replay with this many transitions")
+    parser.add_argument("--replay-ratio", type=float, default=1.0,
+                        help="Replayed transitions per new transition")
+    parser.add_argument("--replay-eviction", choices=("fifo", "random"), default="fifo",
+                        help="Which transition to drop when the buffer is full")
+    parser.add_argument("--td-lambda", type=float, default=None,
+                        help="Use Watkins Q(λ) eligibility traces with this decay")
+    parser.add_argument("--plot", metavar="METRICS", default=None,
+                        help="Only plot the learning curve from a metrics file")
+    parser.add_argument("--solve", choices=OPPONENTS, default=None,
+                        help="Compute the exact Q-table against this opponent instead of training")
+    parser.add_argument("--eval-every", type=int, default=None,
+                        help="Episodes between agreement checks against exact minimax values")
+    parser.add_argument("--target-agreement", type=float, default=None,
+                        help="Stop a phase once greedy agreement reaches this fraction")
+    parser.add_argument("--league", action="store_true",
+                        help="Train against an adaptive opponent pool until no position can be "
+                             "lost (or --episodes run out)")
+    args = parser.parse_args()
+
+    if args.plot:
+        plot_learning_curve(args.plot)
+    elif args.league:
+        league = LeagueTrainer(seed=args.seed)
+        league.train(max_episodes=args.episodes)
+        trained_agent = league.learner
+        trained_agent.save_q_table(args.output)
+    elif args.solve:
+        start = time.perf_counter()
+        trained_agent = QLearningAgent(player=1, epsilon=0)
+        trained_agent.q_table = solve_q_table(opponent=args.solve,
+                                              discount_factor=trained_agent.discount_factor)
+        print(f"Solved {len(trained_agent.q_table):,} states against {args.solve} "
+              f"in {time.perf_counter() - start:.2f}s")
+        trained_agent.save_q_table(args.output)
+    elif args.workers:
+        trained_agent = train_parallel(num_episodes=args.episodes,
+                                       workers=args.workers,
+                                       episodes_per_round=args.sync_every,
+                                       num_envs=args.num_envs,
+                                       seed=args.seed)
+        trained_agent.save_q_table(args.output)
+    elif args.vectorized:
+        trained_agent = train_vectorized(num_episodes=args.episodes,
+                                         num_envs=args.num_envs,
+                                         seed=args.seed)
+        trained_agent.save_q_table(args.output)
+    else:
+        trained_agent = train_qlearning(num_episodes=args.episodes,
+                                        save_filename=args.output,
+                                        checkpoint_dir=args.checkpoint_dir,
+                                        checkpoint_every=args.checkpoint_every,
+                                        resume=args.resume,
+                                        metrics_path=args.metrics,
+                                        replay_capacity=args.replay_capacity,
+                                        replay_ratio=args.replay_ratio,
+                                        replay_eviction=args.replay_eviction,
+                                        td_lambda=args.td_lambda,
+                                        eval_every=args.eval_every,
+                                        target_agreement=args.target_agreement,
+                                        seed=args.seed)
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Convergence benchmark: how many training episodes does a Q-Learning
+configuration need before its greedy policy reaches a target win rate
+against Random?
+
+Usage:
+    python -m training.benchmark --target 90 --seeds 3
+"""
+
+import argparse
+
+from game.board import TicTacToe
+from agents.qlearning_agent import QLearningAgent
+from agents.random_agent import RandomAgent
+from training.episodes import play_training_episode
+
+
+def evaluate_win_rate(agent, games=500):
+    """Greedy win rate (%) of the agent as X against Random."""
+    wins = 0
+    for _ in range(games):
+        game = TicTacToe()
+        opponent = RandomAgent(player=-1, rng=agent.rng)
+
+        while not game.is_game_over():
+            if game.current_player == 1:
+                move = agent.get_move(game)
+            else:
+                move = opponent.get_move(game)
+            game.make_move(move)
+
+        if game.check_winner() == 1:
+            wins += 1
+    return wins / games * 100
+
+
+def episodes_to_target(agent, target_win_rate=90.0, eval_every=500,
+                       eval_games=500, max_episodes=50000):
+    """
+    Train the agent as X until its greedy win rate reaches the target.
+
+    Returns:
+        int: Episodes used, or None if the target was not reached
+    """
+    agent.player = 1
+    for episode in range(1, max_episodes + 1):
+        play_training_episode(agent)
+        if episode % eval_every == 0 and evaluate_win_rate(agent, eval_games) >= target_win_rate:
+            return episode
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Q-Learning convergence benchmark")
+    parser.add_argument("--target", type=float, default=90.0,
+                        help="Target greedy win rate vs Random (%%)")
+    parser.add_argument("--lambdas", type=float, nargs="*", default=[0.5, 0.8],
+                        help="Trace decays to compare against one-step Q-Learning")
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--max-episodes", type=int, default=50000)
+    args = parser.parse_args()
+
+    configs = [("One-step", None)] + [(f"Q(λ={lam})", lam) for lam in args.lambdas]
+
+    print("=" * 60)
+    print(f"EPISODES TO REACH {args.target:.0f}% GREEDY WIN RATE VS RANDOM")
+    print("=" * 60)
+
+    for name, td_lambda in configs:
+        results = []
+        for seed in range(args.seeds):
+            agent = QLearningAgent(player=1, epsilon=0.1, td_lambda=td_lambda, rng=seed)
+            results.append(episodes_to_target(agent, args.target,
+                                              max_episodes=args.max_episodes))
+
+        reached = [r for r in results if r is not None]
+        summary = f"mean {sum(reached) / len(reached):8,.0f}" if reached else "never"
+        print(f"{name:<14} {summary} | per seed: {results}")
+
+
+if __name__ == "__main__":
+    main()
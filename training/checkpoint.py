@@ -0,0 +1,118 @@
+"""
+Checkpoints and streaming metrics for long training runs.
+
+A checkpoint is a single .npz file holding the Q-table as float64 arrays
+plus a JSON blob with the training position (phase, episode, epsilon,
+window counters) and RNG state. It is written to a temporary file and
+renamed into place, so a crash mid-write never corrupts the last good
+checkpoint. Loading never unpickles anything.
+
+Metrics are appended to a JSONL file, one line per reporting window,
+and flushed immediately so they can be tailed while training runs. A
+resumed run first truncates records written after its checkpoint, since
+it plays those episodes again.
+"""
+
+import json
+import os
+import random
+
+import numpy as np
+
+from training.vectorized import arrays_to_q_table, q_table_to_arrays
+
+CHECKPOINT_FILE = "checkpoint.npz"
+
+
+def save_checkpoint(directory, q_table, state):
+    """
+    Atomically write a checkpoint.
+
+    Args:
+        directory (str): Checkpoint directory (created if missing)
+        q_table (dict): QLearningAgent.q_table
+        state (dict): JSON-serializable training position
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, CHECKPOINT_FILE)
+    temp_path = path + ".tmp"
+
+    q_values, visits = q_table_to_arrays(q_table)
+    with open(temp_path, 'wb') as f:
+        np.savez(f, q_values=q_values, visits=visits.astype(bool),
+                 state=np.array(json.dumps(state)))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(directory):
+    """
+    Read the checkpoint in a directory.
+
+    Returns:
+        tuple: (q_table, state), or None if there is no checkpoint yet
+    """
+    path = os.path.join(directory, CHECKPOINT_FILE)
+    if not os.path.exists(path):
+        return None
+
+    with np.load(path, allow_pickle=False) as data:
+        q_table = arrays_to_q_table(data['q_values'], data['visits'])
+        state = json.loads(str(data['state']))
+    return q_table, state
+
+
+def get_rng_state(rng=random):
+    """JSON-friendly snapshot of a random.Random (or the random module)."""
+    version, internal, gauss_next = rng.getstate()
+    return [version, list(internal), gauss_next]
+
+
+def set_rng_state(state, rng=random):
+    """Restore a snapshot taken with get_rng_state."""
+    version, internal, gauss_next = state
+    rng.setstate((version, tuple(internal), gauss_next))
+
+
+class MetricsWriter:
+    """Append-only JSONL metrics stream."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = open(filename, 'a')
+
+    def write(self, record):
+        """Append one record and flush it to disk."""
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def read_metrics(filename):
+    """Load all records from a metrics file (skipping a torn last line)."""
+    records = []
+    with open(filename) as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return records
+
+
+def truncate_metrics(filename, keep):
+    """
+    Rewrite a metrics file with only the records keep(record) accepts
+    (and without a torn last line); a missing file is left missing.
+    """
+    if not os.path.exists(filename):
+        return
+    records = [record for record in read_metrics(filename) if keep(record)]
+    temp_path = filename + ".tmp"
+    with open(temp_path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    os.replace(temp_path, filename)
@@ -0,0 +1,81 @@
+"""
+Convergence tracking against exact values.
+
+Compares a learned q_table with the exact Q-table against a
+minimax-optimal opponent (training/solver.py) over every reachable
+learner-to-move position:
+
+- Greedy agreement: share of positions where every move the greedy
+  policy could pick (ties included) keeps the game-theoretic value
+- Mean absolute error between learned and exact Q-values
+
+Per-position results are cached, and only positions marked dirty (the
+ones a training game touched) are recomputed, so checking every few
+hundred episodes costs little.
+"""
+
+from training.solver import greedy_moves, optimal_moves, solve_q_table
+
+
+def _side(state):
+    """1 if the learner is X in this perspective state, -1 if O."""
+    return 1 if state.count(1) == state.count(-1) else -1
+
+
+class ConvergenceTracker:
+    """
+    Incrementally computed distance between a q_table and exact values.
+    """
+
+    def __init__(self, discount_factor=0.9, reference=None):
+        """
+        Args:
+            discount_factor (float): Must match the learner's
+            reference (dict): Exact q_table (default: solved vs minimax)
+        """
+        self.reference = reference or solve_q_table('minimax', discount_factor)
+        # Perspective states are real boards for X; flip them back for O
+        self.optimal = {
+            state: set(optimal_moves(tuple(cell * _side(state) for cell in state)))
+            for state in self.reference
+        }
+        self.sides = {state: _side(state) for state in self.reference}
+
+        self.agrees = {}
+        self.errors = {}
+        self.dirty = set(self.reference)
+
+    def mark_dirty(self, states):
+        """Flag positions whose Q-values may have changed."""
+        self.dirty.update(state for state in states if state in self.reference)
+
+    def mark_all_dirty(self):
+        """Recompute everything on the next update (e.g. after replay)."""
+        self.dirty = set(self.reference)
+
+    def update(self, q_table, side=None):
+        """
+        Refresh dirty positions and summarize.
+
+        Args:
+            q_table (dict): Learned QLearningAgent.q_table
+            side (int): Only report positions where the learner is this side
+
+        Returns:
+            dict: 'agreement' (fraction), 'mae' and 'positions'
+        """
+        for state in self.dirty:
+            exact = self.reference[state]
+            learned = q_table.get(state, {})
+            self.agrees[state] = set(greedy_moves(q_table, state)) <= self.optimal[state]
+            self.errors[state] = sum(abs(learned.get(move, 0) - value)
+                                     for move, value in exact.items())
+        self.dirty = set()
+
+        states = [s for s in self.reference if side is None or self.sides[s] == side]
+        actions = sum(len(self.reference[s]) for s in states)
+        return {
+            'agreement': sum(self.agrees[s] for s in states) / len(states),
+            'mae': sum(self.errors[s] for s in states) / actions,
+            'positions': len(states),
+        }
@@ -0,0 +1,39 @@
+"""
+The training game shared by train_qlearning.py and training/benchmark.py:
+one episode of a QLearningAgent against Random, learning from the result.
+"""
+
+from game.board import TicTacToe
+from agents.random_agent import RandomAgent
+
+
+def play_training_episode(agent, tracker=None):
+    """
+    Play one training game against a Random opponent and learn from it.
+
+    If a ConvergenceTracker is given, the positions this game touched are
+    marked for re-evaluation.
+
+    Returns:
+        int: +1 if the agent won, -1 if it lost, 0 for a draw
+    """
+    game = TicTacToe()
+    agent.reset_history()
+    random_opponent = RandomAgent(player=-agent.player, rng=agent.rng)
+
+    while not game.is_game_over():
+        if game.current_player == agent.player:
+            # Agent's turn
+            move = agent.get_move(game, training=True)
+        else:
+            # Random opponent's turn
+            move = random_opponent.get_move(game)
+
+        game.make_move(move)
+
+    # Determine outcome and learn
+    outcome = game.check_winner() * agent.player
+    if tracker:
+        tracker.mark_dirty(state for state, _ in agent.history)
+    agent.learn(reward=outcome)
+    return outcome
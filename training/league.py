@@ -0,0 +1,270 @@
+"""
+League training for QLearningAgent.
+
+Instead of only playing Random, the learner samples each episode's
+opponent from a pool:
+
+- Random, Heuristic and Minimax
+- Frozen snapshots of the learner itself, taken periodically
+- Self-play: the learner on both sides, learning from both
+
+Sampling weights follow each opponent's recent loss rate against the
+learner (an exponential moving average), so episodes go where the
+learner is still losing. Most episodes after a check start from one of
+the positions the greedy policy can still lose, against Minimax or a
+snapshot, which fixes those mistakes directly instead of waiting for
+random games to reach them. Training stops once no position remains where
+the greedy policy could lose (computed exactly by training/solver.py).
+An evaluation gauntlet against Random, Heuristic and Minimax (both
+sides) is reported along the way, but a sampled gauntlet without losses
+can still miss losing positions, so it doesn't decide when to stop.
+"""
+
+import copy
+
+from game.board import TicTacToe
+from game.rng import make_rng, spawn_seeds
+from agents.cached_policy import CachedPolicy
+from agents.heuristic_agent import HeuristicAgent
+from agents.minimax_agent import MinimaxAgent
+from agents.qlearning_agent import QLearningAgent
+from agents.random_agent import RandomAgent
+from training.solver import losing_positions
+
+
+class _NoisyAgent:
+    """Play a random legal move with probability epsilon, else defer to agent."""
+
+    def __init__(self, agent, epsilon, rng=None):
+        self.agent = agent
+        self.epsilon = epsilon
+        self.rng = make_rng(rng)
+
+    @property
+    def player(self):
+        return self.agent.player
+
+    @player.setter
+    def player(self, value):
+        self.agent.player = value
+
+    def get_move(self, game):
+        if self.rng.random() < self.epsilon:
+            return self.rng.choice(game.get_legal_moves())
+        return self.agent.get_move(game)
+
+
+class LeagueTrainer:
+    """
+    Trains one QLearningAgent against an adaptive pool of opponents.
+    """
+
+    SELF_PLAY = 'Self-play'
+
+    def __init__(self, learner=None, snapshot_every=2000, max_snapshots=3,
+                 min_weight=0.05, ema_decay=0.98, focus_share=0.7, seed=None):
+        """
+        Args:
+            learner (QLearningAgent): Agent to train (a fresh one by default)
+            snapshot_every (int): Episodes between frozen snapshots
+            max_snapshots (int): Oldest snapshots leave the pool beyond this
+            min_weight (float): Sampling floor so no opponent is forgotten
+            ema_decay (float): Smoothing of the per-opponent loss rate
+            focus_share (float): Share of episodes started from a position
+                the greedy policy can still lose, against Minimax or a
+                snapshot
+            seed (int): Seeds independent streams for opponent sampling, the
+                learner and the opponents (None uses the global random module)
+        """
+        streams = spawn_seeds(seed, 4) if seed is not None else [None] * 4
+        self.rng = make_rng(streams[0])
+        self.learner = learner or QLearningAgent(player=1, epsilon=0.3)
+        if seed is not None:
+            self.learner.reseed(streams[1])
+        self.snapshot_every = snapshot_every
+        self.max_snapshots = max_snapshots
+        self.min_weight = min_weight
+        self.ema_decay = ema_decay
+        self.focus_share = focus_share
+        self.focus = []  # Losing positions found at the last check
+
+        self.opponents = {
+            'Random': RandomAgent(player=-1, rng=streams[2]),
+            'Heuristic': HeuristicAgent(player=-1),
+            'Minimax': CachedPolicy(MinimaxAgent(player=-1)),
+            'Minimax-ε': _NoisyAgent(CachedPolicy(MinimaxAgent(player=-1)), 0.3, streams[3]),
+            self.SELF_PLAY: None,
+        }
+        self.loss_rates = {name: 1.0 for name in self.opponents}
+        self.games = {name: 0 for name in self.opponents}
+        self.snapshots = []
+
+    def weights(self):
+        """Current sampling weight per opponent."""
+        return {name: self.min_weight + self.loss_rates[name] for name in self.opponents}
+
+    def sample_opponent(self, names=None):
+        """Sample an opponent by weight (among names, if given)."""
+        weights = self.weights()
+        names = list(names or weights)
+        return self.rng.choices(names, weights=[weights[name] for name in names])[0]
+
+    def focus_opponents(self):
+        """Opponents for focused episodes: the ones that punish mistakes."""
+        return ['Minimax'] + self.snapshots
+
+    def take_snapshot(self, episode):
+        """Freeze the learner's current greedy policy into the pool."""
+        snapshot = QLearningAgent(player=-1, epsilon=0, rng=self.learner.rng)
+        snapshot.q_table = copy.deepcopy(self.learner.q_table)
+        name = f"Snapshot@{episode}"
+
+        self.snapshots.append(name)
+        self.opponents[name] = snapshot
+        # Start new snapshots at the pool's average instead of the maximum,
+        # so a fresh snapshot does not crowd out everything else
+        self.loss_rates[name] = sum(self.loss_rates.values()) / len(self.loss_rates)
+        self.games[name] = 0
+
+        if len(self.snapshots) > self.max_snapshots:
+            oldest = self.snapshots.pop(0)
+            del self.opponents[oldest]
+            del self.loss_rates[oldest]
+            del self.games[oldest]
+
+    def play_episode(self, opponent_name, start=None):
+        """
+        Play one training game; the learner takes a random side.
+
+        Args:
+            start (tuple): (board, learner's side) to play from instead of
+                the empty board, e.g. a losing position
+
+        Returns:
+            int: Learner's outcome (+1 win, -1 loss, 0 draw)
+        """
+        learner = self.learner
+        learner.player = self.rng.choice([1, -1]) if start is None else start[1]
+        learner.reset_history()
+
+        if opponent_name == self.SELF_PLAY:
+            # Second copy sharing the same Q-table, with its own history
+            opponent = QLearningAgent(player=-learner.player,
+                                      learning_rate=learner.learning_rate,
+                                      discount_factor=learner.discount_factor,
+                                      epsilon=learner.epsilon,
+                                      rng=learner.rng)
+            opponent.q_table = learner.q_table
+        else:
+            opponent = self.opponents[opponent_name]
+            opponent.player = -learner.player
+
+        game = TicTacToe()
+        if start is not None:
+            # Any interleaving of the marks reaches the position (without a
+            # win on the way, since the position has none)
+            board = start[0]
+            marks = [[cell for cell, mark in enumerate(board) if mark == player]
+                     for player in (1, -1)]
+            for x_move, o_move in zip(marks[0], marks[1] + [None]):
+                game.make_move(x_move)
+                if o_move is not None:
+                    game.make_move(o_move)
+        while not game.is_game_over():
+            if game.current_player == learner.player:
+                move = learner.get_move(game, training=True)
+            elif opponent_name == self.SELF_PLAY:
+                move = opponent.get_move(game, training=True)
+            else:
+                move = opponent.get_move(game)
+            game.make_move(move)
+
+        outcome = game.check_winner() * learner.player
+        learner.learn(reward=outcome)
+        if opponent_name == self.SELF_PLAY:
+            opponent.learn(reward=-outcome)
+        return outcome
+
+    def evaluate(self, random_games=200, other_games=10):
+        """
+        Play the greedy learner against the fixed opponents on both sides.
+
+        Returns:
+            dict: Losses per opponent name
+        """
+        greedy = QLearningAgent(player=1, epsilon=0, rng=self.learner.rng)
+        greedy.q_table = self.learner.q_table
+        budget = {'Random': random_games, 'Heuristic': other_games, 'Minimax': other_games}
+
+        losses = {}
+        for name, games in budget.items():
+            opponent = self.opponents[name]
+            losses[name] = 0
+            for i in range(games * 2):
+                greedy.player = 1 if i % 2 == 0 else -1
+                opponent.player = -greedy.player
+                game = TicTacToe()
+                while not game.is_game_over():
+                    if game.current_player == greedy.player:
+                        move = greedy.get_move(game)
+                    else:
+                        move = opponent.get_move(game)
+                    game.make_move(move)
+                if game.check_winner() == opponent.player:
+                    losses[name] += 1
+        return losses
+
+    def train(self, max_episodes=75000, eval_every=1000, epsilon_start=0.3,
+              epsilon_end=0.05, decay_episodes=10000):
+        """
+        Train until the greedy policy has no losing position left.
+
+        Epsilon decays linearly from epsilon_start to epsilon_end over the
+        first decay_episodes episodes, whatever the episode limit. After
+        each check, focus_share of the episodes start from one of the
+        losing positions it found.
+
+        Returns:
+            int: Episodes played
+        """
+        print("=" * 60)
+        print("LEAGUE TRAINING")
+        print("=" * 60)
+
+        epsilon_decay = (epsilon_start - epsilon_end) / decay_episodes
+        self.learner.epsilon = epsilon_start
+
+        for episode in range(1, max_episodes + 1):
+            if self.focus and self.rng.random() < self.focus_share:
+                board, player, _ = self.rng.choice(self.focus)
+                name = self.sample_opponent(self.focus_opponents())
+                outcome = self.play_episode(name, start=(board, player))
+            else:
+                name = self.sample_opponent()
+                outcome = self.play_episode(name)
+
+            lost = 1.0 if outcome == -1 else 0.0
+            self.loss_rates[name] = (self.ema_decay * self.loss_rates[name]
+                                     + (1 - self.ema_decay) * lost)
+            self.games[name] += 1
+            self.learner.epsilon = max(epsilon_end, self.learner.epsilon - epsilon_decay)
+
+            if episode % self.snapshot_every == 0:
+                self.take_snapshot(episode)
+
+            if episode % eval_every == 0:
+                losses = self.evaluate()
+                self.focus = losing_positions(self.learner.q_table)
+                mistakes = len(self.focus)
+                weights = self.weights()
+                total = sum(weights.values())
+                mix = ", ".join(f"{n} {w / total * 100:.0f}%" for n, w in weights.items())
+                print(f"Episode {episode:6,} | Eval losses: {sum(losses.values()):3d} | "
+                      f"Losing positions: {mistakes:4d} | Mix: {mix}")
+                if mistakes == 0:
+                    print(f"\nNo losing positions after {episode:,} episodes "
+                          f"({len(self.learner.q_table):,} states)")
+                    return episode
+
+        print(f"\nStopped at the {max_episodes:,} episode limit")
+        return max_episodes
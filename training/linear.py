@@ -0,0 +1,81 @@
+"""
+Train LinearQAgent against Random on any board size.
+
+Usage:
+    python -m training.linear --size 4 --win-length 4 --episodes 20000
+"""
+
+import argparse
+
+from game.board import TicTacToe
+from agents.linear_agent import LinearQAgent
+from agents.random_agent import RandomAgent
+
+
+def play_game(agent, opponent, size, win_length, training=False):
+    """Play one game; returns the agent's outcome (+1 win, -1 loss, 0 draw)."""
+    game = TicTacToe(size, win_length)
+    agent.reset_history()
+    opponent.player = -agent.player
+
+    while not game.is_game_over():
+        if game.current_player == agent.player:
+            move = agent.get_move(game, training=training)
+        else:
+            move = opponent.get_move(game)
+        game.make_move(move)
+
+    return game.check_winner() * agent.player
+
+
+def train_linear(num_episodes=20000, size=4, win_length=None, window_size=1000,
+                 seed=None):
+    """
+    Train as X and O alternately against Random.
+
+    Args:
+        seed (int): Seeds the agent and opponent streams (None: global random)
+
+    Returns:
+        LinearQAgent: The trained agent
+    """
+    win_length = win_length or size
+    agent = LinearQAgent(player=1, win_length=win_length, rng=seed)
+    opponent = RandomAgent(player=-1, rng=agent.rng)
+
+    print("=" * 50)
+    print(f"TRAINING LINEAR AGENT ON {size}x{size}, {win_length} IN A ROW")
+    print("=" * 50)
+
+    wins = losses = draws = 0
+    for episode in range(num_episodes):
+        agent.player = 1 if episode % 2 == 0 else -1
+        outcome = play_game(agent, opponent, size, win_length, training=True)
+        agent.learn(reward=outcome)
+
+        if outcome == 1:
+            wins += 1
+        elif outcome == -1:
+            losses += 1
+        else:
+            draws += 1
+
+        if (episode + 1) % window_size == 0:
+            print(f"Episode {episode + 1:6,} | W: {wins / window_size * 100:5.1f}% | "
+                  f"L: {losses / window_size * 100:5.1f}% | D: {draws / window_size * 100:5.1f}%")
+            wins = losses = draws = 0
+
+    return agent
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the linear function-approximation agent")
+    parser.add_argument("--size", type=int, default=4)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--episodes", type=int, default=20000)
+    parser.add_argument("--output", default="linear_agent.npz")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    trained = train_linear(args.episodes, args.size, args.win_length, seed=args.seed)
+    trained.save(args.output)
@@ -0,0 +1,208 @@
+"""
+Multi-process Q-Learning training.
+
+Each worker process plays vectorized episodes (see training/vectorized.py)
+against Random with its own seed stream and epsilon schedule. Training
+runs in synchronous rounds:
+
+1. Workers copy the shared Q-table and play their share of episodes
+2. Each worker sends back the Q-value deltas it produced, together with
+   how many updates each (state, action) pair received
+3. The coordinator merges the deltas, weighting each worker by its visit
+   counts, and writes the result into the shared table for the next round
+
+The table lives in a multiprocessing.RawArray, so broadcasting it costs
+nothing: workers read it directly.
+"""
+
+import multiprocessing
+import time
+
+import numpy as np
+
+from agents.qlearning_agent import QLearningAgent
+from game.encoding import NUM_STATES
+from training.vectorized import arrays_to_q_table, new_q_arrays, play_batch
+
+_shared_q = None
+
+
+def _init_worker(shared_buffer):
+    """Pool initializer: expose the shared Q-table as a NumPy view."""
+    global _shared_q
+    _shared_q = np.frombuffer(shared_buffer, dtype=np.float64).reshape(NUM_STATES, 9)
+
+
+def _worker_round(task):
+    """
+    Play one round of episodes on a private copy of the shared table.
+
+    Returns:
+        dict: Sparse deltas (keys, deltas, counts), W/L/D and timing
+    """
+    seed_sequence, episodes, num_envs, epsilon, agent_player, learning_rate, discount_factor = task
+    rng = np.random.default_rng(seed_sequence)
+
+    start = time.perf_counter()
+    q_values = _shared_q.copy()
+    _, visits = new_q_arrays()
+
+    wins = losses = draws = 0
+    played = 0
+    while played < episodes:
+        batch = min(num_envs, episodes - played)
+        w, l, d = play_batch(q_values, visits, rng, batch, epsilon,
+                             agent_player, learning_rate, discount_factor)
+        wins += w
+        losses += l
+        draws += d
+        played += batch
+
+    keys = np.flatnonzero(visits)
+    deltas = q_values.reshape(-1)[keys] - _shared_q.reshape(-1)[keys]
+
+    return {
+        'keys': keys,
+        'deltas': deltas,
+        'counts': visits.reshape(-1)[keys],
+        'wins': wins,
+        'losses': losses,
+        'draws': draws,
+        'episodes': played,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def merge_deltas(q_values, visits, worker_results):
+    """
+    Apply visit-weighted worker deltas to the coordinator's table.
+
+    A (state, action) pair that worker A updated 30 times and worker B
+    updated 10 times moves by (30 * delta_A + 10 * delta_B) / 40.
+    """
+    keys = np.concatenate([r['keys'] for r in worker_results])
+    deltas = np.concatenate([r['deltas'] for r in worker_results])
+    counts = np.concatenate([r['counts'] for r in worker_results])
+
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    weight_sums = np.bincount(inverse, weights=counts)
+    weighted = np.bincount(inverse, weights=deltas * counts) / weight_sums
+
+    q_values.reshape(-1)[unique_keys] += weighted
+    visits.reshape(-1)[unique_keys] += weight_sums.astype(np.int64)
+
+
+def split_episodes(episodes, parts):
+    """Split episodes into parts that differ by at most one (earlier parts larger)."""
+    share, extra = divmod(episodes, parts)
+    return [share + (part < extra) for part in range(parts)]
+
+
+def default_epsilon_schedules(workers, epsilon_start=0.3, epsilon_end=0.05):
+    """
+    Give each worker its own linear epsilon schedule.
+
+    Start values are staggered between epsilon_start and half of it, so
+    some workers keep exploring while others exploit sooner.
+    """
+    starts = np.linspace(epsilon_start, epsilon_start / 2, workers)
+    return [(float(start), min(epsilon_end, float(start))) for start in starts]
+
+
+def train_parallel(num_episodes=1_000_000, workers=None, episodes_per_round=20_000,
+                   num_envs=4096, learning_rate=0.1, discount_factor=0.9,
+                   epsilon_schedules=None, seed=None):
+    """
+    Train against Random on several processes with periodic Q-table merges.
+
+    Uses the train_qlearning schedule: num_episodes as X, then
+    num_episodes // 2 as O (where epsilon stays at each worker's end value).
+
+    Args:
+        workers (int): Worker processes (default: all cores)
+        episodes_per_round (int): Episodes each worker plays between merges
+        epsilon_schedules (list): Optional (start, end) pair per worker
+        seed (int): Root seed; each worker gets an independent child stream
+
+    Returns:
+        QLearningAgent: Agent whose q_table holds the merged values
+    """
+    workers = workers or multiprocessing.cpu_count()
+    epsilon_schedules = epsilon_schedules or default_epsilon_schedules(workers)
+    if len(epsilon_schedules) != workers:
+        raise ValueError("Need one epsilon schedule per worker")
+
+    worker_seeds = np.random.SeedSequence(seed).spawn(workers)
+
+    shared_buffer = multiprocessing.RawArray('d', NUM_STATES * 9)
+    q_values = np.frombuffer(shared_buffer, dtype=np.float64).reshape(NUM_STATES, 9)
+    _, visits = new_q_arrays()
+
+    print("=" * 50)
+    print(f"PARALLEL Q-LEARNING TRAINING ({workers} WORKERS)")
+    print("=" * 50)
+
+    worker_episodes = np.zeros(workers, dtype=np.int64)
+    worker_seconds = np.zeros(workers)
+    start_time = time.perf_counter()
+
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(shared_buffer,)) as pool:
+        for agent_player, phase_episodes in ((1, num_episodes), (-1, num_episodes // 2)):
+            round_episodes = episodes_per_round * workers
+            num_rounds = max(1, -(-phase_episodes // round_episodes))
+
+            for round_index, episodes in enumerate(split_episodes(phase_episodes, num_rounds)):
+                progress = round_index / num_rounds
+                tasks = []
+                for worker, share in enumerate(split_episodes(episodes, workers)):
+                    eps_start, eps_end = epsilon_schedules[worker]
+                    if agent_player == 1:
+                        epsilon = eps_start + (eps_end - eps_start) * progress
+                    else:
+                        epsilon = eps_end
+                    tasks.append((worker_seeds[worker].spawn(1)[0], share, num_envs,
+                                  epsilon, agent_player, learning_rate, discount_factor))
+
+                results = pool.map(_worker_round, tasks)
+                merge_deltas(q_values, visits, results)
+
+                for worker, result in enumerate(results):
+                    worker_episodes[worker] += result['episodes']
+                    worker_seconds[worker] += result['seconds']
+
+                wins = sum(r['wins'] for r in results)
+                losses = sum(r['losses'] for r in results)
+                draws = sum(r['draws'] for r in results)
+                total = max(wins + losses + draws, 1)
+                print(f"{'X' if agent_player == 1 else 'O'} round {round_index + 1:3d}/{num_rounds} | "
+                      f"W: {wins / total * 100:5.1f}% | L: {losses / total * 100:5.1f}% | "
+                      f"D: {draws / total * 100:5.1f}% | "
+                      f"States: {int(visits.any(axis=1).sum()):,}")
+
+    elapsed = time.perf_counter() - start_time
+    report_throughput(worker_episodes, worker_seconds, elapsed)
+
+    agent = QLearningAgent(player=1, learning_rate=learning_rate,
+                           discount_factor=discount_factor, epsilon=0)
+    agent.q_table = arrays_to_q_table(q_values, visits)
+    return agent
+
+
+def report_throughput(worker_episodes, worker_seconds, elapsed):
+    """
+    Print episodes/second per worker and overall scaling efficiency.
+
+    Efficiency compares the aggregate wall-clock rate with N workers each
+    running at their measured solo rate; the gap is time lost to merging,
+    broadcasting and waiting for the slowest worker.
+    """
+    rates = worker_episodes / np.maximum(worker_seconds, 1e-9)
+    aggregate = worker_episodes.sum() / elapsed
+
+    print("\n" + "=" * 50)
+    for worker, rate in enumerate(rates):
+        print(f"Worker {worker}: {rate:12,.0f} episodes/s")
+    print(f"Aggregate: {aggregate:12,.0f} episodes/s over {elapsed:.1f}s")
+    print(f"Scaling efficiency: {aggregate / max(rates.sum(), 1e-9) * 100:.1f}%")
+    print("=" * 50)
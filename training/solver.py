@@ -0,0 +1,202 @@
+"""
+Exact Q-tables by retrograde analysis.
+
+The 3x3 state space is small enough to solve completely. Instead of
+sampling episodes, we compute for every reachable position where the
+learner is to move:
+
+    Q(s, a) = reward                             if a ends the game
+            = sum over opponent replies m of
+                  P(m) * (reward                 if m ends the game
+                          discount * max Q(s'))  otherwise
+
+where P(m) comes from an opponent model (random, minimax-optimal or
+heuristic). Rewards follow QLearningAgent.learn: +1 win, -1 loss, 0 draw.
+The result is written in QLearningAgent.q_table format, so it can be
+saved and played like any trained table.
+"""
+
+from functools import lru_cache
+
+from agents.heuristic_agent import HeuristicAgent
+from game.board import TicTacToe
+
+OPPONENTS = ('random', 'minimax', 'heuristic')
+
+
+def _game(board):
+    """Build a TicTacToe for a board tuple (side to move from piece counts)."""
+    game = TicTacToe()
+    game.board = list(board)
+    game.current_player = 1 if board.count(1) == board.count(-1) else -1
+    return game
+
+
+def _play(board, move, player):
+    """Return a new board tuple with player's mark at move."""
+    return board[:move] + (player,) + board[move + 1:]
+
+
+@lru_cache(maxsize=None)
+def game_value(board):
+    """
+    Game-theoretic value of a position for the side to move.
+
+    Returns:
+        int: 1 if the side to move wins with perfect play, 0 draw, -1 loss
+    """
+    game = _game(board)
+    winner = game.check_winner()
+    if winner != 0:
+        return winner * game.current_player
+    if game.is_game_over():
+        return 0
+    return max(-game_value(_play(board, move, game.current_player))
+               for move in game.get_legal_moves())
+
+
+def optimal_moves(board):
+    """All moves that keep the game-theoretic value for the side to move."""
+    game = _game(board)
+    values = {move: -game_value(_play(board, move, game.current_player))
+              for move in game.get_legal_moves()}
+    best = max(values.values())
+    return [move for move, value in values.items() if value == best]
+
+
+def opponent_policy(name):
+    """
+    Build an opponent model.
+
+    Returns:
+        function: board tuple -> list of (move, probability)
+    """
+    if name == 'random':
+        def policy(board):
+            moves = _game(board).get_legal_moves()
+            return [(move, 1 / len(moves)) for move in moves]
+    elif name == 'minimax':
+        def policy(board):
+            moves = optimal_moves(board)
+            return [(move, 1 / len(moves)) for move in moves]
+    elif name == 'heuristic':
+        def policy(board):
+            game = _game(board)
+            return [(HeuristicAgent(player=game.current_player).get_move(game), 1.0)]
+    else:
+        raise ValueError(f"Unknown opponent model '{name}', expected one of {OPPONENTS}")
+    return policy
+
+
+def solve_q_table(opponent='random', discount_factor=0.9):
+    """
+    Compute the exact Q-table against an opponent model.
+
+    Covers every position reachable by legal play where the learner is to
+    move, for the learner as X and as O, keyed from the learner's
+    perspective (own pieces +1) like QLearningAgent.transform_state.
+
+    Returns:
+        dict: q_table in QLearningAgent format
+    """
+    policy = opponent_policy(opponent)
+    q_table = {}
+
+    for agent_player in (1, -1):
+        values = {}
+
+        def state_value(board):
+            """max_a Q(board, a), filling q_table on the way."""
+            if board in values:
+                return values[board]
+
+            action_values = {}
+            for move in _game(board).get_legal_moves():
+                after_agent = _play(board, move, agent_player)
+                game = _game(after_agent)
+                if game.is_game_over():
+                    action_values[move] = game.check_winner() * agent_player
+                    continue
+
+                expected = 0.0
+                for reply, probability in policy(after_agent):
+                    after_reply = _play(after_agent, reply, -agent_player)
+                    game = _game(after_reply)
+                    if game.is_game_over():
+                        outcome = game.check_winner() * agent_player
+                    else:
+                        outcome = discount_factor * state_value(after_reply)
+                    expected += probability * outcome
+                action_values[move] = expected
+
+            perspective = tuple(cell * agent_player for cell in board)
+            q_table[perspective] = action_values
+            values[board] = max(action_values.values())
+            return values[board]
+
+        # Every position reachable by legal play where the learner moves
+        start = (0,) * 9
+        frontier = [start]
+        seen = {start}
+        while frontier:
+            board = frontier.pop()
+            game = _game(board)
+            if game.is_game_over():
+                continue
+            if game.current_player == agent_player:
+                state_value(board)
+            for move in game.get_legal_moves():
+                child = _play(board, move, game.current_player)
+                if child not in seen:
+                    seen.add(child)
+                    frontier.append(child)
+
+    return q_table
+
+
+def greedy_moves(q_table, state):
+    """All moves a greedy QLearningAgent could pick (ties included)."""
+    legal = [move for move in range(9) if state[move] == 0]
+    row = q_table.get(state, {})
+    best = max(row.get(move, 0) for move in legal)
+    return [move for move in legal if row.get(move, 0) == best]
+
+
+def losing_positions(q_table):
+    """
+    Find positions where a greedy Q-table policy can lose the game.
+
+    Explores every game the policy can reach (opponent playing any legal
+    move, the policy playing any of its tied greedy moves) as X and as O,
+    and collects positions that are not lost yet where a greedy move
+    turns them into a forced loss. An empty result means the policy
+    never loses.
+
+    Returns:
+        list: (board, agent_player, move) for each mistake found
+    """
+    mistakes = []
+    for agent_player in (1, -1):
+        frontier = [(0,) * 9]
+        seen = set(frontier)
+        while frontier:
+            board = frontier.pop()
+            game = _game(board)
+            if game.is_game_over():
+                continue
+
+            if game.current_player == agent_player:
+                state = tuple(cell * agent_player for cell in board)
+                moves = greedy_moves(q_table, state)
+                for move in moves:
+                    if game_value(board) >= 0 and game_value(_play(board, move, agent_player)) > 0:
+                        mistakes.append((board, agent_player, move))
+            else:
+                moves = game.get_legal_moves()
+
+            for move in moves:
+                child = _play(board, move, game.current_player)
+                if child not in seen:
+                    seen.add(child)
+                    frontier.append(child)
+    return mistakes
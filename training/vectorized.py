@@ -0,0 +1,235 @@
+"""
+Vectorized Q-Learning trainer.
+
+Instead of playing one game at a time through QLearningAgent and
+RandomAgent objects, thousands of games run in lockstep on NumPy arrays:
+
+- The Q-table is a dense (NUM_STATES, 9) array indexed by state ID
+  (see game/encoding.py)
+- Epsilon-greedy moves and random opponent moves are chosen for the
+  whole batch at once
+- TD updates are applied as scatter operations, one per history step
+
+The learned table converts back to the usual QLearningAgent.q_table
+dict, so everything downstream (saving, tournaments) works unchanged.
+"""
+
+import time
+
+import numpy as np
+
+from agents.qlearning_agent import QLearningAgent
+from game.batch import (check_winners, greedy_moves, new_boards,
+                        random_legal_moves)
+from game.encoding import NUM_STATES, decode_state, encode_boards, encode_board
+
+MAX_AGENT_MOVES = 5  # X moves at most 5 times in a 9-cell game
+
+
+def new_q_arrays():
+    """
+    Create an empty array-backed Q-table.
+
+    Returns:
+        tuple: (q_values, visits) - float64 values and int64 update
+               counts, both shaped (NUM_STATES, 9)
+    """
+    q_values = np.zeros((NUM_STATES, 9), dtype=np.float64)
+    visits = np.zeros((NUM_STATES, 9), dtype=np.int64)
+    return q_values, visits
+
+
+def q_table_to_arrays(q_table):
+    """Convert a QLearningAgent.q_table dict to (q_values, visits) arrays."""
+    q_values, visits = new_q_arrays()
+    for state, actions in q_table.items():
+        state_id = encode_board(state)
+        for action, value in actions.items():
+            q_values[state_id, action] = value
+            visits[state_id, action] = 1
+    return q_values, visits
+
+
+def arrays_to_q_table(q_values, visits):
+    """
+    Convert (q_values, visits) arrays to a QLearningAgent.q_table dict.
+
+    Only (state, action) pairs that were actually updated are included,
+    matching what QLearningAgent.learn would have created.
+    """
+    q_table = {}
+    for state_id in np.flatnonzero(visits.any(axis=1)):
+        actions = np.flatnonzero(visits[state_id])
+        q_table[decode_state(state_id)] = {
+            int(action): float(q_values[state_id, action]) for action in actions
+        }
+    return q_table
+
+
+def play_batch(q_values, visits, rng, num_envs, epsilon, agent_player=1,
+               learning_rate=0.1, discount_factor=0.9):
+    """
+    Play num_envs games against a random opponent and learn from them.
+
+    Args:
+        q_values (np.ndarray): (NUM_STATES, 9) Q-values, updated in place
+        visits (np.ndarray): (NUM_STATES, 9) update counts, updated in place
+        rng (np.random.Generator): Source of all randomness
+        num_envs (int): Number of games played in lockstep
+        epsilon (float): Exploration rate for this batch
+        agent_player (int): 1 if the learner plays X, -1 if O
+
+    Returns:
+        tuple: (wins, losses, draws) from the learner's point of view
+    """
+    boards = new_boards(num_envs)
+    winners = np.zeros(num_envs, dtype=np.int8)
+    done = np.zeros(num_envs, dtype=bool)
+
+    # Per-game history of the learner's (state, action) pairs
+    history_states = np.zeros((num_envs, MAX_AGENT_MOVES), dtype=np.int64)
+    history_actions = np.zeros((num_envs, MAX_AGENT_MOVES), dtype=np.int64)
+    history_length = np.zeros(num_envs, dtype=np.int64)
+
+    for ply in range(9):
+        active = np.flatnonzero(~done)
+        if len(active) == 0:
+            break
+
+        mover = 1 if ply % 2 == 0 else -1
+        current = boards[active]
+
+        if mover == agent_player:
+            # Learner sees its own pieces as +1 (same as transform_state)
+            states = encode_boards(current * agent_player)
+            greedy = greedy_moves(q_values[states], current == 0, rng)
+            explore = rng.random(len(active)) < epsilon
+            moves = np.where(explore, random_legal_moves(current, rng), greedy)
+
+            steps = history_length[active]
+            history_states[active, steps] = states
+            history_actions[active, steps] = moves
+            history_length[active] += 1
+        else:
+            moves = random_legal_moves(current, rng)
+
+        boards[active, moves] = mover
+
+        after = boards[active]
+        active_winners = check_winners(after)
+        winners[active] = active_winners
+        done[active] = (active_winners != 0) | (after != 0).all(axis=1)
+
+    rewards = (winners * agent_player).astype(np.float64)
+    _learn_batch(q_values, visits, history_states, history_actions,
+                 history_length, rewards, learning_rate, discount_factor)
+
+    wins = int((rewards > 0).sum())
+    losses = int((rewards < 0).sum())
+    return wins, losses, num_envs - wins - losses
+
+
+def _learn_batch(q_values, visits, history_states, history_actions,
+                 history_length, rewards, learning_rate, discount_factor):
+    """
+    Batched version of QLearningAgent.learn.
+
+    Works backwards through history steps like the scalar version. Within
+    one step, several games can update the same (state, action) pair;
+    those k updates are merged into a single move towards their mean
+    target with rate 1 - (1 - learning_rate)^k, which is what k
+    sequential updates towards that target would do.
+    """
+    flat_q = q_values.reshape(-1)
+    flat_visits = visits.reshape(-1)
+
+    for step in range(MAX_AGENT_MOVES - 1, -1, -1):
+        games = np.flatnonzero(history_length > step)
+        if len(games) == 0:
+            continue
+
+        keys = history_states[games, step] * 9 + history_actions[games, step]
+        is_last = history_length[games] == step + 1
+
+        targets = rewards[games].copy()
+        if step + 1 < MAX_AGENT_MOVES:
+            following = games[~is_last]
+            next_keys = (history_states[following, step + 1] * 9
+                         + history_actions[following, step + 1])
+            targets[~is_last] = discount_factor * flat_q[next_keys]
+
+        unique_keys, inverse, counts = np.unique(
+            keys, return_inverse=True, return_counts=True
+        )
+        mean_targets = np.bincount(inverse, weights=targets) / counts
+        rates = 1.0 - (1.0 - learning_rate) ** counts
+
+        current = flat_q[unique_keys]
+        flat_q[unique_keys] = current + rates * (mean_targets - current)
+        flat_visits[unique_keys] += counts
+
+
+def train_vectorized(num_episodes=1_000_000, num_envs=4096, learning_rate=0.1,
+                     discount_factor=0.9, epsilon_start=0.3, epsilon_end=0.05,
+                     seed=None, report_every=100_000):
+    """
+    Train a Q-Learning agent against Random with batched environments.
+
+    Follows the same schedule as train_qlearning: num_episodes as X with
+    linear epsilon decay, then num_episodes // 2 as O.
+
+    Returns:
+        QLearningAgent: Agent whose q_table holds the learned values
+    """
+    rng = np.random.default_rng(seed)
+    q_values, visits = new_q_arrays()
+
+    print("=" * 50)
+    print("VECTORIZED Q-LEARNING TRAINING VS RANDOM")
+    print("=" * 50)
+    print(f"\n{num_episodes:,} episodes as X + {num_episodes // 2:,} as O, "
+          f"{num_envs:,} games per batch\n")
+
+    phases = [
+        (1, num_episodes, epsilon_start),
+        (-1, num_episodes // 2, epsilon_end),
+    ]
+
+    start_time = time.perf_counter()
+    epsilon = epsilon_start
+
+    for agent_player, phase_episodes, phase_epsilon in phases:
+        epsilon = phase_epsilon
+        decay = (epsilon_start - epsilon_end) if agent_player == 1 else 0.0
+        played = 0
+        wins = losses = draws = 0
+        next_report = report_every
+
+        while played < phase_episodes:
+            batch = min(num_envs, phase_episodes - played)
+            w, l, d = play_batch(q_values, visits, rng, batch, epsilon,
+                                 agent_player, learning_rate, discount_factor)
+            wins += w
+            losses += l
+            draws += d
+            played += batch
+            epsilon = max(epsilon_end, epsilon - decay * batch / phase_episodes)
+
+            if played >= next_report or played == phase_episodes:
+                total = wins + losses + draws
+                print(f"{'X' if agent_player == 1 else 'O'} episode {played:9,} | "
+                      f"W: {wins / total * 100:5.1f}% | L: {losses / total * 100:5.1f}% | "
+                      f"D: {draws / total * 100:5.1f}% | ε: {epsilon:.3f} | "
+                      f"States: {int(visits.any(axis=1).sum()):,}")
+                wins = losses = draws = 0
+                next_report += report_every
+
+    elapsed = time.perf_counter() - start_time
+    total_episodes = num_episodes + num_episodes // 2
+    print(f"\nPlayed {total_episodes:,} episodes in {elapsed:.1f}s "
+          f"({total_episodes / elapsed * 60:,.0f} episodes/minute)")
+
+    agent = QLearningAgent(player=1, learning_rate=learning_rate,
+                           discount_factor=discount_factor, epsilon=epsilon)
+    agent.q_table = arrays_to_q_table(q_values, visits)
+    return agent